@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+path_store_bench.py - Memory and build time of context_mapper's path trie
+
+Compares the PathStore that context_mapper.py builds its trees from
+(skills/repo-context-sync/scripts/path_store.py) with the structures it used
+before: a {path: size} dict plus a dict per tree node for --budget, and a
+path list plus nested dicts for --git-tree. Paths are generated on the fly
+from a fixed seed, as if streamed from git, so every structure pays for the
+strings it keeps.
+
+Usage:
+    python3 benchmarks/path_store_bench.py [--sizes 100000,1000000] [--repeat <n>]
+        [--output <file>]
+
+Examples:
+    python3 benchmarks/path_store_bench.py --sizes 100000
+    python3 benchmarks/path_store_bench.py --sizes 100000,1000000 --repeat 1
+
+For each size it reports the build time (median of --repeat untraced runs,
+path generation excluded) and the memory retained by the structure and the
+peak while building (tracemalloc). For the store it also times a 2,000-token
+budgeted render and 1,000 path lookups. Results are written to
+benchmarks/results/path-store-<timestamp>.json unless --output is given.
+"""
+
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from skill_scripts_bench import FIXTURE_SEED, RESULTS_DIR, VOCABULARY, environment_info, load_script
+
+DEFAULT_SIZES = [100000, 1000000]
+DEFAULT_REPEAT = 3
+FILES_PER_DIR = 20
+TOP_LEVEL = ['packages', 'services', 'libs', 'apps']
+SUBDIRS = ['src', 'src/components', 'src/lib', 'src/api', 'src/utils', 'test', 'docs', 'scripts']
+EXTENSIONS = ['.ts', '.tsx', '.js', '.py', '.go', '.md', '.json', '.rs']
+RENDER_BUDGET = 2000
+LOOKUPS = 1000
+
+
+def synthetic_paths(count, seed=FIXTURE_SEED):
+    """Yield count (path, size) pairs shaped like a monorepo: packages of 8 dirs of 20 files."""
+    rng = random.Random(seed)
+    words = len(VOCABULARY)
+    for i in range(count):
+        directory, index = divmod(i, FILES_PER_DIR)
+        package, sub = divmod(directory, len(SUBDIRS))
+        top, rest = package % len(TOP_LEVEL), package // len(TOP_LEVEL)
+        name = f"{VOCABULARY[(i * 31) % words]}_{index}{EXTENSIONS[rng.randrange(len(EXTENSIONS))]}"
+        path = f"{TOP_LEVEL[top]}/{VOCABULARY[rest % words]}-{rest // words}/{SUBDIRS[sub]}/{name}"
+        yield path, rng.randint(200, 40000)
+
+
+def legacy_extension(name):
+    return name[name.rfind('.'):] if '.' in name[1:] else '(none)'
+
+
+def legacy_sized_tree(entries):
+    """The --budget structures before PathStore: a {path: size} dict and a dict per tree node."""
+    file_sizes = dict(entries)
+
+    def new_dir(name):
+        return {'name': name, 'children': {}, 'files': 0, 'bytes': 0, 'exts': Counter(), 'score': 0}
+
+    root = new_dir('')
+    for path, size in file_sizes.items():
+        parts = path.split('/')
+        chain = [root]
+        node = root
+        for part in parts[:-1]:
+            child = node['children'].get(part)
+            if child is None or child['children'] is None:
+                child = node['children'][part] = new_dir(part)
+            node = child
+            chain.append(node)
+        name = parts[-1]
+        ext = legacy_extension(name)
+        node['children'][name] = {'name': name, 'children': None, 'bytes': size, 'score': 0}
+        for directory in chain:
+            directory['files'] += 1
+            directory['bytes'] += size
+            directory['exts'][ext] += 1
+    return file_sizes, root
+
+
+def legacy_path_tree(entries):
+    """The --git-tree structures before PathStore: a path list and nested dicts."""
+    paths = [path for path, _ in entries]
+    tree = {}
+    for path in paths:
+        node = tree
+        parts = path.split('/')
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is None:
+                child = node[part] = {}
+            node = child
+        node.setdefault(parts[-1], None)
+    return paths, tree
+
+
+def time_build(build, count, repeat):
+    """Median seconds to build from count generated paths, minus the generation time."""
+    generate = []
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in synthetic_paths(count):
+            pass
+        generate.append(time.perf_counter() - started)
+        gc.collect()
+        started = time.perf_counter()
+        result = build(synthetic_paths(count))
+        runs.append(time.perf_counter() - started)
+        del result
+        gc.collect()
+    return max(statistics.median(runs) - statistics.median(generate), 0.0)
+
+
+def measure_memory(build, count):
+    """Return (retained MB, peak MB) of a build, traced with tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(synthetic_paths(count))
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return retained / (1024 * 1024), peak / (1024 * 1024)
+
+
+def bench_size(count, repeat, path_store, context_mapper):
+    """Benchmark every structure for one path count; returns result dicts."""
+    builds = {
+        'legacy-sized-tree': legacy_sized_tree,
+        'legacy-path-tree': legacy_path_tree,
+        'path-store': path_store.build_path_store,
+    }
+    results = []
+    for name, build in builds.items():
+        seconds = time_build(build, count, repeat)
+        retained, peak = measure_memory(build, count)
+        result = {
+            'structure': name,
+            'paths': count,
+            'build_seconds': round(seconds, 4),
+            'retained_mb': round(retained, 1),
+            'peak_mb': round(peak, 1),
+        }
+        results.append(result)
+        print(f"  {name:<18} paths={count:<8,} build {seconds:>7.2f} s  "
+              f"retained {retained:>8.1f} MB  peak {peak:>8.1f} MB")
+
+    store = path_store.build_path_store(synthetic_paths(count))
+    rng = random.Random(FIXTURE_SEED)
+    sample = set(rng.sample(range(count), min(LOOKUPS, count)))
+    wanted = [path for i, (path, _) in enumerate(synthetic_paths(max(sample) + 1)) if i in sample]
+    started = time.perf_counter()
+    scores = context_mapper.relevance_scores(store, wanted, {})
+    lookup_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    context_mapper.render_budgeted_tree('repo', store, RENDER_BUDGET, scores)
+    render_seconds = time.perf_counter() - started
+    results[-1]['lookup_ms'] = round(lookup_seconds * 1000, 2)
+    results[-1]['render_ms'] = round(render_seconds * 1000, 2)
+    print(f"  {'':<18} {len(wanted)} lookups {lookup_seconds * 1000:.1f} ms, "
+          f"{RENDER_BUDGET}-token render {render_seconds * 1000:.1f} ms")
+    return results
+
+
+def main():
+    args = sys.argv[1:]
+    sizes = DEFAULT_SIZES
+    repeat = DEFAULT_REPEAT
+    output = None
+    while args:
+        arg = args.pop(0)
+        if arg == '--sizes' and args:
+            sizes = [int(size) for size in args.pop(0).split(',')]
+        elif arg == '--repeat' and args:
+            repeat = max(1, int(args.pop(0)))
+        elif arg == '--output' and args:
+            output = Path(args.pop(0))
+        else:
+            print("Usage: path_store_bench.py [--sizes 100000,1000000] [--repeat <n>] [--output <file>]")
+            sys.exit(1)
+
+    path_store = load_script("repo-context-sync/scripts/path_store.py")
+    context_mapper = load_script("repo-context-sync/scripts/context_mapper.py")
+    print(f"🌲 Path store benchmark (repeat={repeat}, sizes: {', '.join(f'{s:,}' for s in sizes)})\n")
+
+    started = time.perf_counter()
+    results = []
+    for count in sizes:
+        results.extend(bench_size(count, repeat, path_store, context_mapper))
+
+    report = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'repeat': repeat,
+        'environment': environment_info(),
+        'elapsed_seconds': round(time.perf_counter() - started, 2),
+        'results': results,
+    }
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"path-store-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\n✅ Results saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+seed_relevance_eval.py - Relevance and latency evaluation for suggest_seeds
+
+Builds a labeled query -> expected-seeds dataset, runs every query through
+suggest_seeds(), and reports precision@k, hit rate@k, MRR and p50/p99
+latency per catalog, so changes to calculate_relevance()/suggest_seeds()
+can be judged on quality as well as speed.
+
+Usage:
+    python3 benchmarks/seed_relevance_eval.py [--sizes real,100,1000,10000] [--k <n>]
+        [--repeat <n>] [--max-queries <n>] [--output <file>] [--compare <baseline.json>]
+        [--dump-dataset <file>] [--workdir <dir>] [--keep]
+
+Examples:
+    python3 benchmarks/seed_relevance_eval.py --sizes real
+    python3 benchmarks/seed_relevance_eval.py --compare benchmarks/results/seed-eval-before.json
+
+Catalogs:
+    real     the seed files in skills/seed-library/seeds/ with the trigger table
+             in suggest_seeds.py. Queries are word windows from each seed's
+             "Revisit Trigger" section, expected to return that seed.
+    <n>      a synthetic catalog of n seeds. Each seed has one coined term of its
+             own plus common vocabulary words; queries pair the coined term with
+             its vocabulary words, expected to return that seed.
+
+Each catalog also gets a paraphrase set: the same queries with words swapped
+for synonyms (PARAPHRASES), reported separately. Results are written to
+benchmarks/results/seed-eval-<timestamp>.json unless --output is given.
+"""
+
+import json
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from skill_scripts_bench import (
+    FIXTURE_SEED, RESULTS_DIR, VOCABULARY, environment_info, load_script,
+)
+
+DEFAULT_SIZES = ['real', '100', '1000', '10000']
+DEFAULT_K = 3
+RANK_DEPTH = 10
+DEFAULT_REPEAT = 3
+DEFAULT_MAX_QUERIES = 200
+
+STOPWORDS = {
+    'when', 'with', 'from', 'into', 'that', 'this', 'than', 'then', 'there', 'their',
+    'about', 'after', 'before', 'through', 'where', 'which', 'while', 'without',
+    'feels', 'like', 'lacking', 'approaches', 'exceed', 'adding', 'building', 'new',
+}
+
+# Synonyms a user might type instead of the trigger vocabulary
+PARAPHRASES = {
+    'agent': 'assistant', 'agents': 'assistants', 'multi-agent': 'multiple-agents',
+    'routing': 'dispatch', 'coordination': 'orchestrating', 'coordinating': 'orchestrating',
+    'governance': 'oversight', 'debugging': 'troubleshooting', 'performance': 'speed',
+    'evaluating': 'assessing', 'trust': 'confidence', 'transparency': 'visibility',
+    'token': 'tokens', 'costs': 'spend', 'cost': 'spend', 'budget': 'allowance',
+    'context': 'prompt', 'window': 'capacity', 'limit': 'ceiling', 'memory': 'recall',
+    'workflows': 'pipelines', 'workflow': 'pipeline', 'export': 'download',
+    'sharing': 'publishing', 'planning': 'roadmapping', 'validation': 'verification',
+    'fallback': 'backup', 'failure': 'outage', 'duplication': 'redundancy',
+    'infrastructure': 'platform', 'complexity': 'difficulty', 'capabilities': 'features',
+    'trace': 'span', 'handoff': 'transfer', 'session': 'conversation',
+    'artifact': 'output', 'bundle': 'package', 'cache': 'memoize', 'state': 'status',
+    'schema': 'structure', 'pipeline': 'workflow', 'supervisor': 'manager',
+}
+
+SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'sa', 'tor', 'vi', 'zen', 'qu', 'pha', 'dro', 'ly']
+
+
+# ---------------------------------------------------------------------------
+# Datasets
+# ---------------------------------------------------------------------------
+
+def content_words(text):
+    """Lowercase words of four or more letters that are not stopwords."""
+    words = re.findall(r"[a-z][a-z-]+", text.lower())
+    return [w for w in words if len(w) >= 4 and w not in STOPWORDS]
+
+
+def trigger_section(text):
+    """Return the body of a seed's "Revisit Trigger" section ('' if missing)."""
+    match = re.search(r"^## Revisit Trigger\s*\n(.*?)(?=^## |\Z)", text, re.M | re.S)
+    return match.group(1).strip() if match else ''
+
+
+def paraphrase(words):
+    """Swap words for synonyms; None if no word has one."""
+    swapped = [PARAPHRASES.get(w, w) for w in words]
+    return swapped if swapped != list(words) else None
+
+
+def with_paraphrases(queries):
+    """Add a paraphrased copy of each query that has at least one synonym."""
+    extra = []
+    for query in queries:
+        words = paraphrase(query['query'])
+        if words:
+            extra.append({**query, 'query': words, 'source': 'paraphrase'})
+    return queries + extra
+
+
+def real_dataset(seeds_dir, window=2, per_seed=3):
+    """Queries from word windows of each seed's Revisit Trigger section."""
+    queries = []
+    for seed_file in sorted(seeds_dir.glob("*.md")):
+        words = content_words(trigger_section(seed_file.read_text()))
+        starts = range(0, max(1, len(words) - window + 1), max(1, window))
+        for start in list(starts)[:per_seed]:
+            query = words[start:start + window]
+            if query:
+                queries.append({'query': query, 'expected': [seed_file.stem], 'source': 'trigger'})
+    return with_paraphrases(queries)
+
+
+def coined_terms(rng, count):
+    """Return count distinct pseudo-words built from SYLLABLES."""
+    length = 3
+    while len(SYLLABLES) ** length < count:
+        length += 1
+    combos = rng.sample(range(len(SYLLABLES) ** length), count)
+    terms = []
+    for combo in combos:
+        parts = []
+        for _ in range(length):
+            combo, digit = divmod(combo, len(SYLLABLES))
+            parts.append(SYLLABLES[digit])
+        terms.append(''.join(parts))
+    return terms
+
+
+def create_labeled_catalog(path, seed_count, max_queries, seed=FIXTURE_SEED):
+    """Create a synthetic catalog; returns (trigger table, labeled queries)."""
+    rng = random.Random(seed + seed_count)
+    path.mkdir(parents=True)
+    triggers = {}
+    for i, term in enumerate(coined_terms(rng, seed_count)):
+        seed_id = f"{i:05d}_{term}"
+        triggers[seed_id] = [term] + rng.sample(VOCABULARY, 5)
+        (path / f"{seed_id}.md").write_text(
+            f"---\nname: {term.title()} Pattern\ntype: seed\n---\n\n"
+            f"## What It Is\n\nA pattern about {', '.join(triggers[seed_id][1:4])}.\n"
+        )
+
+    queries = []
+    for seed_id in rng.sample(sorted(triggers), min(max_queries, seed_count)):
+        term, *words = triggers[seed_id]
+        queries.append({'query': [term, words[0]], 'expected': [seed_id], 'source': 'trigger'})
+    return triggers, with_paraphrases(queries)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, -(-len(ordered) * pct // 100) - 1))
+    return ordered[int(index)]
+
+
+def score_query(ranked, expected, k):
+    """Return (precision@k, hit@k, reciprocal rank) for one ranked list of seed IDs."""
+    relevant = set(expected)
+    hits = sum(1 for seed_id in ranked[:k] if seed_id in relevant)
+    rank = next((i for i, seed_id in enumerate(ranked, 1) if seed_id in relevant), None)
+    return hits / k, 1.0 if hits else 0.0, 1.0 / rank if rank else 0.0
+
+
+def evaluate(suggest, queries, k, repeat):
+    """Run every query repeat times; returns metrics overall and per query source."""
+    per_source = {}
+    for query in queries:
+        ranked = [s['seed_id'] for s in suggest.suggest_seeds(query['query'], top_n=RANK_DEPTH)]
+        latencies = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            suggest.suggest_seeds(query['query'], top_n=RANK_DEPTH)
+            latencies.append(time.perf_counter() - started)
+        scores = score_query(ranked, query['expected'], k)
+        for source in ('all', query['source']):
+            bucket = per_source.setdefault(source, {'scores': [], 'latencies': []})
+            bucket['scores'].append(scores)
+            bucket['latencies'].extend(latencies)
+
+    metrics = {}
+    for source, bucket in per_source.items():
+        scores = bucket['scores']
+        latencies = bucket['latencies']
+        metrics[source] = {
+            'queries': len(scores),
+            f'precision@{k}': round(sum(s[0] for s in scores) / len(scores), 4),
+            f'hit@{k}': round(sum(s[1] for s in scores) / len(scores), 4),
+            'mrr': round(sum(s[2] for s in scores) / len(scores), 4),
+            'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        }
+    return metrics
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def metric_rows(report):
+    """Yield (catalog, source, metrics) for every evaluated slice."""
+    for result in report['results']:
+        for source, metrics in result['metrics'].items():
+            yield result['catalog'], source, metrics
+
+
+def print_table(report):
+    k = report['k']
+    print(f"| Catalog | Queries | P@{k} | Hit@{k} | MRR | p50 (ms) | p99 (ms) |")
+    print("|---------|---------|------|--------|-----|----------|----------|")
+    for catalog, source, m in metric_rows(report):
+        print(f"| {catalog} ({source}) | {m['queries']} | {m[f'precision@{k}']:.3f} | {m[f'hit@{k}']:.3f} | "
+              f"{m['mrr']:.3f} | {m['p50_ms']:.2f} | {m['p99_ms']:.2f} |")
+
+
+def compare_reports(current, baseline):
+    """Return markdown with metric deltas against a baseline run."""
+    k = current['k']
+    previous = {(c, s): m for c, s, m in metric_rows(baseline)}
+    lines = [
+        f"| Catalog | P@{k} | MRR | p50 (ms) | p99 (ms) |",
+        "|---------|------|-----|----------|----------|",
+    ]
+    for catalog, source, m in metric_rows(current):
+        old = previous.get((catalog, source))
+        if old is None:
+            lines.append(f"| {catalog} ({source}) | {m[f'precision@{k}']:.3f} (new) | {m['mrr']:.3f} | "
+                         f"{m['p50_ms']:.2f} | {m['p99_ms']:.2f} |")
+            continue
+        lines.append(
+            f"| {catalog} ({source}) | {m[f'precision@{k}']:.3f} ({m[f'precision@{k}'] - old.get(f'precision@{k}', 0):+.3f}) | "
+            f"{m['mrr']:.3f} ({m['mrr'] - old['mrr']:+.3f}) | "
+            f"{m['p50_ms']:.2f} ({m['p50_ms'] - old['p50_ms']:+.2f}) | {m['p99_ms']:.2f} ({m['p99_ms'] - old['p99_ms']:+.2f}) |"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    args = sys.argv[1:]
+    sizes = DEFAULT_SIZES
+    k = DEFAULT_K
+    repeat = DEFAULT_REPEAT
+    max_queries = DEFAULT_MAX_QUERIES
+    output = None
+    compare = None
+    dump_dataset = None
+    workdir = None
+    keep = False
+
+    while args:
+        arg = args.pop(0)
+        if arg == '--sizes' and args:
+            sizes = args.pop(0).split(',')
+        elif arg == '--k' and args:
+            k = int(args.pop(0))
+        elif arg == '--repeat' and args:
+            repeat = int(args.pop(0))
+        elif arg == '--max-queries' and args:
+            max_queries = int(args.pop(0))
+        elif arg == '--output' and args:
+            output = Path(args.pop(0))
+        elif arg == '--compare' and args:
+            compare = Path(args.pop(0))
+        elif arg == '--dump-dataset' and args:
+            dump_dataset = Path(args.pop(0))
+        elif arg == '--workdir' and args:
+            workdir = Path(args.pop(0))
+        elif arg == '--keep':
+            keep = True
+        else:
+            print("Usage: seed_relevance_eval.py [--sizes real,100,1000,10000] [--k <n>] [--repeat <n>]")
+            print("                              [--max-queries <n>] [--output <file>] [--compare <baseline.json>]")
+            print("                              [--dump-dataset <file>] [--workdir <dir>] [--keep]")
+            sys.exit(1)
+
+    if any(size != 'real' and not size.isdigit() for size in sizes):
+        print(f"❌ Sizes must be 'real' or seed counts: {','.join(sizes)}", file=sys.stderr)
+        sys.exit(1)
+
+    if workdir:
+        workdir.mkdir(parents=True, exist_ok=True)
+        workdir = Path(tempfile.mkdtemp(prefix="seed-eval-", dir=workdir))
+    else:
+        workdir = Path(tempfile.mkdtemp(prefix="seed-eval-"))
+
+    print(f"🎯 Evaluating suggest_seeds (k={k}, repeat={repeat}, catalogs: {', '.join(sizes)})\n")
+
+    results = []
+    datasets = {}
+    started = time.perf_counter()
+    try:
+        for size in sizes:
+            suggest = load_script("seed-library/scripts/suggest_seeds.py")
+            if size == 'real':
+                queries = real_dataset(suggest.SEEDS_DIR)
+                catalog_size = len(list(suggest.SEEDS_DIR.glob("*.md")))
+            else:
+                suggest.SEEDS_DIR = workdir / f"seeds-{size}"
+                suggest.SEED_TRIGGERS, queries = create_labeled_catalog(suggest.SEEDS_DIR, int(size), max_queries)
+                catalog_size = int(size)
+            datasets[size] = queries
+            metrics = evaluate(suggest, queries, k, repeat)
+            results.append({'catalog': size, 'seeds': catalog_size, 'metrics': metrics})
+            m = metrics['all']
+            print(f"  {size:>6} seeds={catalog_size:<6} queries={m['queries']:<4} P@{k} {m[f'precision@{k}']:.3f}  "
+                  f"MRR {m['mrr']:.3f}  p50 {m['p50_ms']:.2f} ms  p99 {m['p99_ms']:.2f} ms")
+    finally:
+        if not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'k': k,
+        'repeat': repeat,
+        'environment': environment_info(),
+        'elapsed_seconds': round(time.perf_counter() - started, 2),
+        'results': results,
+    }
+
+    print()
+    print_table(report)
+
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"seed-eval-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\n✅ Results saved to: {output}")
+
+    if dump_dataset:
+        dump_dataset.write_text(json.dumps(datasets, indent=2))
+        print(f"📄 Dataset saved to: {dump_dataset}")
+
+    if compare:
+        print("\n" + compare_reports(report, json.loads(compare.read_text())))
+
+
+if __name__ == "__main__":
+    main()
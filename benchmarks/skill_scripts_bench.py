@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+skill_scripts_bench.py - Benchmark the Python skill scripts on synthetic fixtures
+
+Generates reproducible fixtures (git repos, seed catalogs, skill trees) at
+several scales, times the main entry points of the skill scripts against them,
+and writes the results as JSON so runs can be compared.
+
+Usage:
+    python3 benchmarks/skill_scripts_bench.py [--scale small|default|large]
+        [--repeat <n>] [--only <name>] [--output <file>] [--compare <baseline.json>]
+        [--workdir <dir>] [--keep]
+
+Examples:
+    python3 benchmarks/skill_scripts_bench.py --scale small
+    python3 benchmarks/skill_scripts_bench.py --only suggest_seeds --compare benchmarks/results/before.json
+
+Results are written to benchmarks/results/<timestamp>.json unless --output is given.
+Fixtures are generated from a fixed random seed, so the same scale always
+produces the same inputs. HOME points at a fresh directory under the fixtures
+for the whole run, so the scripts' caches (~/.cache/repo-hotspots,
+~/.cache/repo-imports, ...) start empty every time and are removed with the
+fixtures.
+"""
+
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = ROOT / "skills"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+FIXTURE_SEED = 1234
+
+SCALES = {
+    'small': {
+        'repo_files': [100, 1000],
+        'history': [10, 50],
+        'seeds': [10, 100, 1000],
+        'skills': [50, 500],
+    },
+    'default': {
+        'repo_files': [100, 1000, 10000],
+        'history': [10, 100],
+        'seeds': [10, 100, 1000, 10000],
+        'skills': [50, 500, 5000],
+    },
+    'large': {
+        'repo_files': [1000, 10000, 50000],
+        'history': [100, 1000],
+        'seeds': [100, 1000, 10000],
+        'skills': [500, 5000],
+    },
+}
+
+VOCABULARY = [
+    "agent", "routing", "supervisor", "context", "token", "budget", "cost",
+    "trace", "debugging", "governance", "coordination", "multi-agent", "handoff",
+    "cache", "memory", "pipeline", "schema", "state", "session", "artifact",
+    "workflow", "planning", "export", "bundle", "fallback", "validation",
+]
+KEYWORDS = ["agent", "routing", "supervisor"]
+SEED_QUERY = ["multi-agent", "coordination", "cost", "budget"]
+
+
+def load_script(relative_path):
+    """Import a skill script as a fresh module, by file path."""
+    path = SKILLS_DIR / relative_path
+    name = f"bench_{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(path.parent))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(path.parent))
+    return module
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def synthetic_source(rng, index, ext):
+    """Return the text of one synthetic source file."""
+    words = rng.sample(VOCABULARY, 4)
+    if ext == '.md':
+        return f"# Document {index}\n\n## {words[0].title()}\n\nNotes on {' and '.join(words)}.\n"
+    if ext == '.ts':
+        return (f"import {{ {words[0]} }} from './{words[1]}';\n\n"
+                f"export function {words[2]}_{index}() {{\n  return '{words[3]}';\n}}\n")
+    return (f"import os\nfrom .{words[0]} import {words[1]}\n\n\n"
+            f"def {words[2]}_{index}():\n    return '{words[3]}'\n\n\n"
+            f"class {words[3].title().replace('-', '')}{index}:\n    pass\n")
+
+
+def create_git_repo(path, file_count, history_depth, seed=FIXTURE_SEED):
+    """
+    Create a git repo with file_count files and history_depth commits.
+
+    The first commit adds every file; each later commit rewrites a few of
+    them. History is written with git fast-import, so deep histories are cheap.
+    """
+    rng = random.Random(seed + file_count * 31 + history_depth)
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+
+    extensions = ['.py', '.py', '.ts', '.md']
+    dirs_per_level = max(1, int(file_count ** 0.5) // 4)
+    files = [
+        f"src/pkg{i % dirs_per_level}/sub{(i // dirs_per_level) % 4}/file{i}{extensions[i % 4]}"
+        for i in range(file_count)
+    ]
+    files += ["package.json", "tsconfig.json", "requirements.txt"]
+
+    stream = bytearray()
+
+    def data(payload):
+        payload = payload.encode('utf-8')
+        stream.extend(f"data {len(payload)}\n".encode() + payload + b"\n")
+
+    timestamp = 1700000000
+    for commit in range(history_depth):
+        stream.extend(b"commit refs/heads/main\n")
+        stream.extend(f"mark :{commit + 1}\n".encode())
+        stream.extend(f"committer Bench <bench@example.com> {timestamp + commit * 60} +0000\n".encode())
+        kind = rng.choice(['feat', 'fix', 'refactor', 'docs', 'chore'])
+        data(f"{kind}: synthetic change {commit}")
+        if commit:
+            stream.extend(f"from :{commit}\n".encode())
+            changed = [(commit, name) for name in rng.sample(files[:file_count], min(5, file_count))]
+        else:
+            changed = list(enumerate(files))
+        for index, name in changed:
+            stream.extend(f"M 100644 inline {name}\n".encode())
+            data(synthetic_source(rng, index, Path(name).suffix or '.md'))
+        stream.extend(b"\n")
+
+    subprocess.run(["git", "fast-import", "--quiet"], cwd=path, input=bytes(stream), check=True)
+    subprocess.run(["git", "reset", "-q", "--hard", "main"], cwd=path, check=True)
+    return path
+
+
+def create_seed_catalog(path, seed_count, seed=FIXTURE_SEED):
+    """Create seed_count seed files and return the matching trigger table."""
+    rng = random.Random(seed + seed_count)
+    path.mkdir(parents=True)
+    triggers = {}
+    for i in range(seed_count):
+        seed_id = f"{i:05d}_synthetic_seed"
+        words = rng.sample(VOCABULARY, 8)
+        triggers[seed_id] = words
+        (path / f"{seed_id}.md").write_text(
+            f"---\nname: Synthetic Seed {i}\ntype: seed\n---\n\n"
+            f"## What It Is\n\nA pattern about {', '.join(words[:3])}.\n\n"
+            f"## Trigger\n\nUse when {words[3]} or {words[4]} matter.\n"
+        )
+    return triggers
+
+
+def create_usage_file(path, seed_ids, seed=FIXTURE_SEED):
+    """Create a seed usage state file with history for every seed."""
+    rng = random.Random(seed + len(seed_ids))
+    state = {"seeds": {}, "session_seeds": {}}
+    for seed_id in seed_ids:
+        sessions = [f"session_{rng.randrange(1000)}" for _ in range(3)]
+        state["seeds"][seed_id] = {
+            "usage_count": len(sessions),
+            "last_used": "2026-01-01T00:00:00",
+            "sessions": sessions,
+        }
+        for session in sessions:
+            state["session_seeds"].setdefault(session, []).append(seed_id)
+    path.write_text(json.dumps(state, indent=2))
+
+
+def create_skill_tree(path, skill_count, seed=FIXTURE_SEED):
+    """Create skill_count valid skill directories and return their paths."""
+    rng = random.Random(seed + skill_count)
+    path.mkdir(parents=True)
+    dirs = []
+    for i in range(skill_count):
+        name = f"synthetic-skill-{i}"
+        words = rng.sample(VOCABULARY, 6)
+        body = "\n\n".join(
+            f"## {word.title()}\n\n" + " ".join(rng.choices(VOCABULARY, k=60))
+            for word in words
+        )
+        skill_dir = path / name
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: Handle {words[0]} and {words[1]}. "
+            f"Use when working on {words[2]}.\n---\n\n# {name}\n\n{body}\n"
+        )
+        dirs.append(skill_dir)
+    return dirs
+
+
+# ---------------------------------------------------------------------------
+# Timing
+# ---------------------------------------------------------------------------
+
+def time_call(fn, repeat):
+    """Run fn once to warm up, then repeat times; return per-run seconds."""
+    fn()
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - started)
+    return runs
+
+
+def record(results, name, params, runs):
+    """Append one benchmark result and print a progress line."""
+    result = {
+        'benchmark': name,
+        'params': params,
+        'runs': [round(r, 6) for r in runs],
+        'min': round(min(runs), 6),
+        'median': round(statistics.median(runs), 6),
+        'mean': round(statistics.mean(runs), 6),
+    }
+    results.append(result)
+    label = ', '.join(f"{k}={v}" for k, v in params.items())
+    print(f"  {name:<28} {label:<28} median {result['median'] * 1000:>10.2f} ms")
+
+
+def bench_repo_scripts(workdir, scale, repeat, results, only):
+    """Time context_mapper and diff_tracker on synthetic git repos."""
+    wanted = {'generate_context_summary', 'get_diff_summary'}
+    if only and only not in wanted:
+        return
+    context_mapper = load_script("repo-context-sync/scripts/context_mapper.py")
+    diff_tracker = load_script("repo-context-sync/scripts/diff_tracker.py")
+
+    for file_count in scale['repo_files']:
+        for history in scale['history']:
+            repo = create_git_repo(workdir / f"repo-{file_count}-{history}", file_count, history)
+            params = {'files': file_count, 'history': history}
+
+            if not only or only == 'generate_context_summary':
+                for tree_source in ('disk', 'git'):
+                    runs = time_call(
+                        lambda: context_mapper.generate_context_summary(str(repo), KEYWORDS, tree_source),
+                        repeat
+                    )
+                    record(results, 'generate_context_summary', {**params, 'tree': tree_source}, runs)
+
+            if not only or only == 'get_diff_summary':
+                root = subprocess.run(
+                    ["git", "rev-list", "--max-parents=0", "HEAD"],
+                    cwd=repo, capture_output=True, text=True, check=True
+                ).stdout.strip()
+                head = diff_tracker.get_current_commit(str(repo))
+                runs = time_call(lambda: diff_tracker.get_diff_summary(str(repo), root, head), repeat)
+                record(results, 'get_diff_summary', params, runs)
+
+
+def bench_seed_scripts(workdir, scale, repeat, results, only):
+    """Time suggest_seeds and track_seed_usage on synthetic seed catalogs."""
+    wanted = {'suggest_seeds', 'track_seed_usage'}
+    if only and only not in wanted:
+        return
+
+    for seed_count in scale['seeds']:
+        params = {'seeds': seed_count}
+        seeds_dir = workdir / f"seeds-{seed_count}"
+        triggers = create_seed_catalog(seeds_dir, seed_count)
+
+        if not only or only == 'suggest_seeds':
+            suggest = load_script("seed-library/scripts/suggest_seeds.py")
+            suggest.SEEDS_DIR = seeds_dir
+            suggest.SEED_TRIGGERS = triggers
+            runs = time_call(lambda: suggest.suggest_seeds(SEED_QUERY), repeat)
+            record(results, 'suggest_seeds', params, runs)
+
+        if not only or only == 'track_seed_usage':
+            apply = load_script("seed-library/scripts/apply_seed.py")
+            apply.USAGE_FILE = workdir / f"usage-{seed_count}.json"
+            create_usage_file(apply.USAGE_FILE, list(triggers))
+            seed_id = next(iter(triggers))
+            runs = time_call(lambda: apply.track_seed_usage(seed_id, "bench_session"), repeat)
+            record(results, 'track_seed_usage', params, runs)
+
+
+def bench_validate(workdir, scale, repeat, results, only):
+    """Time validate_skill over synthetic skill trees."""
+    if only and only != 'validate_skill':
+        return
+    quick_validate = load_script("skill-creation/scripts/quick_validate.py")
+
+    for skill_count in scale['skills']:
+        dirs = create_skill_tree(workdir / f"skills-{skill_count}", skill_count)
+
+        def validate_all():
+            for skill_dir in dirs:
+                valid, message = quick_validate.validate_skill(skill_dir)
+                if not valid:
+                    raise RuntimeError(f"{skill_dir}: {message}")
+
+        runs = time_call(validate_all, repeat)
+        record(results, 'validate_skill', {'skills': skill_count}, runs)
+
+
+BENCHMARKS = [bench_repo_scripts, bench_seed_scripts, bench_validate]
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def environment_info():
+    """Describe the machine and tool versions the run was made with."""
+    git_version = subprocess.run(["git", "--version"], capture_output=True, text=True).stdout.strip()
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+    ).stdout.strip()
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'git': git_version,
+        'commit': commit,
+    }
+
+
+def result_key(result):
+    """Key identifying a benchmark case across runs."""
+    return result['benchmark'], tuple(sorted(result['params'].items()))
+
+
+def compare_results(current, baseline):
+    """Return markdown comparing median times against a baseline run."""
+    previous = {result_key(r): r for r in baseline['results']}
+    lines = [
+        "| Benchmark | Params | Baseline (ms) | Current (ms) | Change |",
+        "|-----------|--------|---------------|--------------|--------|",
+    ]
+    for result in current['results']:
+        old = previous.get(result_key(result))
+        label = ', '.join(f"{k}={v}" for k, v in result['params'].items())
+        new_ms = result['median'] * 1000
+        if old is None:
+            lines.append(f"| {result['benchmark']} | {label} | - | {new_ms:.2f} | new |")
+            continue
+        old_ms = old['median'] * 1000
+        change = f"{(new_ms / old_ms - 1) * 100:+.1f}%" if old_ms else "-"
+        lines.append(f"| {result['benchmark']} | {label} | {old_ms:.2f} | {new_ms:.2f} | {change} |")
+    return "\n".join(lines)
+
+
+def main():
+    args = sys.argv[1:]
+    scale_name = 'default'
+    repeat = 5
+    only = None
+    output = None
+    compare = None
+    workdir = None
+    keep = False
+
+    while args:
+        arg = args.pop(0)
+        if arg == '--scale' and args:
+            scale_name = args.pop(0)
+        elif arg == '--repeat' and args:
+            repeat = int(args.pop(0))
+        elif arg == '--only' and args:
+            only = args.pop(0)
+        elif arg == '--output' and args:
+            output = Path(args.pop(0))
+        elif arg == '--compare' and args:
+            compare = Path(args.pop(0))
+        elif arg == '--workdir' and args:
+            workdir = Path(args.pop(0))
+        elif arg == '--keep':
+            keep = True
+        else:
+            print("Usage: skill_scripts_bench.py [--scale small|default|large] [--repeat <n>] [--only <name>]")
+            print("                              [--output <file>] [--compare <baseline.json>] [--workdir <dir>] [--keep]")
+            sys.exit(1)
+
+    if scale_name not in SCALES:
+        print(f"❌ Unknown scale: {scale_name} (choose from {', '.join(SCALES)})", file=sys.stderr)
+        sys.exit(1)
+
+    if workdir:
+        workdir.mkdir(parents=True, exist_ok=True)
+        workdir = Path(tempfile.mkdtemp(prefix="skill-bench-", dir=workdir))
+    else:
+        workdir = Path(tempfile.mkdtemp(prefix="skill-bench-"))
+
+    print(f"⏱️  Benchmarking skill scripts (scale: {scale_name}, repeat: {repeat})")
+    print(f"   Fixtures: {workdir}\n")
+
+    # The scripts resolve their cache paths from HOME when they are loaded
+    home = workdir / "home"
+    home.mkdir()
+    real_home = os.environ.get('HOME')
+    os.environ['HOME'] = str(home)
+
+    results = []
+    started = time.perf_counter()
+    try:
+        for bench in BENCHMARKS:
+            bench(workdir, SCALES[scale_name], repeat, results, only)
+    finally:
+        if real_home is None:
+            del os.environ['HOME']
+        else:
+            os.environ['HOME'] = real_home
+        if not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'scale': scale_name,
+        'repeat': repeat,
+        'environment': environment_info(),
+        'elapsed_seconds': round(time.perf_counter() - started, 2),
+        'results': results,
+    }
+
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        output = RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\n✅ Results saved to: {output}")
+
+    if compare:
+        print("\n" + compare_results(report, json.loads(compare.read_text())))
+
+
+if __name__ == "__main__":
+    main()
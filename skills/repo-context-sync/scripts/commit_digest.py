@@ -0,0 +1,233 @@
+#!/usr/bin/env python3.11
+"""
+commit_digest.py - Fixed-size digest of a commit range of any length
+Usage: python3.11 commit_digest.py <repo_path> <from_commit> [to_commit] [--examples <k>] [--groups <n>]
+Example: python3.11 commit_digest.py /home/ubuntu/repos/dojo-genesis v1.0.0 HEAD
+
+Streams `git log --numstat` and `git diff --name-status` line by line and
+groups commits by conventional-commit type (feat, fix, ... from the subject,
+"other" when there is none), by author and by top-level path. Each group keeps
+its commit and line counts plus a min-heap of its --examples largest commits
+(default 3), so memory grows with the number of groups, never with the number
+of commits, and the report lists at most --groups groups per dimension
+(default 10).
+
+Used by diff_tracker.py for long ranges (--digest).
+"""
+
+import re
+import sys
+import heapq
+import subprocess
+from pathlib import Path
+from datetime import datetime
+
+DEFAULT_EXAMPLES = 3
+DEFAULT_GROUPS = 10
+DIMENSIONS = ('type', 'author', 'path')
+CONVENTIONAL = re.compile(r'^(\w+)(?:\([^)]*\))?!?:\s')
+ROOT_GROUP = '(root)'
+
+def commit_type(subject):
+    """Conventional-commit type of a subject line: 'feat', 'fix', ..., 'merge' or 'other'"""
+    match = CONVENTIONAL.match(subject)
+    if match:
+        return match.group(1).lower()
+    if subject.startswith('Merge '):
+        return 'merge'
+    return 'other'
+
+def top_level(path):
+    """First path component, or ROOT_GROUP for files at the repo root"""
+    slash = path.find('/')
+    return path[:slash] if slash > 0 else ROOT_GROUP
+
+def new_digest(examples=DEFAULT_EXAMPLES):
+    return {
+        'examples': examples,
+        'commits': 0,
+        'added': 0,
+        'deleted': 0,
+        'first': None,
+        'last': None,
+        'largest': [],
+        'groups': {dimension: {} for dimension in DIMENSIONS},
+        'files': {},
+        'sequence': 0,
+    }
+
+def keep_example(heap, limit, entry):
+    """Push entry onto a bounded min-heap, dropping the smallest once it holds limit entries"""
+    if len(heap) < limit:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+def add_commit(digest, sha, author, timestamp, subject, added, deleted, paths):
+    """Fold one commit into the digest"""
+    lines = added + deleted
+    digest['commits'] += 1
+    digest['added'] += added
+    digest['deleted'] += deleted
+    if digest['first'] is None or timestamp < digest['first']:
+        digest['first'] = timestamp
+    if digest['last'] is None or timestamp > digest['last']:
+        digest['last'] = timestamp
+
+    # The sequence number breaks ties so entries never compare by subject
+    digest['sequence'] += 1
+    example = (lines, digest['sequence'], sha[:7], subject)
+    limit = digest['examples']
+    keep_example(digest['largest'], limit, example)
+
+    keys = {
+        'type': (commit_type(subject),),
+        'author': (author,),
+        'path': paths or (ROOT_GROUP,),
+    }
+    for dimension, names in keys.items():
+        groups = digest['groups'][dimension]
+        for name in names:
+            group = groups.get(name)
+            if group is None:
+                group = groups[name] = [0, 0, []]
+            group[0] += 1
+            group[1] += lines
+            keep_example(group[2], limit, example)
+
+def stream_commits(repo_path, from_commit, to_commit, digest):
+    """Fold every commit in from..to into the digest, reading git log as a stream"""
+    process = subprocess.Popen(
+        ["git", "-c", "core.quotepath=off", "log", "--numstat", "--no-renames",
+         "--format=%x00%H%x1f%an%x1f%ct%x1f%s", f"{from_commit}..{to_commit}"],
+        cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, encoding='utf-8', errors='replace'
+    )
+    current = None
+    for line in process.stdout:
+        if line.startswith('\0'):
+            if current:
+                add_commit(digest, *current[:6], tuple(current[6]))
+            sha, author, timestamp, subject = line[1:].rstrip('\n').split('\x1f', 3)
+            current = [sha, author, int(timestamp), subject, 0, 0, set()]
+            continue
+        parts = line.rstrip('\n').split('\t', 2)
+        if current is None or len(parts) != 3:
+            continue
+        added, deleted, path = parts
+        # Binary files report "-" for both counts
+        current[4] += int(added) if added != '-' else 0
+        current[5] += int(deleted) if deleted != '-' else 0
+        current[6].add(top_level(path))
+    if current:
+        add_commit(digest, *current[:6], tuple(current[6]))
+    process.wait()
+
+def stream_file_changes(repo_path, from_commit, to_commit, digest):
+    """Count net file changes between the endpoints per top-level path and status"""
+    process = subprocess.Popen(
+        ["git", "diff", "--name-status", "-z", "--no-renames", f"{from_commit}..{to_commit}"],
+        cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    files = digest['files']
+    pending = b''
+    status = None
+    while True:
+        chunk = process.stdout.read(64 * 1024)
+        if not chunk:
+            break
+        fields = (pending + chunk).split(b'\0')
+        pending = fields.pop()
+        for field in fields:
+            if status is None:
+                status = field[:1].decode('ascii', errors='replace')
+                continue
+            counts = files.setdefault(top_level(field.decode('utf-8', errors='replace')), {})
+            counts[status] = counts.get(status, 0) + 1
+            status = None
+    process.wait()
+
+def build_digest(repo_path, from_commit, to_commit, examples=DEFAULT_EXAMPLES):
+    """Stream the range and return its digest (see new_digest for the layout)"""
+    digest = new_digest(examples)
+    stream_commits(repo_path, from_commit, to_commit, digest)
+    stream_file_changes(repo_path, from_commit, to_commit, digest)
+    return digest
+
+def format_examples(heap, indent='  '):
+    """Largest commits first"""
+    return ''.join(
+        f"{indent}- `{sha}` {subject} ({lines:,} lines)\n"
+        for lines, _, sha, subject in sorted(heap, reverse=True)
+    )
+
+def format_date(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d") if timestamp else 'n/a'
+
+def generate_digest_markdown(digest, groups=DEFAULT_GROUPS):
+    """Render the digest; the size depends on groups and examples, not on the range length"""
+    md = (f"- **Commits:** {digest['commits']:,} ({format_date(digest['first'])} → {format_date(digest['last'])})\n"
+          f"- **Lines:** +{digest['added']:,} / -{digest['deleted']:,}\n")
+    if digest['largest']:
+        md += "\n### Largest Commits\n\n"
+        md += format_examples(digest['largest'], indent='')
+
+    titles = {'type': 'By Type', 'author': 'By Author', 'path': 'By Top-Level Path'}
+    for dimension in DIMENSIONS:
+        entries = digest['groups'][dimension]
+        if not entries:
+            continue
+        ranked = heapq.nsmallest(groups, entries.items(), key=lambda item: (-item[1][0], -item[1][1], item[0]))
+        md += f"\n### {titles[dimension]}"
+        if len(entries) > groups:
+            md += f" (top {groups} of {len(entries)})"
+        md += "\n\n"
+        for name, (commits, lines, heap) in ranked:
+            md += f"- **{name}**: {commits:,} commits, {lines:,} lines\n"
+            md += format_examples(heap)
+
+    if digest['files']:
+        ranked = heapq.nsmallest(groups, digest['files'].items(), key=lambda item: (-sum(item[1].values()), item[0]))
+        md += "\n### Net File Changes by Top-Level Path"
+        if len(digest['files']) > groups:
+            md += f" (top {groups} of {len(digest['files'])})"
+        md += "\n\n| Path | Added | Modified | Deleted | Other |\n|------|-------|----------|---------|-------|\n"
+        for name, counts in ranked:
+            other = sum(v for k, v in counts.items() if k not in 'AMD')
+            md += f"| `{name}` | {counts.get('A', 0):,} | {counts.get('M', 0):,} | {counts.get('D', 0):,} | {other:,} |\n"
+    return md
+
+def main():
+    args = []
+    examples = DEFAULT_EXAMPLES
+    groups = DEFAULT_GROUPS
+    argv = sys.argv[1:]
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--examples' and argv and argv[0].isdigit():
+            examples = max(1, int(argv.pop(0)))
+        elif arg == '--groups' and argv and argv[0].isdigit():
+            groups = max(1, int(argv.pop(0)))
+        elif arg.startswith('--'):
+            args = []
+            break
+        else:
+            args.append(arg)
+
+    if len(args) not in (2, 3):
+        print("Usage: python3.11 commit_digest.py <repo_path> <from_commit> [to_commit] [--examples <k>] [--groups <n>]")
+        print("Example: python3.11 commit_digest.py /home/ubuntu/repos/dojo-genesis v1.0.0 HEAD")
+        sys.exit(1)
+
+    repo_path, from_commit = args[0], args[1]
+    to_commit = args[2] if len(args) == 3 else "HEAD"
+    if not Path(repo_path).is_dir():
+        print(f"❌ Error: {repo_path} is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    digest = build_digest(repo_path, from_commit, to_commit, examples)
+    print(f"# Commit Digest: {Path(repo_path).resolve().name} ({from_commit}..{to_commit})\n")
+    print(generate_digest_markdown(digest, groups))
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,63 @@
 #!/usr/bin/env python3.11
 """
 context_mapper.py - Generate codebase overview for task context
-Usage: python3.11 context_mapper.py <repo_path> [focus_keywords...]
+Usage: python3.11 context_mapper.py <repo_path> [focus_keywords...] [--git-tree] [--untracked] [--budget <tokens>] [--rev <commit>] [--window <commits>] [--watch] [--no-cache] [--profile[=<file>]]
 Example: python3.11 context_mapper.py /home/ubuntu/repos/dojo-genesis agent routing supervisor
+
+--git-tree builds the file tree and language detection from `git ls-files`
+instead of walking the disk, so .gitignore rules apply and ignored directories
+like node_modules cost nothing. --untracked also lists untracked files that
+are not ignored.
+
+--budget renders an adaptive tree that fits the given token budget: large
+directories collapse into "N files, X KB, top: .ext" lines and directories
+with keyword hits or churn hotspots are expanded first.
+
+Relevant Files are ranked by churn hotspot score (see hotspots.py) computed
+over the last --window commits (default 200), so actively changing files come
+first. Files one import hop away from the keyword hits (see import_graph.py)
+are listed as Related Files, ranked by how many files import them.
+
+File summaries are read through one `git cat-file --batch` process (see
+git_blobs.py): the staged version by default, or the version at --rev. The
+keyword search reads the same version (git grep --cached, or at --rev), so a
+file is matched and summarized from the same content.
+
+--profile writes a per-phase timing and subprocess trace (see profiling.py).
+
+Summaries are saved to the shared report store (see report_store.py), not
+into the repo. The store key covers the repo, HEAD, the uncommitted changes
+(git status plus each changed file's size and mtime) and every option, so a
+repeated run with unchanged inputs prints the stored summary without
+regenerating it. --no-cache always regenerates.
+
+--watch keeps running after the first summary and regenerates it whenever
+files under the repo change (see fswatch.py: inotify, or mtime polling where
+unavailable). Changes are debounced; with --git-tree or --untracked, changes
+to ignored files do not trigger a run.
 """
 
 import sys
+import os
+import heapq
+import hashlib
 import subprocess
+from collections import Counter
+from contextlib import nullcontext
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
 import json
 
+from git_blobs import BlobReader
+from fswatch import make_watcher, watch
+from hotspots import DEFAULT_WINDOW, get_hotspots, file_scores
+from import_graph import build_import_graph, one_hop_neighbors
+from path_store import ROOT, PathStore, stream_z
+from profiling import init_from_argv, phase
+from repo_markers import FRAMEWORK_MARKERS, LANGUAGE_EXTENSIONS, STRUCTURE_PREFIXES
+from report_store import lookup, save
+
 def run_git_command(repo_path, command):
     """Run a git command in the repo directory"""
     try:
@@ -41,10 +88,13 @@ def get_repo_info(repo_path):
         'remote_url': remote_url
     }
 
+# Directories the disk tree never walks into
+DISK_EXCLUDES = ['.git', 'node_modules', '__pycache__', '.next', 'dist', 'build', '.venv', 'venv']
+
 def generate_tree(repo_path, max_depth=3, exclude_patterns=None):
     """Generate a tree view of the repo structure"""
     if exclude_patterns is None:
-        exclude_patterns = ['.git', 'node_modules', '__pycache__', '.next', 'dist', 'build', '.venv', 'venv']
+        exclude_patterns = DISK_EXCLUDES
     
     def should_exclude(path):
         return any(pattern in str(path) for pattern in exclude_patterns)
@@ -78,34 +128,296 @@ def generate_tree(repo_path, max_depth=3, exclude_patterns=None):
     tree_lines.extend(tree_recursive(root, "", 0))
     return "\n".join(tree_lines)
 
-def find_relevant_files(repo_path, keywords):
-    """Find files relevant to the given keywords"""
+def git_path_store(repo_path, include_untracked=False):
+    """Load files known to git (and optionally untracked, non-ignored files) into a PathStore
+
+    `git ls-files -z` is streamed straight into the store, so no list of
+    path strings is ever built.
+    """
+    command = ["git", "ls-files", "-z", "--cached"]
+    if include_untracked:
+        command += ["--others", "--exclude-standard"]
+    store = PathStore()
+    previous = None
+    for path in stream_z(command, repo_path):
+        # --cached and --others never overlap, but unmerged entries repeat once per stage
+        if path != previous:
+            store.add(path)
+        previous = path
+    return store.freeze()
+
+def render_path_tree(root_name, store, max_depth=3):
+    """Render a PathStore in the same format as generate_tree()"""
+    def tree_recursive(node, prefix="", depth=0):
+        if depth >= max_depth:
+            return []
+
+        lines = []
+        # Children are stored directories first, then by name
+        items = store.child_ids(node)
+        for i, child in enumerate(items):
+            is_last = i == len(items) - 1
+            current_prefix = "└── " if is_last else "├── "
+            next_prefix = "    " if is_last else "│   "
+
+            if store.is_dir[child]:
+                lines.append(f"{prefix}{current_prefix}{store.basename(child)}/")
+                lines.extend(tree_recursive(child, prefix + next_prefix, depth + 1))
+            else:
+                lines.append(f"{prefix}{current_prefix}{store.basename(child)}")
+        return lines
+
+    tree_lines = [f"{root_name}/"]
+    tree_lines.extend(tree_recursive(ROOT))
+    return "\n".join(tree_lines)
+
+def generate_git_tree(repo_path, max_depth=3, include_untracked=False, store=None):
+    """Generate a tree view from the git index, honoring .gitignore without touching the disk"""
+    if store is None:
+        store = git_path_store(repo_path, include_untracked)
+    return render_path_tree(Path(repo_path).resolve().name, store, max_depth)
+
+CHARS_PER_TOKEN = 4
+MAX_ENTRIES_PER_DIR = 20
+# Narrower listings tried when a full expansion does not fit the budget
+ENTRY_LIMITS = (MAX_ENTRIES_PER_DIR, 10, 5, 2, 1)
+KEYWORD_HIT_WEIGHT = 10
+
+def estimate_tokens(text):
+    """Estimate the token count of a string (~4 characters per token)"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def git_size_store(repo_path, include_untracked=False):
+    """Load tracked blobs at HEAD with their sizes (one streamed git ls-tree call) into a PathStore
+
+    With include_untracked, files git lists that are not in HEAD (untracked,
+    non-ignored files and staged additions) are added with their size on disk.
+    """
+    store = PathStore()
+    for entry in stream_z(["git", "ls-tree", "-r", "-l", "-z", "--full-tree", "HEAD"], repo_path):
+        meta, path = entry.split('\t', 1)
+        size = meta.split()[3]
+        # Submodules (gitlinks) have no blob size
+        store.add(path, int(size) if size != '-' else 0)
+    if include_untracked:
+        if run_git_command(repo_path, ["git", "rev-parse", "--verify", "--quiet", "HEAD"]):
+            extra = chain(
+                stream_z(["git", "ls-files", "-z", "--others", "--exclude-standard"], repo_path),
+                stream_z(["git", "diff", "--cached", "--name-only", "--no-renames", "--diff-filter=A", "-z", "HEAD"],
+                         repo_path)
+            )
+        else:
+            extra = stream_z(["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"], repo_path)
+        previous = None
+        for path in extra:
+            if path == previous:
+                continue
+            previous = path
+            try:
+                store.add(path, (Path(repo_path) / path).stat().st_size)
+            except OSError:
+                store.add(path, 0)
+    return store.freeze()
+
+def disk_size_store(repo_path, exclude_patterns=None):
+    """Load files and sizes into a PathStore by walking the disk, pruning excluded directory names"""
+    if exclude_patterns is None:
+        exclude_patterns = DISK_EXCLUDES
+    excluded = set(exclude_patterns)
+    store = PathStore()
+    root = Path(repo_path)
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in excluded]
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        for name in filenames:
+            rel = name if rel_dir == '.' else f"{rel_dir}/{name}"
+            try:
+                store.add(rel, os.stat(os.path.join(dirpath, name)).st_size)
+            except OSError:
+                store.add(rel, 0)
+    return store.freeze()
+
+def format_size(num_bytes):
+    """Format a byte count as B, KB or MB"""
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    if num_bytes < 1024 * 1024:
+        return f"{num_bytes / 1024:.1f} KB"
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+def describe_files(file_count, num_bytes, exts):
+    """Describe an aggregated group of files: count, size and top extensions"""
+    top = ', '.join(ext for ext, _ in exts.most_common(3))
+    noun = 'file' if file_count == 1 else 'files'
+    return f"{file_count:,} {noun}, {format_size(num_bytes)}" + (f", top: {top}" if top else '')
+
+def collapsed_line(store, node, name=None):
+    """Text of a directory shown as a single aggregate line"""
+    if name is None:
+        name = store.basename(node)
+    return f"{name}/ ({describe_files(store.files(node), store.size(node), store.ext_counts(node))})"
+
+def top_by_relevance(store, nodes, scores, limit):
+    """Split sibling nodes into (shown, hidden): the limit most relevant, in name order, and the rest"""
+    if len(nodes) <= limit:
+        return nodes, []
+    ranked = sorted(nodes, key=lambda c: (-scores.get(c, 0), store.basename(c)))
+    # Sibling IDs are already in name order
+    return sorted(ranked[:limit]), ranked[limit:]
+
+def visible_children(store, node, scores, limit=MAX_ENTRIES_PER_DIR):
+    """Return (subdirs, files, aggregate_lines) for an expanded directory
+
+    At most limit subdirectories and limit files are listed, the most
+    relevant first; the rest are summarized in aggregate lines.
+    """
+    children = store.child_ids(node)
+    is_dir = store.is_dir
+    subdirs, hidden_dirs = top_by_relevance(store, [c for c in children if is_dir[c]], scores, limit)
+    files, hidden_files = top_by_relevance(store, [c for c in children if not is_dir[c]], scores, limit)
+
+    aggregates = []
+    if hidden_dirs:
+        exts = Counter()
+        for d in hidden_dirs:
+            exts.update(store.ext_counts(d, cache=False))
+        file_count = sum(store.files(d) for d in hidden_dirs)
+        num_bytes = sum(store.size(d) for d in hidden_dirs)
+        aggregates.append(f"... {len(hidden_dirs)} more directories ({describe_files(file_count, num_bytes, exts)})")
+    if hidden_files:
+        exts = Counter(store.exts[store.ext[f]] for f in hidden_files)
+        num_bytes = sum(store.size(f) for f in hidden_files)
+        aggregates.append(f"... {describe_files(len(hidden_files), num_bytes, exts)}")
+    return subdirs, files, aggregates
+
+def line_cost(text, depth):
+    """Token cost of one rendered tree line at depth (root children are depth 0)"""
+    return estimate_tokens(" " * (4 * depth + 4) + text + "\n")
+
+def render_budgeted_tree(root_name, store, token_budget, scores=None):
+    """Render a PathStore as a tree that fits token_budget, expanding the most relevant directories first
+
+    Every directory starts collapsed into an aggregate line. Directories are
+    expanded greedily by relevance (keyword hits and hotspots, see
+    relevance_scores), then depth, as long as the expansion still fits the
+    budget; an expanded directory lists its most relevant entries and
+    aggregates the rest. Line costs are estimated per line and rounded up, so
+    the rendered tree never exceeds the budget unless the budget cannot even
+    hold the root line.
+    """
+    scores = scores or {}
+
+    used = estimate_tokens(collapsed_line(store, ROOT, root_name) + "\n")
+    # Directory node -> entry limit it was expanded with
+    expanded = {}
+    # Heap of (-score, depth, order, node); depth is the depth of the node's children
+    heap = [(-scores.get(ROOT, 0), 0, 0, ROOT)]
+    order = 1
+    while heap:
+        _, depth, _, node = heapq.heappop(heap)
+        if node == ROOT:
+            header_delta = estimate_tokens(f"{root_name}/\n") - used
+        else:
+            header_delta = (line_cost(f"{store.basename(node)}/", depth - 1)
+                            - line_cost(collapsed_line(store, node), depth - 1))
+        for limit in ENTRY_LIMITS:
+            subdirs, shown, aggregates = visible_children(store, node, scores, limit)
+            delta = header_delta
+            delta += sum(line_cost(collapsed_line(store, d), depth) for d in subdirs)
+            delta += sum(line_cost(store.basename(f), depth) for f in shown)
+            delta += sum(line_cost(text, depth) for text in aggregates)
+            if used + delta <= token_budget:
+                break
+        else:
+            continue
+        used += delta
+        expanded[node] = limit
+        for d in subdirs:
+            heapq.heappush(heap, (-scores.get(d, 0), depth + 1, order, d))
+            order += 1
+
+    def tree_recursive(node, prefix=""):
+        subdirs, shown, aggregates = visible_children(store, node, scores, expanded[node])
+        entries = [(d, True) for d in subdirs] + [(f, False) for f in shown]
+        lines = []
+        for i, (child, is_dir) in enumerate(entries):
+            is_last = i == len(entries) - 1 and not aggregates
+            current_prefix = "└── " if is_last else "├── "
+            next_prefix = "    " if is_last else "│   "
+            if is_dir and child in expanded:
+                lines.append(f"{prefix}{current_prefix}{store.basename(child)}/")
+                lines.extend(tree_recursive(child, prefix + next_prefix))
+            elif is_dir:
+                lines.append(f"{prefix}{current_prefix}{collapsed_line(store, child)}")
+            else:
+                lines.append(f"{prefix}{current_prefix}{store.basename(child)}")
+        for i, text in enumerate(aggregates):
+            current_prefix = "└── " if i == len(aggregates) - 1 else "├── "
+            lines.append(f"{prefix}{current_prefix}{text}")
+        return lines
+
+    if ROOT not in expanded:
+        return collapsed_line(store, ROOT, root_name)
+    return "\n".join([f"{root_name}/"] + tree_recursive(ROOT))
+
+def relevance_scores(store, relevant_files, churn):
+    """Per-node relevance: keyword hits plus churn hotspot scores on file IDs, summed into every ancestor
+
+    Paths that are not in the store are ignored.
+    """
+    file_scores = Counter(churn)
+    for path in relevant_files:
+        file_scores[path] += KEYWORD_HIT_WEIGHT
+    scores = {}
+    for path, score in file_scores.items():
+        node = store.lookup(path)
+        while node is not None and node >= ROOT:
+            scores[node] = scores.get(node, 0) + score
+            node = store.parent[node]
+    return scores
+
+def find_relevant_files(repo_path, keywords, rev=None):
+    """Find files relevant to the given keywords (in the index, or at rev)
+
+    The index is what read_file_summaries reads, so unstaged edits neither
+    add nor drop matches.
+    """
     if not keywords:
         return []
     
     # Use git grep to find files containing keywords
     relevant_files = set()
     
+    command_rev = [rev] if rev else []
+    source = [] if rev else ["--cached"]
+    # git grep prefixes matches in a commit with "<rev>:"
+    prefix = f"{rev}:" if rev else ''
+    
     for keyword in keywords:
         try:
             result = subprocess.run(
-                ["git", "grep", "-l", "-i", keyword],
+                ["git", "grep", "-l", "-i"] + source + ["-e", keyword] + command_rev,
                 cwd=repo_path,
                 capture_output=True,
                 text=True
             )
             if result.returncode == 0:
                 files = result.stdout.strip().split('\n')
-                relevant_files.update([f for f in files if f])
+                relevant_files.update([f.removeprefix(prefix) for f in files if f])
         except:
             pass
     
     return sorted(list(relevant_files))
 
-def extract_file_summary(file_path, max_lines=20):
-    """Extract a summary from a file (first few lines or key sections)"""
+def extract_file_summary(file_path, max_lines=20, content=None):
+    """Extract a summary from a file (first few lines or key sections)
+
+    If content is given (e.g. a blob read through BlobReader), file_path is
+    only used for its suffix and the file is not opened.
+    """
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if content is None:
+            content = file_path.read_text(encoding='utf-8', errors='ignore')
         lines = content.split('\n')
         
         # For markdown files, extract headers
@@ -130,8 +442,12 @@ def extract_file_summary(file_path, max_lines=20):
     except:
         return "(Unable to read file)"
 
-def detect_patterns(repo_path):
-    """Detect common patterns in the codebase"""
+def detect_patterns(repo_path, files=None):
+    """Detect common patterns in the codebase
+
+    If files (repo-relative paths, or a PathStore) is given, languages are
+    detected from it instead of walking the disk.
+    """
     patterns = {
         'languages': set(),
         'frameworks': set(),
@@ -141,38 +457,84 @@ def detect_patterns(repo_path):
     root = Path(repo_path)
     
     # Detect languages by file extensions
-    for ext in ['.py', '.js', '.ts', '.tsx', '.jsx', '.go', '.rs', '.java', '.rb']:
-        if list(root.rglob(f'*{ext}')):
-            patterns['languages'].add(ext[1:])
+    if isinstance(files, PathStore):
+        for ext in files.ext_counts(ROOT):
+            if ext in LANGUAGE_EXTENSIONS:
+                patterns['languages'].add(ext[1:])
+    elif files is not None:
+        for path in files:
+            ext = path[path.rfind('.'):] if '.' in path.rsplit('/', 1)[-1] else ''
+            if ext in LANGUAGE_EXTENSIONS:
+                patterns['languages'].add(ext[1:])
+    else:
+        for ext in LANGUAGE_EXTENSIONS:
+            if list(root.rglob(f'*{ext}')):
+                patterns['languages'].add(ext[1:])
     
     # Detect frameworks by config files
-    framework_markers = {
-        'package.json': 'Node.js',
-        'requirements.txt': 'Python',
-        'Cargo.toml': 'Rust',
-        'go.mod': 'Go',
-        'next.config.js': 'Next.js',
-        'vite.config.ts': 'Vite',
-        'tsconfig.json': 'TypeScript'
-    }
-    
-    for marker, framework in framework_markers.items():
+    for marker, framework in FRAMEWORK_MARKERS.items():
         if (root / marker).exists():
             patterns['frameworks'].add(framework)
     
     # Detect file structure patterns (e.g., /00_Roadmap/, /01_PRDs/)
     for item in root.iterdir():
-        if item.is_dir() and item.name.startswith(('00_', '01_', '02_', '03_', '04_', '05_')):
+        if item.is_dir() and item.name.startswith(STRUCTURE_PREFIXES):
             patterns['file_structure'].append(item.name)
     
     return patterns
 
-def generate_context_summary(repo_path, keywords=None):
-    """Generate a comprehensive context summary"""
-    repo_info = get_repo_info(repo_path)
-    tree = generate_tree(repo_path)
-    patterns = detect_patterns(repo_path)
-    relevant_files = find_relevant_files(repo_path, keywords) if keywords else []
+def read_file_summaries(repo_path, files, rev=None, reader=None):
+    """Summarize files from one cat-file process; returns [(file, summary)] for files that exist
+
+    Files are read from the index, or at rev when given, through reader if
+    given (an open BlobReader) or a new one.
+    """
+    with nullcontext(reader) if reader else BlobReader(repo_path) as blobs:
+        contents = blobs.read_many([(rev or '', f) for f in files])
+    return [
+        (f, extract_file_summary(Path(f), content=data.decode('utf-8', errors='ignore')))
+        for f, data in zip(files, contents) if data is not None
+    ]
+
+def rank_relevant_files(relevant_files, churn):
+    """Order keyword hits by churn hotspot score, most active first (ties by path)"""
+    return sorted(relevant_files, key=lambda f: (-churn.get(f, 0), f))
+
+def generate_context_summary(repo_path, keywords=None, tree_source='disk', token_budget=None, rev=None,
+                             churn_window=DEFAULT_WINDOW, reader=None):
+    """Generate a comprehensive context summary
+
+    tree_source is 'disk' (walk the working tree), 'git' (tracked files from
+    the git index) or 'git-untracked' (tracked plus untracked, non-ignored files).
+    If token_budget is set, the file tree is rendered adaptively to fit it.
+    If rev is set, keyword search and file summaries use that commit.
+    Relevant files and tree expansion are ranked by churn hotspots over the
+    last churn_window commits; their one-hop import neighbors are listed too.
+    File summaries are read through reader (an open BlobReader) if given.
+    """
+    with phase("repo_info"):
+        repo_info = get_repo_info(repo_path)
+    with phase("keyword_search"):
+        relevant_files = find_relevant_files(repo_path, keywords, rev) if keywords else []
+    with phase("hotspots"):
+        churn = file_scores(get_hotspots(repo_path, churn_window)) if relevant_files or token_budget is not None else {}
+        relevant_files = rank_relevant_files(relevant_files, churn)
+    with phase("tree"):
+        if token_budget is not None:
+            if tree_source == 'disk':
+                store = disk_size_store(repo_path)
+            else:
+                store = git_size_store(repo_path, include_untracked=tree_source == 'git-untracked')
+            scores = relevance_scores(store, relevant_files, churn)
+            tree = render_budgeted_tree(Path(repo_path).resolve().name, store, token_budget, scores)
+            patterns = detect_patterns(repo_path, store)
+        elif tree_source == 'disk':
+            tree = generate_tree(repo_path)
+            patterns = detect_patterns(repo_path)
+        else:
+            store = git_path_store(repo_path, include_untracked=tree_source == 'git-untracked')
+            tree = generate_git_tree(repo_path, store=store)
+            patterns = detect_patterns(repo_path, store)
     
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
@@ -202,34 +564,165 @@ def generate_context_summary(repo_path, keywords=None):
     if keywords:
         md += f"\n## Relevant Files (Keywords: {', '.join(keywords)})\n\n"
         if relevant_files:
-            md += f"Found {len(relevant_files)} relevant files:\n\n"
+            md += f"Found {len(relevant_files)} relevant files (most active first):\n\n"
             for file in relevant_files[:20]:  # Limit to first 20
                 md += f"- `{file}`\n"
             
             if len(relevant_files) > 20:
                 md += f"\n... and {len(relevant_files) - 20} more files\n"
             
+            with phase("import_graph"):
+                neighbors = one_hop_neighbors(build_import_graph(repo_path, rev), relevant_files)
+            if neighbors:
+                md += "\n### Related Files (One Import Hop)\n\n"
+                for file, in_degree in neighbors:
+                    md += f"- `{file}` (imported by {in_degree})\n"
+            
             # Show summaries for top 5 files
             md += "\n### File Summaries (Top 5)\n\n"
-            for file in relevant_files[:5]:
-                file_path = Path(repo_path) / file
-                if file_path.exists():
-                    md += f"#### `{file}`\n\n```\n"
-                    md += extract_file_summary(file_path)
-                    md += "\n```\n\n"
+            with phase("file_summaries"):
+                summaries = read_file_summaries(repo_path, relevant_files[:5], rev, reader)
+            for file, summary in summaries:
+                md += f"#### `{file}`\n\n```\n"
+                md += summary
+                md += "\n```\n\n"
         else:
             md += "No files found matching the keywords.\n"
     
     return md
 
+def filter_ignored(repo_path, paths):
+    """Drop paths that git ignores (git check-ignore --stdin); returns the rest"""
+    paths = list(paths)
+    if not paths:
+        return paths
+    result = subprocess.run(
+        ["git", "check-ignore", "--stdin", "-z"],
+        cwd=repo_path, input='\0'.join(paths) + '\0', capture_output=True, text=True
+    )
+    # Exit status 1 means nothing is ignored; 128 means not a git repo
+    if result.returncode != 0:
+        return paths
+    ignored = set(result.stdout.split('\0'))
+    return [p for p in paths if p not in ignored]
+
+def worktree_state(repo_path, include_ignored=False):
+    """Digest of uncommitted changes: git status plus the size and mtime of each listed path
+
+    With include_ignored, ignored files are listed too (outside the
+    DISK_EXCLUDES directories), since the disk tree shows them.
+    Returns None outside a git repo.
+    """
+    command = ["git", "status", "--porcelain", "-z", "--untracked-files=all"]
+    if include_ignored:
+        command += ["--ignored", "--", "."]
+        command += [f":(exclude,glob)**/{name}/**" for name in DISK_EXCLUDES if name != '.git']
+    result = subprocess.run(command, cwd=repo_path, capture_output=True)
+    if result.returncode != 0:
+        return None
+    digest = hashlib.sha256(result.stdout)
+    for entry in result.stdout.split(b'\0'):
+        # "XY path" entries; the original path of a rename follows without a status
+        path = entry[3:] if entry[2:3] == b' ' else entry
+        try:
+            st = os.stat(os.path.join(os.fsencode(repo_path), path))
+            digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+        except (OSError, ValueError):
+            continue
+    return digest.hexdigest()
+
+def context_inputs(repo_path, keywords, tree_source, token_budget, rev, churn_window):
+    """Report store inputs that determine a summary, or None if they cannot be pinned down"""
+    head = run_git_command(repo_path, ["git", "rev-parse", "HEAD"])
+    state = worktree_state(repo_path, include_ignored=tree_source == 'disk')
+    if not head or state is None:
+        return None
+    if rev:
+        rev = run_git_command(repo_path, ["git", "rev-parse", "--verify", f"{rev}^{{commit}}"]) or rev
+    return {
+        'repo': str(Path(repo_path).resolve()),
+        'commit': head,
+        'worktree': state,
+        'keywords': keywords or [],
+        'tree_source': tree_source,
+        'budget': token_budget,
+        'rev': rev,
+        'window': churn_window,
+    }
+
+def map_context(repo_path, keywords, tree_source, token_budget, rev, churn_window, use_cache=True):
+    """Return (report path, summary, cached), reusing the stored summary when inputs are unchanged"""
+    with phase("cache_lookup"):
+        inputs = context_inputs(repo_path, keywords, tree_source, token_budget, rev, churn_window)
+        cached = lookup('context', inputs) if inputs and use_cache else None
+    if cached:
+        return cached, cached.read_text(), True
+
+    summary = generate_context_summary(repo_path, keywords, tree_source, token_budget, rev, churn_window)
+    if inputs is None:
+        # Not a git repo: key by path and options only, never served from cache
+        inputs = {'repo': str(Path(repo_path).resolve()), 'keywords': keywords or [], 'generated': datetime.now().isoformat()}
+    label = ' '.join([Path(repo_path).resolve().name] + (keywords or []))
+    with phase("write_output"):
+        path = save('context', inputs, summary, label=label)
+    return path, summary, False
+
+def watch_context(repo_path, keywords, tree_source, token_budget, rev, churn_window):
+    """Regenerate the context summary after each burst of file changes, until Ctrl+C"""
+    root = Path(repo_path).resolve()
+    watcher = make_watcher(root)
+    print(f"👀 Watching {root} ({watcher.kind}). Press Ctrl+C to stop.")
+    sys.stdout.flush()
+
+    def on_change(paths):
+        if tree_source != 'disk':
+            paths = filter_ignored(root, paths)
+            if not paths:
+                return
+        started = datetime.now()
+        path, _, cached = map_context(repo_path, keywords, tree_source, token_budget, rev, churn_window)
+        elapsed = (datetime.now() - started).total_seconds() * 1000
+        action = "matches a stored summary" if cached else "summary regenerated"
+        print(f"🔄 {started:%H:%M:%S} {len(paths)} changed paths → {action} in {elapsed:.0f} ms: {path}")
+        sys.stdout.flush()
+
+    watch(root, on_change, watcher=watcher)
+    print("\n👋 Stopped watching")
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3.11 context_mapper.py <repo_path> [focus_keywords...]")
+    args = []
+    flags = set()
+    token_budget = None
+    rev = None
+    churn_window = DEFAULT_WINDOW
+    init_from_argv(sys.argv)
+    argv = sys.argv[1:]
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--budget' and argv and argv[0].isdigit():
+            token_budget = int(argv.pop(0))
+        elif arg == '--rev' and argv:
+            rev = argv.pop(0)
+        elif arg == '--window' and argv and argv[0].isdigit():
+            churn_window = max(1, int(argv.pop(0)))
+        elif arg.startswith('--'):
+            flags.add(arg)
+        else:
+            args.append(arg)
+    
+    if not args or flags - {'--git-tree', '--untracked', '--watch', '--no-cache'}:
+        print("Usage: python3.11 context_mapper.py <repo_path> [focus_keywords...] [--git-tree] [--untracked] [--budget <tokens>] [--rev <commit>] [--window <commits>] [--watch] [--no-cache] [--profile[=<file>]]")
         print("Example: python3.11 context_mapper.py /home/ubuntu/repos/dojo-genesis agent routing supervisor")
         sys.exit(1)
     
-    repo_path = sys.argv[1]
-    keywords = sys.argv[2:] if len(sys.argv) > 2 else None
+    repo_path = args[0]
+    keywords = args[1:] or None
+    if '--untracked' in flags:
+        tree_source = 'git-untracked'
+    elif '--git-tree' in flags:
+        tree_source = 'git'
+    else:
+        tree_source = 'disk'
     
     if not Path(repo_path).is_dir():
         print(f"❌ Error: {repo_path} is not a directory", file=sys.stderr)
@@ -239,13 +732,15 @@ def main():
     if keywords:
         print(f"🎯 Focus keywords: {', '.join(keywords)}")
     
-    summary = generate_context_summary(repo_path, keywords)
+    output_file, summary, cached = map_context(repo_path, keywords, tree_source, token_budget, rev, churn_window,
+                                               use_cache='--no-cache' not in flags)
+    if cached:
+        print("♻️  Inputs unchanged: using the stored summary")
     print(summary)
-    
-    # Save to file
-    output_file = Path(repo_path) / ".context_summary.md"
-    output_file.write_text(summary)
     print(f"\n✅ Context summary saved to: {output_file}")
 
+    if '--watch' in flags:
+        watch_context(repo_path, keywords, tree_source, token_budget, rev, churn_window)
+
 if __name__ == "__main__":
     main()
@@ -1,8 +1,24 @@
 #!/usr/bin/env python3.11
 """
 diff_tracker.py - Track and summarize changes since last sync
-Usage: python3.11 diff_tracker.py <repo_path> [last_commit_hash]
+Usage: python3.11 diff_tracker.py <repo_path> [last_commit_hash] [--digest] [--no-cache] [--profile[=<file>]]
 Example: python3.11 diff_tracker.py /home/ubuntu/repos/dojo-genesis abc123
+
+Line counts come from `git diff --numstat`, so changed files are never read
+into memory. Changed .py/.ts/.js files also get a function/class-level
+summary (see semantic_diff.py), whose blobs are read through one
+`git cat-file --batch` process (see git_blobs.py), never from the working tree.
+
+Ranges of more than DIGEST_THRESHOLD commits (or any range with --digest) get
+a fixed-size digest instead of per-commit and per-file lists: commits grouped
+by conventional-commit type, author and top-level path with the largest few
+per group, streamed in constant memory (see commit_digest.py).
+
+Summaries are saved to the shared report store (see report_store.py), keyed
+by the repo and both commit hashes: re-running for the same range prints the
+stored summary without diffing again. --no-cache always regenerates.
+
+--profile writes a per-phase timing and subprocess trace (see profiling.py).
 """
 
 import sys
@@ -10,6 +26,13 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from semantic_diff import summarize_symbol_changes, format_symbol_changes
+from profiling import init_from_argv, phase
+from report_store import lookup, save
+from commit_digest import build_digest, generate_digest_markdown
+
+DIGEST_THRESHOLD = 1000
+
 def run_git_command(repo_path, command):
     """Run a git command in the repo directory"""
     try:
@@ -53,7 +76,10 @@ def get_diff_summary(repo_path, from_commit, to_commit):
     files_output = run_git_command(repo_path, [
         "git", "diff", "--name-status", f"{from_commit}..{to_commit}"
     ])
-    
+    return parse_name_status(files_output)
+
+def parse_name_status(files_output):
+    """Group `git diff --name-status` output into added/modified/deleted/renamed lists"""
     changes = {
         'added': [],
         'modified': [],
@@ -79,6 +105,32 @@ def get_diff_summary(repo_path, from_commit, to_commit):
     
     return changes
 
+def get_line_stats(repo_path, from_commit, to_commit):
+    """Lines added and deleted per changed file, from `git diff --numstat`
+
+    Returns {path: (added, deleted)}, or (None, None) for binary files.
+    Renamed files are keyed by their old path, as get_diff_summary lists them.
+    """
+    output = run_git_command(repo_path, [
+        "git", "diff", "--numstat", "-z", f"{from_commit}..{to_commit}"
+    ])
+    stats = {}
+    fields = output.split('\0')
+    i = 0
+    while i < len(fields):
+        record = fields[i]
+        i += 1
+        if not record:
+            continue
+        added, deleted, path = record.split('\t', 2)
+        if not path:
+            # A rename: the old and new paths follow as their own fields
+            path = fields[i]
+            i += 2
+        counts = (None, None) if added == '-' else (int(added), int(deleted))
+        stats[path] = counts
+    return stats
+
 def get_commit_log(repo_path, from_commit, to_commit):
     """Get commit log between two commits"""
     log_output = run_git_command(repo_path, [
@@ -86,8 +138,26 @@ def get_commit_log(repo_path, from_commit, to_commit):
     ])
     return log_output.split('\n') if log_output else []
 
-def generate_markdown_summary(repo_path, from_commit, to_commit, changes, commits):
-    """Generate a markdown summary of changes"""
+def generate_markdown_summary(repo_path, from_commit, to_commit, changes, commits, line_stats=None, symbol_changes=None):
+    """Generate a markdown summary of changes
+
+    line_stats (from get_line_stats) adds line counts to changed files;
+    symbol_changes (from summarize_symbol_changes) adds a Symbol Changes section.
+    """
+    line_stats = line_stats or {}
+
+    def line_info(path, kind):
+        if path not in line_stats:
+            return ''
+        added, deleted = line_stats[path]
+        if added is None:
+            return " (binary)"
+        if kind == 'added':
+            return f" ({added} lines)"
+        if kind == 'deleted':
+            return f" ({deleted} lines)"
+        return f" (+{added} -{deleted} lines)"
+
     repo_name = Path(repo_path).name
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
@@ -118,28 +188,79 @@ def generate_markdown_summary(repo_path, from_commit, to_commit, changes, commit
     if changes['added']:
         md += "\n## Added Files\n\n"
         for f in changes['added']:
-            md += f"- `{f}`\n"
+            md += f"- `{f}`{line_info(f, 'added')}\n"
     
     if changes['modified']:
         md += "\n## Modified Files\n\n"
         for f in changes['modified']:
-            md += f"- `{f}`\n"
+            md += f"- `{f}`{line_info(f, 'modified')}\n"
     
     if changes['deleted']:
         md += "\n## Deleted Files\n\n"
         for f in changes['deleted']:
-            md += f"- `{f}`\n"
+            md += f"- `{f}`{line_info(f, 'deleted')}\n"
     
     if changes['renamed']:
         md += "\n## Renamed Files\n\n"
         for f in changes['renamed']:
-            md += f"- `{f}`\n"
+            md += f"- `{f}`{line_info(f, 'renamed')}\n"
+    
+    symbols_md = format_symbol_changes(symbol_changes) if symbol_changes else ''
+    if symbols_md:
+        md += "\n## Symbol Changes\n"
+        md += symbols_md
     
     return md
 
+def summarize_range(repo_path, from_commit, to_commit, changes=None, reader=None):
+    """Full summary: every commit and changed file, with line counts and symbol changes
+
+    Returns (markdown, symbol_stats), symbol_stats as returned by
+    summarize_symbol_changes (files, blobs and cache hits). changes (from
+    get_diff_summary) and reader (an open BlobReader, used for symbol
+    parsing) are reused when the caller already has them.
+    """
+    if changes is None:
+        with phase("diff"):
+            changes = get_diff_summary(repo_path, from_commit, to_commit)
+    with phase("commit_log"):
+        commits = get_commit_log(repo_path, from_commit, to_commit)
+    with phase("line_stats"):
+        line_stats = get_line_stats(repo_path, from_commit, to_commit)
+    with phase("symbols"):
+        symbol_changes, symbol_stats = summarize_symbol_changes(repo_path, from_commit, to_commit, reader=reader)
+    
+    with phase("render"):
+        markdown = generate_markdown_summary(repo_path, from_commit, to_commit, changes, commits, line_stats, symbol_changes)
+    return markdown, symbol_stats
+
+def generate_digest_summary(repo_path, from_commit, to_commit, digest):
+    """Generate a fixed-size markdown summary from a commit digest (see commit_digest.py)"""
+    repo_name = Path(repo_path).name
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    from_info = get_commit_info(repo_path, from_commit)
+    to_info = get_commit_info(repo_path, to_commit)
+    
+    md = f"""# Diff Summary: {repo_name}
+
+**Generated:** {current_time}
+**From Commit:** `{from_commit[:7]}` ({from_info['message'] if from_info else 'Unknown'})
+**To Commit:** `{to_commit[:7]}` ({to_info['message'] if to_info else 'Unknown'})
+
+## Commit Digest
+
+"""
+    md += generate_digest_markdown(digest)
+    return md
+
 def main():
+    init_from_argv(sys.argv)
+    use_cache = '--no-cache' not in sys.argv
+    digest_mode = '--digest' in sys.argv
+    sys.argv = [arg for arg in sys.argv if arg not in ('--no-cache', '--digest')]
     if len(sys.argv) < 2:
-        print("Usage: python3.11 diff_tracker.py <repo_path> [last_commit_hash]")
+        print("Usage: python3.11 diff_tracker.py <repo_path> [last_commit_hash] [--digest] [--no-cache] [--profile[=<file>]]")
         print("Example: python3.11 diff_tracker.py /home/ubuntu/repos/dojo-genesis abc123")
         sys.exit(1)
     
@@ -153,34 +274,57 @@ def main():
         print(f"❌ Error: {repo_path} is not a git repository", file=sys.stderr)
         sys.exit(1)
     
-    # Get current commit
-    current_commit = get_current_commit(repo_path)
-    
-    # Determine from_commit
-    if len(sys.argv) >= 3:
-        from_commit = sys.argv[2]
-    else:
-        # Default to 10 commits back
-        try:
-            from_commit = run_git_command(repo_path, ["git", "rev-parse", "HEAD~10"])
-        except:
-            # If repo has less than 10 commits, use first commit
-            from_commit = run_git_command(repo_path, ["git", "rev-list", "--max-parents=0", "HEAD"])
+    with phase("resolve_commits"):
+        # Get current commit
+        current_commit = get_current_commit(repo_path)
+        
+        # Determine from_commit
+        if len(sys.argv) >= 3:
+            from_commit = sys.argv[2]
+        else:
+            # Default to 10 commits back
+            try:
+                from_commit = run_git_command(repo_path, ["git", "rev-parse", "HEAD~10"])
+            except:
+                # If repo has less than 10 commits, use first commit
+                from_commit = run_git_command(repo_path, ["git", "rev-list", "--max-parents=0", "HEAD"])
     
     print(f"📊 Analyzing changes from {from_commit[:7]} to {current_commit[:7]}")
     
-    # Get diff summary
-    changes = get_diff_summary(repo_path, from_commit, current_commit)
-    commits = get_commit_log(repo_path, from_commit, current_commit)
+    if not digest_mode:
+        commit_count = int(run_git_command(repo_path, ["git", "rev-list", "--count", f"{from_commit}..{current_commit}"]))
+        if commit_count > DIGEST_THRESHOLD:
+            print(f"📚 {commit_count:,} commits: summarizing as a digest")
+            digest_mode = True
     
-    # Generate markdown
-    markdown = generate_markdown_summary(repo_path, from_commit, current_commit, changes, commits)
+    inputs = {
+        'repo': str(Path(repo_path).resolve()),
+        'from': run_git_command(repo_path, ["git", "rev-parse", "--verify", f"{from_commit}^{{commit}}"]),
+        'to': current_commit,
+        'mode': 'digest' if digest_mode else 'full',
+    }
+    cached = lookup('diff', inputs) if use_cache else None
+    if cached:
+        print("♻️  Range unchanged: using the stored summary")
+        print(cached.read_text())
+        print(f"\n✅ Summary saved to: {cached}")
+        return
+    
+    if digest_mode:
+        with phase("digest"):
+            markdown = generate_digest_summary(repo_path, from_commit, current_commit,
+                                               build_digest(repo_path, from_commit, current_commit))
+    else:
+        markdown, symbol_stats = summarize_range(repo_path, from_commit, current_commit)
+        if symbol_stats['files']:
+            print(f"🧬 Parsed {symbol_stats['files']} source files ({symbol_stats['cache_hits']}/{symbol_stats['blobs']} blobs cached)")
     
     print(markdown)
     
-    # Also save to file
-    output_file = Path(repo_path) / ".diff_summary.md"
-    output_file.write_text(markdown)
+    # Also save to the report store
+    label = f"{Path(repo_path).resolve().name} {inputs['from'][:7]}..{current_commit[:7]}"
+    with phase("write_output"):
+        output_file = save('diff', inputs, markdown, label=label)
     print(f"\n✅ Summary saved to: {output_file}")
 
 if __name__ == "__main__":
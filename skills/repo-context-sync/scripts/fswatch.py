@@ -0,0 +1,216 @@
+"""
+fswatch.py - Debounced recursive file watching with inotify, or mtime polling as a fallback
+
+    from fswatch import watch
+
+    def on_change(paths):
+        print(sorted(paths))
+
+    watch("/home/ubuntu/skills", on_change)   # runs until Ctrl+C
+
+On Linux the Linux inotify API is used through ctypes (no third-party
+packages): one watch per directory, new directories are picked up as they
+appear, and a burst of events is delivered once it has been quiet for the
+debounce interval (default 50 ms). Where inotify is unavailable, or with
+use_inotify=False, the tree is re-scanned with os.scandir every poll interval
+and (mtime, size) snapshots are compared.
+
+Skills are installed independently, so each skill that uses this module
+ships its own copy; tests/skills/shared-scripts.test.ts fails unless every
+copy is identical, so change them together.
+"""
+
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL = 0.25
+EXCLUDED_DIRS = {'.git', 'node_modules', '__pycache__', '.next', 'dist', 'build', '.venv', 'venv'}
+
+IN_MODIFY = 0x2
+IN_ATTRIB = 0x4
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct('iIII')
+
+def walk_dirs(root, excluded_dirs):
+    """Yield root and every directory below it, pruning excluded names"""
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
+        yield dirpath
+
+class InotifyWatcher:
+    """Recursive watcher on top of inotify; raises OSError where inotify is unavailable"""
+
+    kind = 'inotify'
+
+    def __init__(self, root, excluded_dirs=EXCLUDED_DIRS):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        self.root = str(root)
+        self.excluded_dirs = excluded_dirs
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs = {}
+        for directory in walk_dirs(self.root, excluded_dirs):
+            self.add_watch(directory)
+
+    def add_watch(self, directory):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.dirs[wd] = directory
+
+    def fileno(self):
+        return self.fd
+
+    def read(self):
+        """Drain pending events; returns the set of changed paths"""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were dropped: report the whole tree as changed
+                    changed.add(self.root)
+                    continue
+                directory = self.dirs.get(wd)
+                if mask & IN_IGNORED:
+                    self.dirs.pop(wd, None)
+                    continue
+                if directory is None:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name)) if name else directory
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    if os.path.basename(path) in self.excluded_dirs:
+                        continue
+                    # Watch the new tree; files created before the watch existed are reported too
+                    for new_dir in walk_dirs(path, self.excluded_dirs):
+                        self.add_watch(new_dir)
+                        try:
+                            changed.update(os.path.join(new_dir, f) for f in os.listdir(new_dir))
+                        except OSError:
+                            pass
+                changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Fallback watcher comparing (mtime_ns, size) snapshots of the tree"""
+
+    kind = 'polling'
+
+    def __init__(self, root, excluded_dirs=EXCLUDED_DIRS):
+        self.root = str(root)
+        self.excluded_dirs = excluded_dirs
+        self.snapshot = self.scan()
+
+    def scan(self):
+        snapshot = {}
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.excluded_dirs:
+                                stack.append(entry.path)
+                        else:
+                            st = entry.stat(follow_symlinks=False)
+                            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        return snapshot
+
+    def fileno(self):
+        return None
+
+    def read(self):
+        """Re-scan the tree; returns the set of added, removed or modified paths"""
+        current = self.scan()
+        previous = self.snapshot
+        self.snapshot = current
+        changed = {path for path, stamp in current.items() if previous.get(path) != stamp}
+        changed.update(path for path in previous if path not in current)
+        return changed
+
+    def close(self):
+        pass
+
+def make_watcher(root, excluded_dirs=EXCLUDED_DIRS, use_inotify=True):
+    """Return an InotifyWatcher when possible, otherwise a PollingWatcher (see .kind)"""
+    if use_inotify:
+        try:
+            return InotifyWatcher(root, excluded_dirs)
+        except (OSError, AttributeError, TypeError):
+            pass
+    return PollingWatcher(root, excluded_dirs)
+
+def watch(root, on_change, debounce=DEBOUNCE_SECONDS, poll_interval=POLL_INTERVAL,
+          excluded_dirs=EXCLUDED_DIRS, ignore=None, use_inotify=True, watcher=None):
+    """Call on_change(paths) after each burst of changes under root, until interrupted
+
+    ignore(path) -> bool drops paths (e.g. the caller's own output file).
+    A watcher from make_watcher() may be passed in (e.g. to report which
+    mechanism is in use); it is closed on return. Returns on KeyboardInterrupt.
+    """
+    if watcher is None:
+        watcher = make_watcher(root, excluded_dirs, use_inotify)
+    pending = set()
+    try:
+        while True:
+            if watcher.fileno() is not None:
+                ready, _, _ = select.select([watcher], [], [], debounce if pending else None)
+                if ready:
+                    pending |= watcher.read()
+                    continue
+            else:
+                time.sleep(poll_interval)
+                changed = watcher.read()
+                if changed:
+                    pending |= changed
+                    continue
+
+            # Quiet for a full interval: deliver the batch
+            if ignore is not None:
+                pending = {p for p in pending if not ignore(p)}
+            if pending:
+                batch, pending = pending, set()
+                on_change(batch)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
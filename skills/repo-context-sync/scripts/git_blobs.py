@@ -0,0 +1,135 @@
+#!/usr/bin/env python3.11
+"""
+git_blobs.py - Read many file versions through one long-lived `git cat-file --batch` process
+Usage: python3.11 git_blobs.py <repo_path> <rev> <path>...
+Example: python3.11 git_blobs.py /home/ubuntu/repos/dojo-genesis HEAD~5 README.md src/index.ts
+
+Shared by context_mapper.py and diff_tracker.py. A rev of "" (or ":" on the
+command line) reads the staged version from the index; any commit-ish reads
+the version at that commit. Requests are pipelined, so hundreds of files cost
+one process and no per-file spawn or open().
+"""
+
+import sys
+import subprocess
+
+# Keep each pipelined write well under the pipe buffer so git never blocks on
+# a full stdout while we are still writing requests.
+MAX_BATCH_BYTES = 32 * 1024
+
+class BlobReader:
+    """Stream blob contents through a single `git cat-file --batch` process
+
+    Use as a context manager (or call close()); the process is started on the
+    first read and reused for every later one.
+    """
+
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+        self.process = None
+        self.objects_read = 0
+        self.bytes_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Stop the cat-file process"""
+        if self.process is not None:
+            self.process.stdin.close()
+            self.process.stdout.close()
+            self.process.wait()
+            self.process = None
+
+    def _start(self):
+        if self.process is None:
+            self.process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        return self.process
+
+    def _read_response(self):
+        """Read one response; returns the blob bytes, or None if missing or not a blob"""
+        stdout = self.process.stdout
+        header = stdout.readline()
+        if not header:
+            raise RuntimeError("git cat-file --batch exited unexpectedly")
+        header = header.rstrip(b"\n")
+        if header.endswith((b" missing", b" ambiguous")):
+            # "<object> missing" or "<object> ambiguous"; the object name may contain spaces
+            return None
+        fields = header.rsplit(b" ", 2)
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+        _, object_type, size = fields
+        data = stdout.read(int(size))
+        stdout.read(1)  # trailing newline
+        self.objects_read += 1
+        self.bytes_read += len(data)
+        return data if object_type == b"blob" else None
+
+    def read_many(self, specs):
+        """Read (rev, path) pairs in order; returns a list of bytes (None where unavailable)
+
+        rev may be a commit-ish, a blob id with path None, or "" for the index.
+        """
+        process = self._start()
+        results = []
+        pending = []
+        pending_bytes = 0
+
+        def flush():
+            nonlocal pending_bytes
+            process.stdin.write(b"".join(request for _, request in pending))
+            process.stdin.flush()
+            for valid, _ in pending:
+                results.append(self._read_response() if valid else None)
+            pending.clear()
+            pending_bytes = 0
+
+        for rev, path in specs:
+            spec = rev if path is None else f"{rev}:{path}"
+            # cat-file reads one object name per line
+            valid = "\n" not in spec
+            request = (spec + "\n").encode("utf-8") if valid else b""
+            pending.append((valid, request))
+            pending_bytes += len(request)
+            if pending_bytes >= MAX_BATCH_BYTES:
+                flush()
+        if pending:
+            flush()
+        return results
+
+    def read(self, rev, path=None):
+        """Read a single blob; returns bytes or None"""
+        return self.read_many([(rev, path)])[0]
+
+    def read_text(self, rev, path=None):
+        """Read a single blob decoded as UTF-8; returns str or None"""
+        data = self.read(rev, path)
+        return data.decode("utf-8", errors="ignore") if data is not None else None
+
+def main():
+    if len(sys.argv) < 4:
+        print("Usage: python3.11 git_blobs.py <repo_path> <rev> <path>...")
+        print("Example: python3.11 git_blobs.py /home/ubuntu/repos/dojo-genesis HEAD~5 README.md src/index.ts")
+        sys.exit(1)
+
+    repo_path, rev, paths = sys.argv[1], sys.argv[2], sys.argv[3:]
+    rev = "" if rev == ":" else rev
+    with BlobReader(repo_path) as blobs:
+        for path, data in zip(paths, blobs.read_many([(rev, p) for p in paths])):
+            if data is None:
+                print(f"❌ {rev}:{path} not found", file=sys.stderr)
+                continue
+            sys.stdout.write(data.decode("utf-8", errors="replace"))
+
+if __name__ == "__main__":
+    main()
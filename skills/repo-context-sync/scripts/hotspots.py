@@ -0,0 +1,282 @@
+#!/usr/bin/env python3.11
+"""
+hotspots.py - Rank the most active files and directories of a repo from its history
+Usage: python3.11 hotspots.py <repo_path> [--window <commits>] [--top <n>]
+Example: python3.11 hotspots.py /home/ubuntu/repos/dojo-genesis --window 500
+
+Streams `git log --numstat` over the last --window commits (default 200) in a
+single pass. Each change to a file adds
+
+    0.5 ** (age_days / HALF_LIFE_DAYS) * (1 + log10(1 + lines_changed))
+
+to its score, where age is measured from the HEAD commit, so a file touched
+often, heavily and recently ranks first. Directory scores are the sums of
+their files' scores.
+
+The per-commit numstat is cached in ~/.cache/repo-hotspots/; later runs only
+stream the commits added since the cached HEAD (or rebuild after a rebase).
+Used by context_mapper.py to rank Relevant Files and expand the budgeted tree.
+"""
+
+import sys
+import math
+import json
+import hashlib
+import subprocess
+from array import array
+from pathlib import Path
+
+from report_store import atomic_write
+
+CACHE_DIR = Path.home() / ".cache" / "repo-hotspots"
+DEFAULT_WINDOW = 200
+HALF_LIFE_DAYS = 30
+DEFAULT_TOP = 15
+# Bump when the cache layout changes
+CACHE_VERSION = 1
+
+def cache_path_for(repo_path, cache_dir=CACHE_DIR):
+    """Return the cache file for a repo: <name>-<path hash>.json"""
+    resolved = Path(repo_path).resolve()
+    digest = hashlib.sha1(str(resolved).encode('utf-8')).hexdigest()[:12]
+    return Path(cache_dir) / f"{resolved.name}-{digest}.json"
+
+def git_output(repo_path, command):
+    """Run a git command; returns stripped stdout, or None on failure"""
+    result = subprocess.run(command, cwd=repo_path, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def stream_numstat(repo_path, revision_range, max_commits, file_ids, files):
+    """Stream `git log --numstat` and return commits newest first as [sha, timestamp, changes]
+
+    changes is a flat [file_id, lines, file_id, lines, ...] list; file ids
+    index files and new paths are appended to it. Renames count as a delete
+    plus an add so every path is a real path.
+    """
+    process = subprocess.Popen(
+        ["git", "-c", "core.quotepath=off", "log", "--numstat", "--no-renames",
+         "--format=%x00%H %ct", f"-n{max_commits}", revision_range],
+        cwd=repo_path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, encoding='utf-8', errors='replace'
+    )
+    commits = []
+    changes = None
+    for line in process.stdout:
+        if line.startswith('\0'):
+            sha, timestamp = line[1:].split()
+            changes = []
+            commits.append([sha, int(timestamp), changes])
+            continue
+        parts = line.rstrip('\n').split('\t', 2)
+        if changes is None or len(parts) != 3:
+            continue
+        added, deleted, path = parts
+        # Binary files report "-" for both counts
+        lines = (int(added) if added != '-' else 0) + (int(deleted) if deleted != '-' else 0)
+        file_id = file_ids.get(path)
+        if file_id is None:
+            file_id = file_ids[path] = len(files)
+            files.append(path)
+        changes += (file_id, lines)
+    process.wait()
+    return commits
+
+def load_cache(cache_file):
+    """Load cached commits (empty if missing, corrupt or from another version)"""
+    try:
+        cache = json.loads(Path(cache_file).read_text())
+        if cache.get('version') == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return None
+
+def save_cache(cache_file, head, window, files, commits):
+    """Save commits, dropping paths no longer referenced and renumbering file ids"""
+    remap = {}
+    kept_files = []
+    kept_commits = []
+    for sha, timestamp, changes in commits:
+        renumbered = []
+        for i in range(0, len(changes), 2):
+            old_id = changes[i]
+            new_id = remap.get(old_id)
+            if new_id is None:
+                new_id = remap[old_id] = len(kept_files)
+                kept_files.append(files[old_id])
+            renumbered += (new_id, changes[i + 1])
+        kept_commits.append([sha, timestamp, renumbered])
+
+    atomic_write(cache_file, json.dumps({
+        'version': CACHE_VERSION,
+        'head': head,
+        'window': window,
+        'files': kept_files,
+        'commits': kept_commits,
+    }, separators=(',', ':')).encode('utf-8'))
+
+def load_history(repo_path, window=DEFAULT_WINDOW, cache_dir=CACHE_DIR):
+    """Return (files, commits) for the last window commits, updating the cache incrementally
+
+    Returns None if the repo has no commits.
+    """
+    head = git_output(repo_path, ["git", "rev-parse", "HEAD"])
+    if not head:
+        return None
+
+    cache_file = cache_path_for(repo_path, cache_dir)
+    cache = load_cache(cache_file)
+    if cache and cache['head'] == head and cache['window'] >= window:
+        return cache['files'], cache['commits'][:window]
+
+    files = []
+    commits = []
+    revision_range = "HEAD"
+    if cache and cache['window'] >= window and subprocess.run(
+        ["git", "merge-base", "--is-ancestor", cache['head'], head],
+        cwd=repo_path, capture_output=True
+    ).returncode == 0:
+        # Fast-forward: only stream the new commits and keep the cached ones
+        files = cache['files']
+        commits = cache['commits']
+        revision_range = f"{cache['head']}..{head}"
+
+    file_ids = {path: i for i, path in enumerate(files)}
+    new_commits = stream_numstat(repo_path, revision_range, window, file_ids, files)
+    commits = (new_commits + commits)[:window]
+    save_cache(cache_file, head, window, files, commits)
+    return files, commits
+
+def compute_hotspots(files, commits, half_life_days=HALF_LIFE_DAYS):
+    """Aggregate per-file and per-directory churn and recency into compact arrays
+
+    Returns a dict with 'files' and 'dirs' (path lists) and parallel arrays:
+    'file_score'/'dir_score' (decayed score), 'file_lines' (lines changed),
+    'file_commits' (commits touching the file) and 'file_last' (latest commit
+    timestamp). Ages are measured from the newest commit.
+    """
+    file_score = array('d', bytes(8 * len(files)))
+    file_lines = array('q', bytes(8 * len(files)))
+    file_commits = array('l', bytes(array('l').itemsize * len(files)))
+    file_last = array('q', bytes(8 * len(files)))
+
+    newest = commits[0][1] if commits else 0
+    half_life = half_life_days * 86400
+    for _, timestamp, changes in commits:
+        decay = 0.5 ** (max(newest - timestamp, 0) / half_life)
+        for i in range(0, len(changes), 2):
+            file_id = changes[i]
+            lines = changes[i + 1]
+            file_score[file_id] += decay * (1 + math.log10(1 + lines))
+            file_lines[file_id] += lines
+            file_commits[file_id] += 1
+            if timestamp > file_last[file_id]:
+                file_last[file_id] = timestamp
+
+    dir_ids = {}
+    dir_score = array('d')
+    for file_id, path in enumerate(files):
+        score = file_score[file_id]
+        if not score:
+            continue
+        end = path.rfind('/')
+        while end > 0:
+            directory = path[:end]
+            dir_id = dir_ids.get(directory)
+            if dir_id is None:
+                dir_id = dir_ids[directory] = len(dir_score)
+                dir_score.append(0.0)
+            dir_score[dir_id] += score
+            end = path.rfind('/', 0, end)
+
+    return {
+        'files': files,
+        'file_score': file_score,
+        'file_lines': file_lines,
+        'file_commits': file_commits,
+        'file_last': file_last,
+        'dirs': list(dir_ids),
+        'dir_score': dir_score,
+        'newest': newest,
+    }
+
+def get_hotspots(repo_path, window=DEFAULT_WINDOW, half_life_days=HALF_LIFE_DAYS, cache_dir=CACHE_DIR):
+    """Hotspot aggregates for a repo (see compute_hotspots); empty arrays for repos without commits"""
+    history = load_history(repo_path, window, cache_dir)
+    files, commits = history if history else ([], [])
+    return compute_hotspots(files, commits, half_life_days)
+
+def file_scores(hotspots):
+    """Map path -> hotspot score for files with any activity"""
+    return {
+        path: score for path, score in zip(hotspots['files'], hotspots['file_score']) if score
+    }
+
+def top_files(hotspots, top=DEFAULT_TOP, existing=None):
+    """Return the top file ids by score, optionally only files in the existing set"""
+    ids = [
+        i for i, score in enumerate(hotspots['file_score'])
+        if score and (existing is None or hotspots['files'][i] in existing)
+    ]
+    ids.sort(key=lambda i: -hotspots['file_score'][i])
+    return ids[:top]
+
+def top_dirs(hotspots, top=DEFAULT_TOP):
+    """Return the top directory ids by score"""
+    return sorted(range(len(hotspots['dirs'])), key=lambda i: -hotspots['dir_score'][i])[:top]
+
+def format_age(seconds):
+    """Format an age in seconds as hours or days"""
+    hours = seconds / 3600
+    return f"{hours:.0f}h" if hours < 48 else f"{hours / 24:.0f}d"
+
+def generate_hotspot_report(hotspots, top=DEFAULT_TOP, existing=None):
+    """Render the top files and directories as markdown"""
+    md = "| Score | File | Commits | Lines | Last change |\n|-------|------|---------|-------|-------------|\n"
+    for i in top_files(hotspots, top, existing):
+        age = format_age(hotspots['newest'] - hotspots['file_last'][i])
+        md += (f"| {hotspots['file_score'][i]:.1f} | `{hotspots['files'][i]}` | "
+               f"{hotspots['file_commits'][i]} | {hotspots['file_lines'][i]:,} | {age} before HEAD |\n")
+    md += "\n| Score | Directory |\n|-------|-----------|\n"
+    for i in top_dirs(hotspots, top):
+        md += f"| {hotspots['dir_score'][i]:.1f} | `{hotspots['dirs'][i]}/` |\n"
+    return md
+
+def main():
+    args = []
+    window = DEFAULT_WINDOW
+    top = DEFAULT_TOP
+    argv = sys.argv[1:]
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--window' and argv and argv[0].isdigit():
+            window = max(1, int(argv.pop(0)))
+        elif arg == '--top' and argv and argv[0].isdigit():
+            top = int(argv.pop(0))
+        elif arg.startswith('--'):
+            args = []
+            break
+        else:
+            args.append(arg)
+
+    if len(args) != 1:
+        print("Usage: python3.11 hotspots.py <repo_path> [--window <commits>] [--top <n>]")
+        print("Example: python3.11 hotspots.py /home/ubuntu/repos/dojo-genesis --window 500")
+        sys.exit(1)
+
+    repo_path = args[0]
+    if not Path(repo_path).is_dir():
+        print(f"❌ Error: {repo_path} is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    hotspots = get_hotspots(repo_path, window)
+    print(f"# Hotspots: {Path(repo_path).resolve().name} (last {window} commits)\n")
+    if not hotspots['files']:
+        print("No history found.")
+        return
+    # Only rank files that still exist at HEAD
+    tracked = git_output(repo_path, ["git", "-c", "core.quotepath=off", "ls-files"]) or ''
+    print(generate_hotspot_report(hotspots, top, set(tracked.split('\n'))))
+
+if __name__ == "__main__":
+    main()
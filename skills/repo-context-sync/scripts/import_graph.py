@@ -0,0 +1,318 @@
+#!/usr/bin/env python3.11
+"""
+import_graph.py - Cached import dependency graph for Python and TS/JS files
+Usage: python3.11 import_graph.py <repo_path> [file...] [--rev <commit>]
+Example: python3.11 import_graph.py /home/ubuntu/repos/dojo-genesis src/agent/router.ts
+
+Python imports are read with ast; TS/JS `import`/`export ... from`,
+`import()` and `require()` specifiers with a relative path are resolved to
+files. The graph is stored as compact adjacency arrays (CSR: per-file offsets
+into one targets array) keyed by integer file ID.
+
+The graph is cached in ~/.cache/repo-imports/ together with each file's blob
+id and raw import specifiers. Later runs only parse files whose blob changed;
+if no file was added, removed or changed, the cached edges are reused as-is.
+Blobs are read from the index (or --rev) through git_blobs.BlobReader.
+
+With file arguments, prints the one-hop neighbors of those files ranked by
+in-degree; otherwise prints the most imported files.
+"""
+
+import re
+import ast
+import sys
+import json
+import posixpath
+import subprocess
+from array import array
+from pathlib import Path
+
+from git_blobs import BlobReader
+from hotspots import cache_path_for
+from report_store import atomic_write
+
+CACHE_DIR = Path.home() / ".cache" / "repo-imports"
+# Bump when parsing or resolution changes so stale graphs are discarded
+CACHE_VERSION = 1
+DEFAULT_NEIGHBORS = 15
+
+PYTHON_EXTENSIONS = ('.py',)
+SCRIPT_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs')
+SCRIPT_IMPORT = re.compile(
+    r'''(?:\bimport\s+(?:[\w*${}\s,]+?\s+from\s+)?|\bexport\s+[\w*${}\s,]+?\s+from\s+|\brequire\s*\(\s*|\bimport\s*\(\s*)['"]([^'"\n]+)['"]'''
+)
+
+def list_source_blobs(repo_path, rev=None):
+    """Return [(path, blob_id)] for Python and TS/JS files in the index, or at rev"""
+    if rev:
+        command = ["git", "ls-tree", "-r", "-z", "--full-tree", rev]
+    else:
+        command = ["git", "ls-files", "-s", "-z"]
+    try:
+        result = subprocess.run(command, cwd=repo_path, capture_output=True, check=True)
+    except subprocess.CalledProcessError:
+        return []
+    blobs = []
+    for entry in result.stdout.decode('utf-8', errors='replace').split('\0'):
+        if not entry:
+            continue
+        meta, path = entry.split('\t', 1)
+        if path.endswith(PYTHON_EXTENSIONS + SCRIPT_EXTENSIONS):
+            # ls-files -s: "<mode> <blob> <stage>"; ls-tree: "<mode> blob <blob>"
+            fields = meta.split()
+            blobs.append((path, fields[2] if rev else fields[1]))
+    return blobs
+
+def parse_python_imports(source):
+    """Return import specifiers as "<level>:<module>" strings (level counts leading dots)
+
+    For `from pkg import name`, "pkg.name" is listed as well since name may be
+    a submodule.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+    specs = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            specs.extend(f"0:{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ''
+            specs.append(f"{node.level}:{module}")
+            for alias in node.names:
+                if alias.name != '*':
+                    specs.append(f"{node.level}:{module}.{alias.name}" if module else f"{node.level}:{alias.name}")
+    return specs
+
+def parse_script_imports(source):
+    """Return relative import/require specifiers from TS/JS source"""
+    return [spec for spec in SCRIPT_IMPORT.findall(source) if spec.startswith('.')]
+
+def parse_imports(path, data):
+    """Parse raw import specifiers from a blob based on its extension"""
+    text = data.decode('utf-8', errors='replace')
+    if path.endswith(PYTHON_EXTENSIONS):
+        return parse_python_imports(text)
+    return parse_script_imports(text)
+
+def build_module_index(files):
+    """Map dotted module names (full path and every shorter suffix) to Python file IDs
+
+    Suffixes let `import pkg.mod` resolve under a source root like src/;
+    a suffix claimed by several files maps to None (ambiguous).
+    """
+    modules = {}
+    for file_id, path in enumerate(files):
+        if not path.endswith('.py'):
+            continue
+        parts = path[:-3].split('/')
+        if parts[-1] == '__init__':
+            parts = parts[:-1]
+        for start in range(len(parts)):
+            name = '.'.join(parts[start:])
+            if not name:
+                continue
+            modules[name] = file_id if modules.get(name, file_id) == file_id else None
+    return modules
+
+def resolve_python(spec, importer, file_ids, modules):
+    """Resolve a "<level>:<module>" specifier to a file ID, or None"""
+    level, module = spec.split(':', 1)
+    level = int(level)
+    directory = posixpath.dirname(importer)
+    if level:
+        # Relative import: climb level - 1 packages from the importer's directory
+        for _ in range(level - 1):
+            directory = posixpath.dirname(directory)
+        base = posixpath.join(directory, *module.split('.')) if module else directory
+        return file_ids.get(base + '.py', file_ids.get(posixpath.join(base, '__init__.py')))
+
+    # Sibling modules first (scripts importing each other), then the module index
+    sibling = posixpath.join(directory, *module.split('.'))
+    found = file_ids.get(sibling + '.py', file_ids.get(posixpath.join(sibling, '__init__.py')))
+    if found is None:
+        found = modules.get(module)
+    return found
+
+SCRIPT_SUFFIXES = ('', '.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs',
+                   '/index.ts', '/index.tsx', '/index.js', '/index.jsx')
+
+def resolve_script(spec, importer, file_ids):
+    """Resolve a relative TS/JS specifier to a file ID, or None"""
+    base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+    for suffix in SCRIPT_SUFFIXES:
+        found = file_ids.get(base + suffix)
+        if found is not None:
+            return found
+    # ESM TypeScript imports name the compiled file: "./x.js" -> x.ts
+    stem, ext = posixpath.splitext(base)
+    if ext in ('.js', '.jsx', '.mjs', '.cjs'):
+        for suffix in ('.ts', '.tsx', '.mts', '.cts'):
+            found = file_ids.get(stem + suffix)
+            if found is not None:
+                return found
+    return None
+
+def resolve_edges(files, specs):
+    """Resolve raw specifiers into CSR adjacency arrays (offsets, targets)"""
+    file_ids = {path: i for i, path in enumerate(files)}
+    modules = build_module_index(files)
+    offsets = array('l', [0])
+    targets = array('l')
+    for file_id, path in enumerate(files):
+        seen = set()
+        is_python = path.endswith(PYTHON_EXTENSIONS)
+        for spec in specs[file_id]:
+            if is_python:
+                target = resolve_python(spec, path, file_ids, modules)
+            else:
+                target = resolve_script(spec, path, file_ids)
+            if target is not None and target != file_id and target not in seen:
+                seen.add(target)
+                targets.append(target)
+        offsets.append(len(targets))
+    return offsets, targets
+
+def load_cache(cache_file):
+    """Load a cached graph (None if missing, corrupt or from another version)"""
+    try:
+        cache = json.loads(Path(cache_file).read_text())
+        if cache.get('version') == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return None
+
+def save_cache(cache_file, graph):
+    """Write the graph atomically"""
+    atomic_write(cache_file, json.dumps({
+        'version': CACHE_VERSION,
+        'files': graph['files'],
+        'blobs': graph['blobs'],
+        'specs': graph['specs'],
+        'offsets': graph['offsets'].tolist(),
+        'targets': graph['targets'].tolist(),
+    }, separators=(',', ':')).encode('utf-8'))
+
+def build_import_graph(repo_path, rev=None, cache_dir=CACHE_DIR):
+    """Build (or load) the import graph for the index, or for rev
+
+    Returns a dict with 'files', 'blobs', 'specs', CSR arrays 'offsets' and
+    'targets', and 'parsed' (number of blobs parsed in this call).
+    """
+    cache_file = cache_path_for(repo_path, cache_dir)
+    cache = load_cache(cache_file)
+    current = list_source_blobs(repo_path, rev)
+    files = [path for path, _ in current]
+    blobs = [blob for _, blob in current]
+
+    if cache and cache['files'] == files and cache['blobs'] == blobs:
+        return {
+            'files': files,
+            'blobs': blobs,
+            'specs': cache['specs'],
+            'offsets': array('l', cache['offsets']),
+            'targets': array('l', cache['targets']),
+            'parsed': 0,
+        }
+
+    known = {}
+    if cache:
+        known = {blob: specs for blob, specs in zip(cache['blobs'], cache['specs'])}
+    missing = [(blob, path) for path, blob in current if blob not in known]
+    if missing:
+        with BlobReader(repo_path) as reader:
+            contents = reader.read_many([(blob, None) for blob, _ in missing])
+        for (blob, path), data in zip(missing, contents):
+            known[blob] = parse_imports(path, data) if data is not None else []
+
+    specs = [known[blob] for blob in blobs]
+    offsets, targets = resolve_edges(files, specs)
+    graph = {
+        'files': files,
+        'blobs': blobs,
+        'specs': specs,
+        'offsets': offsets,
+        'targets': targets,
+        'parsed': len(missing),
+    }
+    save_cache(cache_file, graph)
+    return graph
+
+def in_degrees(graph):
+    """Return an array with the number of files importing each file"""
+    degrees = array('l', bytes(array('l').itemsize * len(graph['files'])))
+    for target in graph['targets']:
+        degrees[target] += 1
+    return degrees
+
+def one_hop_neighbors(graph, paths, limit=DEFAULT_NEIGHBORS):
+    """Files imported by or importing any of paths, ranked by in-degree
+
+    Returns [(path, in_degree)] excluding paths themselves, at most limit entries.
+    """
+    file_ids = {path: i for i, path in enumerate(graph['files'])}
+    seeds = {file_ids[p] for p in paths if p in file_ids}
+    if not seeds:
+        return []
+    offsets = graph['offsets']
+    targets = graph['targets']
+    neighbors = set()
+    for file_id in range(len(graph['files'])):
+        edges = targets[offsets[file_id]:offsets[file_id + 1]]
+        if file_id in seeds:
+            neighbors.update(edges)
+        elif not seeds.isdisjoint(edges):
+            neighbors.add(file_id)
+    neighbors -= seeds
+
+    degrees = in_degrees(graph)
+    ranked = sorted(neighbors, key=lambda i: (-degrees[i], graph['files'][i]))
+    return [(graph['files'][i], degrees[i]) for i in ranked[:limit]]
+
+def main():
+    args = []
+    rev = None
+    argv = sys.argv[1:]
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--rev' and argv:
+            rev = argv.pop(0)
+        elif arg.startswith('--'):
+            args = []
+            break
+        else:
+            args.append(arg)
+
+    if not args:
+        print("Usage: python3.11 import_graph.py <repo_path> [file...] [--rev <commit>]")
+        print("Example: python3.11 import_graph.py /home/ubuntu/repos/dojo-genesis src/agent/router.ts")
+        sys.exit(1)
+
+    repo_path, paths = args[0], args[1:]
+    if not Path(repo_path).is_dir():
+        print(f"❌ Error: {repo_path} is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    graph = build_import_graph(repo_path, rev)
+    print(f"🔗 {len(graph['files'])} source files, {len(graph['targets'])} imports "
+          f"({graph['parsed']} files parsed, rest cached)\n")
+
+    if paths:
+        neighbors = one_hop_neighbors(graph, paths)
+        print(f"## Neighbors of {', '.join(paths)}\n")
+        for path, degree in neighbors:
+            print(f"- `{path}` (imported by {degree})")
+        if not neighbors:
+            print("No imports found.")
+    else:
+        degrees = in_degrees(graph)
+        ranked = sorted(range(len(degrees)), key=lambda i: -degrees[i])[:DEFAULT_NEIGHBORS]
+        print("## Most Imported Files\n")
+        for i in ranked:
+            if degrees[i]:
+                print(f"- `{graph['files'][i]}` (imported by {degrees[i]})")
+
+if __name__ == "__main__":
+    main()
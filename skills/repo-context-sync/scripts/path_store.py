@@ -0,0 +1,298 @@
+#!/usr/bin/env python3.11
+"""
+path_store.py - Compact trie of repo paths with integer node IDs
+Usage: python3.11 path_store.py <repo_path> [--untracked]
+Example: python3.11 path_store.py /home/ubuntu/repos/monorepo
+
+Used by context_mapper.py for tree rendering, keyword-hit scoring and
+language detection. Instead of a string and a dict per file, every path
+component is interned once and the trie is kept in parallel arrays:
+
+    parent[node], name[node], ext[node]     one int each
+    child_start[node]..child_start[node+1]  slice of children[] (dirs first, by name)
+    end[node]                               subtree is the ID range [node, end[node])
+    file_count[node], total_bytes[node]     prefix sums over the ID range
+
+Node 0 is the repo root. IDs are final once freeze() has renumbered the trie
+in depth-first order; before that only add() may be called. Running the
+script loads the tracked files of a repo and prints the store's footprint.
+"""
+
+import sys
+import time
+import subprocess
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate, compress, repeat
+from operator import not_
+from pathlib import Path
+
+ROOT = 0
+NO_EXT = '(none)'
+
+def file_extension(name):
+    """Extension used for aggregate summaries (NO_EXT for extensionless and dot files)"""
+    return name[name.rfind('.'):] if '.' in name[1:] else NO_EXT
+
+class PathStore:
+    """Repo paths interned into a trie of parallel arrays (see module docstring)"""
+
+    def __init__(self):
+        self.names = []
+        self.exts = []
+        self.parent = array('i', [-1])
+        self.name = array('i', [-1])
+        self.ext = array('i', [-1])
+        self.is_dir = bytearray(b'\x01')
+        self.frozen = False
+        # Build-time only: component and extension interning, (parent, name) -> directory
+        self._name_ids = {}
+        self._ext_ids = {}
+        self._dirs = {}
+        self._sizes = array('q', [0])
+        self._last_dir, self._last_node = '', ROOT
+        self._ext_cache = {}
+
+    def __len__(self):
+        """Number of files"""
+        if self.frozen:
+            return self.file_count[len(self.parent)]
+        return len(self.parent) - len(self._dirs) - 1
+
+    def _intern(self, table, values, value):
+        value_id = table.get(value)
+        if value_id is None:
+            value_id = table[value] = len(values)
+            values.append(value)
+        return value_id
+
+    def _new_node(self, parent, name_id, is_dir, ext_id, size):
+        self.parent.append(parent)
+        self.name.append(name_id)
+        self.ext.append(ext_id)
+        self.is_dir.append(is_dir)
+        self._sizes.append(size)
+        return len(self.parent) - 1
+
+    def add(self, path, size=0):
+        """Add a file by repo-relative path ('/'-separated); each file must be added once"""
+        if self.frozen:
+            raise ValueError("PathStore is frozen")
+        directory, _, leaf = path.rpartition('/')
+        # Git and os.walk list a directory's files together, so the last one usually repeats
+        if directory == self._last_dir:
+            node = self._last_node
+        else:
+            node = ROOT
+            if directory:
+                for part in directory.split('/'):
+                    name_id = self._intern(self._name_ids, self.names, part)
+                    key = (node << 32) | name_id
+                    child = self._dirs.get(key)
+                    if child is None:
+                        child = self._dirs[key] = self._new_node(node, name_id, 1, -1, 0)
+                    node = child
+            self._last_dir, self._last_node = directory, node
+        self._new_node(node, self._intern(self._name_ids, self.names, leaf), 0,
+                       self._intern(self._ext_ids, self.exts, file_extension(leaf)), size)
+
+    def freeze(self):
+        """Renumber nodes depth-first (dirs first, then by name), build the indexes and drop build state
+
+        Only directories are visited in Python; per-file work is done by
+        sort, map and accumulate over the arrays.
+        """
+        if self.frozen:
+            return self
+        count = len(self.parent)
+        parents, name, ext, is_dir = self.parent, self.name, self.ext, self.is_dir
+        dirs = [ROOT] + list(self._dirs.values())
+
+        # Rank every node by its name so siblings sort with a C-level key
+        name_order = sorted(range(len(self.names)), key=self.names.__getitem__)
+        name_rank = array('i', bytes(4 * len(self.names)))
+        for rank, name_id in enumerate(name_order):
+            name_rank[name_id] = rank
+        node_rank = array('i', map(name_rank.__getitem__, name[1:]))
+        node_rank.insert(0, -1)
+
+        # Children grouped by parent (stable), then split into subdirs and files by name
+        grouped = sorted(range(1, count), key=parents.__getitem__)
+        split = {}
+        lo = 0
+        for directory in sorted(dirs):
+            hi = bisect_left(grouped, directory + 1, lo, key=parents.__getitem__)
+            kids = sorted(grouped[lo:hi], key=node_rank.__getitem__)
+            flags = list(map(is_dir.__getitem__, kids))
+            split[directory] = (list(compress(kids, flags)), list(compress(kids, map(not_, flags))))
+            lo = hi
+        del grouped
+
+        # Depth-first numbering: a directory, its subdirectory subtrees, then its files
+        old_of = array('i')
+        new_parent = array('i')
+        stack = [(ROOT, -1, False)]
+        while stack:
+            directory, parent, files_only = stack.pop()
+            subdirs, files = split[directory]
+            if files_only:
+                old_of.extend(files)
+                new_parent.extend(repeat(parent, len(files)))
+                continue
+            new = len(old_of)
+            old_of.append(directory)
+            new_parent.append(parent)
+            stack.append((directory, new, True))
+            stack.extend((d, new, False) for d in reversed(subdirs))
+        del split
+
+        sizes = self._sizes
+        self.parent = new_parent
+        self.name = array('i', map(name.__getitem__, old_of))
+        self.ext = array('i', map(ext.__getitem__, old_of))
+        self.is_dir = bytearray(map(is_dir.__getitem__, old_of))
+        self.total_bytes = array('q', accumulate(map(sizes.__getitem__, old_of), initial=0))
+        self.file_count = array('i', accumulate(map(not_, self.is_dir), initial=0))
+        del old_of
+
+        # Children of each node are a slice of children[], in depth-first (= name) order
+        self.children = array('i', sorted(range(1, count), key=new_parent.__getitem__))
+        child_counts = [0] * count
+        for parent, n in Counter(new_parent[1:]).items():
+            child_counts[parent] = n
+        self.child_start = array('i', accumulate(child_counts, initial=0))
+        self.end = array('i', range(1, count + 1))
+        for directory in reversed(list(compress(range(count), self.is_dir))):
+            last = self.child_start[directory + 1]
+            if last > self.child_start[directory]:
+                self.end[directory] = self.end[self.children[last - 1]]
+
+        self._name_ids = self._ext_ids = self._dirs = self._sizes = self._last_dir = None
+        self.frozen = True
+        return self
+
+    def basename(self, node):
+        return self.names[self.name[node]] if node != ROOT else ''
+
+    def path(self, node):
+        """Repo-relative path of a node"""
+        parts = []
+        while node > ROOT:
+            parts.append(self.names[self.name[node]])
+            node = self.parent[node]
+        return '/'.join(reversed(parts))
+
+    def child_ids(self, node):
+        return self.children[self.child_start[node]:self.child_start[node + 1]]
+
+    def files(self, node):
+        """Number of files in a node's subtree (1 for a file)"""
+        return self.file_count[self.end[node]] - self.file_count[node]
+
+    def size(self, node):
+        """Bytes of a file, or of all files under a directory"""
+        return self.total_bytes[self.end[node]] - self.total_bytes[node]
+
+    def ext_counts(self, node, cache=True):
+        """Counter of file extensions under a node (kept per node unless cache is False)"""
+        counts = self._ext_cache.get(node)
+        if counts is None:
+            counts = Counter()
+            for ext_id, n in Counter(self.ext[node:self.end[node]]).items():
+                if ext_id >= 0:
+                    counts[self.exts[ext_id]] = n
+            if cache:
+                self._ext_cache[node] = counts
+        return counts
+
+    def lookup(self, path):
+        """Node ID of a repo-relative path, or None"""
+        node = ROOT
+        parts = path.split('/')
+        last = len(parts) - 1
+        for i, part in enumerate(parts):
+            lo, hi = self.child_start[node], self.child_start[node + 1]
+            found = None
+            # Children are sorted (dirs first, name); intermediate parts can only be dirs
+            for want_file in ((False,) if i < last else (True, False)):
+                target = (want_file, part)
+                slot = bisect_left(self.children, target, lo, hi,
+                                   key=lambda c: (not self.is_dir[c], self.names[self.name[c]]))
+                if slot < hi and self.names[self.name[self.children[slot]]] == part \
+                        and (not self.is_dir[self.children[slot]]) == want_file:
+                    found = self.children[slot]
+                    break
+            if found is None:
+                return None
+            node = found
+        return node
+
+    def file_ids(self):
+        """IDs of every file, in depth-first order"""
+        is_dir = self.is_dir
+        return (node for node in range(len(self.parent)) if not is_dir[node])
+
+    def nbytes(self):
+        """Approximate memory held by the store (arrays, interned strings and the names lists)"""
+        total = sum(sys.getsizeof(s) for s in self.names) + sum(sys.getsizeof(s) for s in self.exts)
+        total += sys.getsizeof(self.names) + sys.getsizeof(self.exts)
+        for values in (self.parent, self.name, self.ext, self.is_dir):
+            total += sys.getsizeof(values)
+        if self.frozen:
+            for values in (self.child_start, self.children, self.end, self.file_count, self.total_bytes):
+                total += sys.getsizeof(values)
+        return total
+
+def build_path_store(entries):
+    """Build a frozen store from (path, size) pairs"""
+    store = PathStore()
+    for path, size in entries:
+        store.add(path, size)
+    return store.freeze()
+
+def stream_z(command, cwd):
+    """Yield the NUL-separated records of a command's stdout without holding all of it"""
+    process = subprocess.Popen(command, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    pending = b''
+    while True:
+        chunk = process.stdout.read(256 * 1024)
+        if not chunk:
+            break
+        records = (pending + chunk).split(b'\0')
+        pending = records.pop()
+        for record in records:
+            if record:
+                yield record.decode('utf-8', errors='replace')
+    if pending:
+        yield pending.decode('utf-8', errors='replace')
+    process.wait()
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if len(args) != 1:
+        print("Usage: python3.11 path_store.py <repo_path> [--untracked]")
+        print("Example: python3.11 path_store.py /home/ubuntu/repos/monorepo")
+        sys.exit(1)
+
+    command = ["git", "ls-files", "-z", "--cached"]
+    if '--untracked' in sys.argv:
+        command += ["--others", "--exclude-standard"]
+    started = time.perf_counter()
+    store = PathStore()
+    previous = None
+    for path in stream_z(command, args[0]):
+        # Unmerged index entries repeat a path once per stage
+        if path != previous:
+            store.add(path)
+        previous = path
+    store.freeze()
+    elapsed = (time.perf_counter() - started) * 1000
+
+    nodes = len(store.parent)
+    print(f"📂 {Path(args[0]).resolve().name}: {len(store):,} files, {nodes - len(store):,} directories")
+    print(f"   {len(store.names):,} distinct names, {len(store.exts):,} extensions")
+    print(f"   ~{store.nbytes() / (1024 * 1024):.1f} MB in the store, built in {elapsed:.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3.11
+"""
+repo_markers.py - File names and prefixes that identify languages, frameworks and planning docs
+
+Shared by context_mapper.py (pattern detection) and sparse_planner.py
+(project roots and planning directories). Only constants, so importing it
+costs nothing.
+"""
+
+LANGUAGE_EXTENSIONS = ['.py', '.js', '.ts', '.tsx', '.jsx', '.go', '.rs', '.java', '.rb']
+
+# Config files that mark a framework (and, in sparse_planner.py, a project root)
+FRAMEWORK_MARKERS = {
+    'package.json': 'Node.js',
+    'requirements.txt': 'Python',
+    'Cargo.toml': 'Rust',
+    'go.mod': 'Go',
+    'next.config.js': 'Next.js',
+    'vite.config.ts': 'Vite',
+    'tsconfig.json': 'TypeScript'
+}
+# Numbered planning directories such as 00_Roadmap/ or 02_Specs/
+STRUCTURE_PREFIXES = ('00_', '01_', '02_', '03_', '04_', '05_')
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3.11
+"""
+semantic_diff.py - Function/class-level change summary between two commits
+Usage: python3.11 semantic_diff.py <repo_path> <from_commit> [to_commit]
+Example: python3.11 semantic_diff.py /home/ubuntu/repos/dojo-genesis HEAD~10
+
+For changed .py files (parsed with ast) and .ts/.tsx/.js/.jsx files (scanned
+for functions, classes, class methods and arrow-function constants), reports
+added, removed and modified symbols, and whether a signature changed.
+
+Symbols are cached per blob hash and file extension (which picks the
+extractor) in ~/.diff-symbol-cache.json, so a blob is parsed once no matter
+how many syncs see it, and cached blobs are not even read. Blobs come from git_blobs.BlobReader, never the working tree.
+"""
+
+import re
+import ast
+import sys
+import json
+import hashlib
+import subprocess
+from contextlib import nullcontext
+from bisect import bisect_right
+from pathlib import Path
+
+from git_blobs import BlobReader
+from report_store import atomic_write
+
+CACHE_FILE = Path.home() / ".diff-symbol-cache.json"
+# Bump when extraction changes so stale cached symbols are discarded
+CACHE_VERSION = 2
+MAX_CACHED_BLOBS = 20000
+NULL_SHA = "0" * 40
+
+PYTHON_EXTENSIONS = {'.py'}
+SCRIPT_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
+
+def body_hash(text):
+    """Short digest used to detect body changes"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+# --- Python -----------------------------------------------------------------
+
+def python_signature(node):
+    """Render a def/class header without its body"""
+    if isinstance(node, ast.ClassDef):
+        bases = [ast.unparse(b) for b in node.bases] + [ast.unparse(k) for k in node.keywords]
+        return f"class {node.name}" + (f"({', '.join(bases)})" if bases else '')
+    prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns else ''
+    return f"{prefix} {node.name}({ast.unparse(node.args)}){returns}"
+
+def extract_python_symbols(source):
+    """Map qualified names of module-level functions/classes and methods to [kind, signature, body_hash]
+
+    A class's body hash covers its decorators and non-method statements, so
+    editing one method does not also mark the class as modified. Returns None
+    if the source does not parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    symbols = {}
+    functions = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+    def visit(statements, prefix, in_class):
+        for node in statements:
+            if isinstance(node, functions):
+                name = prefix + node.name
+                kind = 'method' if in_class else 'function'
+                symbols[name] = [kind, python_signature(node), body_hash(ast.dump(node))]
+            elif isinstance(node, ast.ClassDef):
+                name = prefix + node.name
+                own = [n for n in node.body if not isinstance(n, functions + (ast.ClassDef,))]
+                digest = body_hash(ast.dump(ast.Module(body=node.decorator_list + own, type_ignores=[])))
+                symbols[name] = ['class', python_signature(node), digest]
+                visit(node.body, name + '.', True)
+
+    visit(tree.body, '', False)
+    return symbols
+
+# --- TypeScript / JavaScript --------------------------------------------------
+
+SCRIPT_CLASS = re.compile(r'^[ \t]*(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+([A-Za-z_$][\w$]*)', re.M)
+SCRIPT_FUNCTION = re.compile(r'^[ \t]*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*([A-Za-z_$][\w$]*)', re.M)
+SCRIPT_ARROW = re.compile(r'^[ \t]*(?:export\s+)?(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*(?::[^=\n]+)?=\s*(?:async\s+)?(?=\(|function\b|[A-Za-z_$][\w$]*\s*=>)', re.M)
+SCRIPT_METHOD = re.compile(r'^[ \t]*(?:(?:public|private|protected|static|async|readonly|override|abstract|get|set)\s+)*\*?([A-Za-z_$][\w$]*)\s*(?:<[^>{;]*>)?\s*\(', re.M)
+NOT_METHODS = {'if', 'for', 'while', 'switch', 'catch', 'return', 'function', 'with', 'super'}
+
+def blank_strings_and_comments(source):
+    """Replace string, template and comment contents with spaces, keeping offsets
+
+    Braces and parentheses inside literals then no longer confuse matching.
+    Regex literals are not recognized; a brace inside one can shift a body end.
+    """
+    out = list(source)
+    i = 0
+    n = len(source)
+    while i < n:
+        c = source[i]
+        if c == '/' and source.startswith('//', i):
+            end = source.find('\n', i)
+            end = n if end == -1 else end
+        elif c == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+        elif c in '"\'`':
+            end = i + 1
+            while end < n and source[end] != c:
+                if source[end] == '\\':
+                    end += 1
+                elif source[end] == '\n' and c != '`':
+                    break
+                end += 1
+            end = min(end + 1, n)
+        else:
+            i += 1
+            continue
+        for j in range(i, end):
+            if out[j] != '\n':
+                out[j] = ' '
+        i = end
+    return ''.join(out)
+
+def match_close(text, start, open_char, close_char):
+    """Index just past the bracket closing the one at text[start], or len(text)"""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == open_char:
+            depth += 1
+        elif text[i] == close_char:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(text)
+
+def extract_script_symbols(source):
+    """Map names of top-level functions/classes, arrow-function constants and class methods to [kind, signature, body_hash]
+
+    A lexical scan, not a parser: good enough to tell which declarations were
+    added, removed or edited.
+    """
+    clean = blank_strings_and_comments(source)
+    line_starts = [0] + [m.end() for m in re.finditer('\n', clean)]
+    line_depths = []
+    depth = 0
+    for i, start in enumerate(line_starts):
+        line_depths.append(depth)
+        end = line_starts[i + 1] if i + 1 < len(line_starts) else len(clean)
+        segment = clean[start:end]
+        depth += segment.count('{') - segment.count('}')
+
+    def depth_at(pos):
+        return line_depths[bisect_right(line_starts, pos) - 1]
+
+    def normalize(text):
+        return ' '.join(text.split())
+
+    def declaration(name, match_end, kind):
+        """Signature and body hash for a declaration whose name ends before match_end"""
+        paren = clean.find('(', match_end - 1)
+        brace = clean.find('{', match_end)
+        if paren == -1 or (brace != -1 and brace < paren):
+            return None
+        params_end = match_close(clean, paren, '(', ')')
+        rest = clean[params_end:]
+        header = re.match(r'\s*(?::\s*([^{;=]*))?(=>)?\s*(\{)?', rest)
+        returns = (header.group(1) or '').strip()
+        signature = f"{name}{normalize(source[paren:params_end])}" + (f": {normalize(returns)}" if returns else '')
+        if header.group(3):
+            body_start = params_end + header.start(3)
+            body_end = match_close(clean, body_start, '{', '}')
+        elif header.group(2):
+            # Expression-bodied arrow function: body runs to the end of the line
+            body_start = params_end + header.end()
+            line_end = clean.find('\n', body_start)
+            body_end = len(clean) if line_end == -1 else line_end
+        else:
+            # Overload or abstract declaration without a body
+            return None
+        return [kind, signature, body_hash(normalize(source[body_start:body_end]))]
+
+    symbols = {}
+    for pattern, kind in ((SCRIPT_FUNCTION, 'function'), (SCRIPT_ARROW, 'function')):
+        for m in pattern.finditer(clean):
+            if depth_at(m.start()) == 0:
+                entry = declaration(m.group(1), m.end(), kind)
+                if entry:
+                    symbols.setdefault(m.group(1), entry)
+
+    for m in SCRIPT_CLASS.finditer(clean):
+        class_depth = depth_at(m.start())
+        if class_depth != 0:
+            continue
+        brace = clean.find('{', m.end())
+        if brace == -1:
+            continue
+        body_end = match_close(clean, brace, '{', '}')
+        name = m.group(1)
+        header = normalize(source[m.start():brace])
+        methods = {}
+        for method in SCRIPT_METHOD.finditer(clean, brace + 1, body_end):
+            method_name = method.group(1)
+            if method_name in NOT_METHODS or depth_at(method.start()) != class_depth + 1:
+                continue
+            entry = declaration(method_name, method.end(), 'method')
+            if entry:
+                methods.setdefault(f"{name}.{method_name}", entry)
+        # The class digest skips method bodies so a method edit is reported once
+        outline = header + ' ' + ' '.join(sorted(entry[1] for entry in methods.values()))
+        symbols[name] = ['class', header.removeprefix('export ').removeprefix('default '), body_hash(outline)]
+        symbols.update(methods)
+    return symbols
+
+def extract_symbols(path, data):
+    """Extract symbols from a blob based on its path's extension (None if unsupported or unparsable)"""
+    suffix = Path(path).suffix
+    text = data.decode('utf-8', errors='replace')
+    if suffix in PYTHON_EXTENSIONS:
+        return extract_python_symbols(text)
+    if suffix in SCRIPT_EXTENSIONS:
+        return extract_script_symbols(text)
+    return None
+
+def supports(path):
+    """Whether symbols can be extracted for a path"""
+    return Path(path).suffix in PYTHON_EXTENSIONS | SCRIPT_EXTENSIONS
+
+# --- Cache and diff ---------------------------------------------------------------
+
+def load_cache(cache_file=CACHE_FILE):
+    """Load the blob -> symbols cache (empty if missing, corrupt or from another version)"""
+    try:
+        cache = json.loads(Path(cache_file).read_text())
+        if cache.get('version') == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {'version': CACHE_VERSION, 'blobs': {}}
+
+def save_cache(cache, cache_file=CACHE_FILE):
+    """Save the cache, keeping only the most recently used MAX_CACHED_BLOBS blobs"""
+    blobs = cache['blobs']
+    if len(blobs) > MAX_CACHED_BLOBS:
+        cache['blobs'] = dict(list(blobs.items())[-MAX_CACHED_BLOBS:])
+    atomic_write(cache_file, json.dumps(cache, separators=(',', ':')).encode('utf-8'))
+
+def get_raw_changes(repo_path, from_commit, to_commit):
+    """List changed files with blob ids from one `git diff --raw` call
+
+    Returns [{'status', 'old_path', 'new_path', 'old_blob', 'new_blob'}];
+    blob ids are None on the missing side of additions and deletions.
+    """
+    result = subprocess.run(
+        ["git", "diff", "--raw", "-z", "--no-abbrev", "-M", f"{from_commit}..{to_commit}"],
+        cwd=repo_path, capture_output=True, check=True
+    )
+    fields = result.stdout.decode('utf-8', errors='replace').split('\0')
+    changes = []
+    i = 0
+    while i < len(fields) - 1:
+        meta = fields[i].split()
+        if len(meta) < 5:
+            i += 1
+            continue
+        status = meta[4][0]
+        old_path = fields[i + 1]
+        if status in 'RC':
+            new_path = fields[i + 2]
+            i += 3
+        else:
+            new_path = old_path
+            i += 2
+        changes.append({
+            'status': status,
+            'old_path': old_path,
+            'new_path': new_path,
+            'old_blob': None if meta[2] == NULL_SHA else meta[2],
+            'new_blob': None if meta[3] == NULL_SHA else meta[3],
+        })
+    return changes
+
+def symbol_key(blob_id, path):
+    """Cache key of a blob's symbols: the same blob under another extension is parsed separately"""
+    return f"{blob_id}{Path(path).suffix}"
+
+def load_symbols(repo_path, blobs, cache, reader=None):
+    """Return {symbol_key: symbols} for (blob_id, path) pairs, parsing only uncached blobs
+
+    Cached entries are moved to the end of the cache so pruning drops the
+    least recently used ones. Uncached blobs are read through reader (an
+    open BlobReader) if given.
+    """
+    cached = cache['blobs']
+    result = {}
+    missing = {}
+    for blob_id, path in blobs:
+        key = symbol_key(blob_id, path)
+        if key in cached:
+            result[key] = cached[key] = cached.pop(key)
+        elif key not in result:
+            missing[key] = (blob_id, path)
+    if missing:
+        with nullcontext(reader) if reader else BlobReader(repo_path) as blob_reader:
+            contents = blob_reader.read_many([(blob_id, None) for blob_id, _ in missing.values()])
+        for (key, (_, path)), data in zip(missing.items(), contents):
+            symbols = extract_symbols(path, data) if data is not None else None
+            result[key] = cached[key] = symbols
+    return result
+
+def compare_symbols(old, new):
+    """Compare two symbol maps; returns {'added', 'removed', 'modified'}
+
+    Modified entries are (name, old_signature, new_signature), where the
+    signatures are equal when only the body changed.
+    """
+    old = old or {}
+    new = new or {}
+    return {
+        'added': [(name, new[name][1]) for name in new if name not in old],
+        'removed': [(name, old[name][1]) for name in old if name not in new],
+        'modified': [
+            (name, old[name][1], new[name][1]) for name in new
+            if name in old and old[name][1:] != new[name][1:]
+        ],
+    }
+
+def summarize_symbol_changes(repo_path, from_commit, to_commit, cache_file=CACHE_FILE, reader=None):
+    """Symbol-level changes for every supported changed file between two commits
+
+    Returns (file_changes, stats): file_changes is a list of dicts with
+    'path', 'old_path', 'status', 'parsed' and the compare_symbols() lists;
+    stats counts files, blobs and cache hits. reader is passed to load_symbols().
+    """
+    raw = [c for c in get_raw_changes(repo_path, from_commit, to_commit)
+           if supports(c['new_path']) or supports(c['old_path'])]
+    wanted = []
+    for c in raw:
+        if c['old_blob']:
+            wanted.append((c['old_blob'], c['old_path']))
+        if c['new_blob']:
+            wanted.append((c['new_blob'], c['new_path']))
+
+    cache = load_cache(cache_file)
+    cached_before = sum(1 for blob_id, path in wanted if symbol_key(blob_id, path) in cache['blobs'])
+    symbols = load_symbols(repo_path, wanted, cache, reader)
+    save_cache(cache, cache_file)
+
+    file_changes = []
+    for c in raw:
+        old = symbols.get(symbol_key(c['old_blob'], c['old_path'])) if c['old_blob'] else {}
+        new = symbols.get(symbol_key(c['new_blob'], c['new_path'])) if c['new_blob'] else {}
+        entry = {
+            'path': c['new_path'],
+            'old_path': c['old_path'],
+            'status': c['status'],
+            # None means a side failed to parse, so the comparison is incomplete
+            'parsed': old is not None and new is not None,
+        }
+        entry.update(compare_symbols(old, new))
+        file_changes.append(entry)
+
+    stats = {'files': len(raw), 'blobs': len(wanted), 'cache_hits': cached_before}
+    return file_changes, stats
+
+def format_symbol_changes(file_changes, max_per_file=20):
+    """Render symbol changes as markdown bullet lists grouped by file"""
+    md = ''
+    for change in file_changes:
+        lines = []
+        for name, signature in change['added']:
+            owner = f" in `{name.rsplit('.', 1)[0]}`" if '.' in name else ''
+            lines.append(f"- ➕ `{signature}`{owner}")
+        for name, _ in change['removed']:
+            lines.append(f"- ➖ `{name}`")
+        for name, old_signature, new_signature in change['modified']:
+            if old_signature != new_signature:
+                lines.append(f"- ✏️ `{name}`: `{old_signature}` → `{new_signature}`")
+            else:
+                lines.append(f"- ✏️ `{name}` (body)")
+        if not change['parsed']:
+            lines.append("- ⚠️ Could not parse one version; symbol list may be incomplete")
+        if not lines:
+            continue
+
+        title = change['path']
+        if change['old_path'] != change['path']:
+            title = f"{change['old_path']} → {change['path']}"
+        md += f"\n### `{title}`\n\n"
+        md += '\n'.join(lines[:max_per_file]) + '\n'
+        if len(lines) > max_per_file:
+            md += f"- ... and {len(lines) - max_per_file} more\n"
+    return md
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python3.11 semantic_diff.py <repo_path> <from_commit> [to_commit]")
+        print("Example: python3.11 semantic_diff.py /home/ubuntu/repos/dojo-genesis HEAD~10")
+        sys.exit(1)
+
+    repo_path = sys.argv[1]
+    from_commit = sys.argv[2]
+    to_commit = sys.argv[3] if len(sys.argv) > 3 else "HEAD"
+
+    try:
+        file_changes, stats = summarize_symbol_changes(repo_path, from_commit, to_commit)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Git command failed: {e.stderr.decode('utf-8', errors='replace').strip()}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"# Symbol Changes: {from_commit}..{to_commit}")
+    print(f"\n{stats['files']} source files, {stats['blobs']} blobs ({stats['cache_hits']} cached)")
+    print(format_symbol_changes(file_changes) or "\nNo function or class changes.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3.11
+"""
+session_bootstrap.py - One bundle with everything a session needs at HEAD
+Usage: python3.11 session_bootstrap.py <repo_path> [focus_keywords...] [--budget <tokens>] [--since <commit>] [--no-cache] [--profile[=<file>]]
+Example: python3.11 session_bootstrap.py /home/ubuntu/repos/dojo-genesis agent routing
+
+Runs the three session-start steps in one process: the context summary at
+HEAD (context_mapper.py, budgeted tree), the changes since the previous
+bundle for this repo (diff_tracker.py) and seed suggestions for the focus
+keywords plus words from the changed paths (seed-library's suggest_seeds.py).
+HEAD is resolved once, the changed paths feed both the diff and the seeds,
+and every blob is read through one shared `git cat-file --batch` process.
+
+The bundle is saved to the report store (see report_store.py) keyed by the
+repo, the HEAD commit and the options, so a later session at the same commit
+gets it back with one key lookup and one file read. The diff runs from the
+newest bundle of this repo at another commit (its merge base with HEAD if it
+is not an ancestor), or from --since, or HEAD~10 for the first bundle.
+--no-cache always regenerates.
+
+--profile writes a per-phase timing and subprocess trace (see profiling.py).
+"""
+
+import re
+import sys
+import time
+import subprocess
+from collections import Counter
+from pathlib import Path
+from datetime import datetime
+
+from git_blobs import BlobReader
+from context_mapper import generate_context_summary
+from diff_tracker import (DIGEST_THRESHOLD, run_git_command, get_commit_info, get_diff_summary,
+                          summarize_range, generate_digest_summary)
+from commit_digest import build_digest
+from profiling import init_from_argv, phase
+from report_store import list_records, lookup, save
+
+SEED_SCRIPTS = Path(__file__).resolve().parent.parent.parent / "seed-library" / "scripts"
+DEFAULT_BUDGET = 2000
+PATH_KEYWORDS = 8
+MIN_WORD_LENGTH = 4
+
+# Path words that say nothing about what a change is for
+PATH_NOISE = {
+    'src', 'lib', 'libs', 'test', 'tests', 'spec', 'specs', 'index', 'main', 'init', 'utils', 'util',
+    'common', 'core', 'docs', 'readme', 'json', 'yaml', 'toml', 'lock', 'package', 'packages',
+    'scripts', 'script', 'config', 'internal', 'components', 'component', 'types', 'dist', 'build',
+    'node', 'modules', 'vendor', 'assets', 'public', 'private', 'helpers', 'services', 'apps',
+}
+
+WORD_RE = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?![a-z])')
+HEADING_RE = re.compile(r'^(#{1,5}) ')
+
+def load_seed_library():
+    """Import seed-library's suggest_seeds module, or None if that skill is not installed"""
+    if not (SEED_SCRIPTS / "suggest_seeds.py").is_file():
+        return None
+    if str(SEED_SCRIPTS) not in sys.path:
+        sys.path.append(str(SEED_SCRIPTS))
+    import suggest_seeds
+    return suggest_seeds
+
+def git_output(repo_path, args):
+    """Stripped stdout of a git command, or None if it fails"""
+    result = subprocess.run(["git"] + args, cwd=repo_path, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def resolve_commit(repo_path, rev):
+    """Full hash of a commit-ish, or None if it does not name a commit"""
+    return git_output(repo_path, ["rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"])
+
+def default_since(repo_path):
+    """HEAD~10, or the root commit for shorter histories (as diff_tracker.py does)"""
+    return resolve_commit(repo_path, "HEAD~10") or \
+        run_git_command(repo_path, ["git", "rev-list", "--max-parents=0", "HEAD"]).split('\n')[0]
+
+def previous_bundle(repo_path, repo, head):
+    """(commit, base) of the newest bundle for repo at another commit, or None
+
+    base is the bundle's commit if it is an ancestor of head, else their
+    merge base; bundles whose commit is gone (or unrelated) are skipped.
+    """
+    records = [r for _, r, _ in list_records(kind='bootstrap')
+               if r['inputs'].get('repo') == repo and r['inputs'].get('commit') != head]
+    for record in sorted(records, key=lambda r: r['created'], reverse=True):
+        commit = record['inputs']['commit']
+        if not resolve_commit(repo_path, commit):
+            continue
+        base = git_output(repo_path, ["merge-base", commit, head])
+        if base:
+            return commit, base
+    return None
+
+def path_keywords(changes, limit=PATH_KEYWORDS):
+    """Most frequent words in the changed files' names and parent dirs, skipping short and generic ones
+
+    Only the last two path components are used: top-level directories say
+    where a change is, not what it is about.
+    """
+    counts = Counter()
+    for paths in changes.values():
+        for path in paths:
+            words = {w.lower() for w in WORD_RE.findall('/'.join(path.split('/')[-2:]))}
+            counts.update(w for w in words if len(w) >= MIN_WORD_LENGTH and w not in PATH_NOISE)
+    return [word for word, _ in sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]]
+
+def demote_headings(markdown):
+    """Push every heading down one level, leaving fenced code blocks alone"""
+    lines = []
+    fenced = False
+    for line in markdown.split('\n'):
+        if line.startswith('```'):
+            fenced = not fenced
+        elif not fenced and HEADING_RE.match(line):
+            line = '#' + line
+        lines.append(line)
+    return '\n'.join(lines)
+
+def diff_stage(repo_path, since, head, changes, reader):
+    """Changes since the previous bundle: the full summary, or a digest for long ranges"""
+    if since == head:
+        return f"# Changes\n\nNo commits since `{since[:7]}`.\n"
+    commit_count = int(run_git_command(repo_path, ["git", "rev-list", "--count", f"{since}..{head}"]))
+    if commit_count > DIGEST_THRESHOLD:
+        print(f"📚 {commit_count:,} commits: summarizing as a digest")
+        with phase("digest"):
+            return generate_digest_summary(repo_path, since, head, build_digest(repo_path, since, head))
+    markdown, _ = summarize_range(repo_path, since, head, changes, reader)
+    return markdown
+
+def seed_stage(seeds, keywords):
+    """Seed suggestions for the combined keywords, or a note when there are none to give"""
+    if seeds is None:
+        return "# Seed Suggestions\n\nseed-library is not installed next to this skill.\n"
+    if not keywords:
+        return "# Seed Suggestions\n\nNo keywords given and no changed paths to derive them from.\n"
+    with phase("score_seeds"):
+        suggestions = seeds.suggest_seeds(keywords)
+    with phase("render"):
+        return seeds.generate_markdown_output(keywords, suggestions)
+
+def build_bundle(repo_path, head, keywords, token_budget, since, since_note, seeds):
+    """Generate the bundle markdown; returns (markdown, timings in ms per stage)"""
+    timings = {}
+    with BlobReader(repo_path) as reader:
+        started = time.perf_counter()
+        with phase("changed_paths"):
+            changes = get_diff_summary(repo_path, since, head) if since != head else \
+                {'added': [], 'modified': [], 'deleted': [], 'renamed': []}
+        diff_md = diff_stage(repo_path, since, head, changes, reader)
+        timings['diff'] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        context_md = generate_context_summary(repo_path, keywords, 'git', token_budget, head, reader=reader)
+        timings['context'] = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    derived = [w for w in path_keywords(changes) if w not in keywords]
+    seed_md = seed_stage(seeds, keywords + derived)
+    timings['seeds'] = (time.perf_counter() - started) * 1000
+
+    info = get_commit_info(repo_path, head)
+    changed = sum(len(paths) for paths in changes.values())
+    md = f"""# Session Bootstrap: {Path(repo_path).resolve().name}
+
+**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Commit:** `{head[:7]}` - {info['message'] if info else 'Unknown'}
+**Since:** `{since[:7]}` ({since_note}), {changed} files changed
+**Focus Keywords:** {', '.join(keywords) if keywords else 'None'}
+**Path Keywords:** {', '.join(derived) if derived else 'None'}
+
+"""
+    md += '\n'.join(demote_headings(part).rstrip('\n') + '\n' for part in (context_md, diff_md, seed_md))
+    return md, timings
+
+def main():
+    init_from_argv(sys.argv)
+    args = sys.argv[1:]
+    use_cache = True
+    token_budget = DEFAULT_BUDGET
+    since_arg = None
+    positional = []
+    while args:
+        arg = args.pop(0)
+        if arg == '--no-cache':
+            use_cache = False
+        elif arg == '--budget' and args:
+            token_budget = int(args.pop(0))
+        elif arg == '--since' and args:
+            since_arg = args.pop(0)
+        else:
+            positional.append(arg)
+
+    if not positional:
+        print("Usage: python3.11 session_bootstrap.py <repo_path> [focus_keywords...] [--budget <tokens>] [--since <commit>] [--no-cache] [--profile[=<file>]]")
+        print("Example: python3.11 session_bootstrap.py /home/ubuntu/repos/dojo-genesis agent routing")
+        sys.exit(1)
+
+    repo_path = positional[0]
+    keywords = [k.lower() for k in positional[1:]]
+
+    if not (Path(repo_path) / ".git").exists():
+        print(f"❌ Error: {repo_path} is not a git repository", file=sys.stderr)
+        sys.exit(1)
+
+    with phase("resolve_commits"):
+        head = resolve_commit(repo_path, "HEAD")
+        if not head:
+            print(f"❌ Error: {repo_path} has no commits", file=sys.stderr)
+            sys.exit(1)
+        since = resolve_commit(repo_path, since_arg) if since_arg else None
+        if since_arg and not since:
+            print(f"❌ Error: {since_arg} is not a commit in {repo_path}", file=sys.stderr)
+            sys.exit(1)
+
+    seeds = load_seed_library()
+    repo = str(Path(repo_path).resolve())
+    inputs = {
+        'repo': repo,
+        'commit': head,
+        'keywords': keywords,
+        'budget': token_budget,
+        'since': since,
+        'catalog': seeds.catalog_fingerprint() if seeds else None,
+    }
+    with phase("cache_lookup"):
+        cached = lookup('bootstrap', inputs) if use_cache else None
+    if cached:
+        print(f"♻️  Bundle for {head[:7]} already built: using the stored bundle")
+        print(cached.read_text())
+        print(f"\n✅ Bundle saved to: {cached}")
+        return
+
+    if since:
+        since_note = "--since"
+    else:
+        previous = previous_bundle(repo_path, repo, head)
+        if previous:
+            commit, since = previous
+            since_note = "previous bundle" if commit == since else f"merge base with previous bundle {commit[:7]}"
+        else:
+            since = default_since(repo_path)
+            since_note = "no previous bundle"
+
+    print(f"🚀 Bootstrapping {Path(repo).name} at {head[:7]} (changes since {since[:7]}, {since_note})")
+    if seeds is None:
+        print(f"⚠️  seed-library not found at {SEED_SCRIPTS}: skipping seed suggestions")
+
+    markdown, timings = build_bundle(repo_path, head, keywords, token_budget, since, since_note, seeds)
+    print(markdown)
+
+    label = ' '.join([Path(repo).name, head[:7]] + keywords)
+    with phase("write_output"):
+        output_file = save('bootstrap', inputs, markdown, label=label)
+    print("⏱️  " + ', '.join(f"{stage} {ms:.0f} ms" for stage, ms in timings.items()))
+    print(f"\n✅ Bundle saved to: {output_file}")
+
+if __name__ == "__main__":
+    main()
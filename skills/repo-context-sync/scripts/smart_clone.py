@@ -0,0 +1,285 @@
+#!/usr/bin/env python3.11
+"""
+smart_clone.py - Sparse clone/update of repos through a shared local mirror cache
+Usage: python3.11 smart_clone.py <repo_url> <local_path> [dir1] [dir2] ... [--keywords <k1,k2>] [--budget-mb <n>] [--cache <dir>] [--no-cache]
+       python3.11 smart_clone.py --manifest <file> [--jobs <n>] [--keywords <k1,k2>] [--budget-mb <n>] [--cache <dir>] [--no-cache]
+Example: python3.11 smart_clone.py https://github.com/user/repo /home/ubuntu/repos/repo /00_Roadmap/ /02_Specs/
+Example: python3.11 smart_clone.py https://github.com/user/monorepo /home/ubuntu/repos/monorepo --keywords agent,routing --budget-mb 20
+
+Each remote is kept as a blobless (--filter=blob:none) bare mirror under
+~/.cache/repo-mirrors (or --cache), holding every commit and tree but no file
+content. New clones are made from the mirror with alternates (--shared), so
+cloning the same remote again costs a disk-local copy instead of a network
+fetch. Clones keep the remote as a promisor, so a sparse checkout fetches only
+the blobs of its cone, on demand, as a direct blobless clone does. Existing
+clones fetch from the refreshed mirror, fast-forward, and update their sparse
+directories in place.
+Because clones borrow the mirror's objects, mirrors never gc or prune: an
+object dropped from a force-pushed or deleted ref may still be in use by a
+clone. Delete a mirror (and re-clone its users) to reclaim its space.
+
+A manifest lists one repo per line: <repo_url> <local_path> [dir...]
+(blank lines and lines starting with # are ignored). Manifest entries are
+synced in parallel with a bounded worker pool (--jobs, default 4); each
+remote's mirror is fetched at most once per run.
+
+With --keywords and no explicit directories, sparse_planner.py picks the
+directories from the tree alone (after the clone, before any checkout) so the
+checkout stays within --budget-mb (default 20).
+"""
+
+import sys
+import fcntl
+import hashlib
+import subprocess
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sparse_planner import DEFAULT_BUDGET_MB, plan_repo, format_size
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "repo-mirrors"
+DEFAULT_JOBS = 4
+
+# Remotes whose mirror was already refreshed in this run
+_refreshed = set()
+_refreshed_lock = threading.Lock()
+
+def run_git(args, cwd=None):
+    """Run a git command, raising CalledProcessError (with stderr) on failure"""
+    result = subprocess.run(
+        ["git"] + args,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip()
+
+def mirror_path_for(repo_url, cache_dir):
+    """Return the mirror directory for a remote: <name>-<url hash>.git"""
+    name = repo_url.rstrip('/').rsplit('/', 1)[-1].removesuffix('.git') or 'repo'
+    digest = hashlib.sha1(repo_url.encode('utf-8')).hexdigest()[:12]
+    return Path(cache_dir) / f"{name}-{digest}.git"
+
+@contextmanager
+def mirror_lock(mirror_path):
+    """Hold an exclusive lock on a mirror (across threads and processes)"""
+    lock_file = mirror_path.with_suffix('.lock')
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, 'w') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def disable_mirror_gc(mirror):
+    """Stop auto-gc and pruning in a mirror, since --shared clones borrow its objects"""
+    run_git(["config", "gc.auto", "0"], cwd=mirror)
+    run_git(["config", "gc.pruneExpire", "never"], cwd=mirror)
+
+def make_promisor(local_path):
+    """Let a clone of a blobless mirror fetch missing blobs from its origin on demand"""
+    run_git(["config", "remote.origin.promisor", "true"], cwd=local_path)
+    run_git(["config", "remote.origin.partialclonefilter", "blob:none"], cwd=local_path)
+
+def ensure_mirror(repo_url, cache_dir, log):
+    """Create or refresh the bare mirror for repo_url; fetches at most once per run"""
+    mirror = mirror_path_for(repo_url, cache_dir)
+    with mirror_lock(mirror):
+        with _refreshed_lock:
+            if mirror in _refreshed:
+                return mirror
+        if (mirror / "HEAD").exists():
+            log(f"🔄 Refreshing mirror: {mirror.name}")
+            run_git(["fetch", "--prune", "--quiet", "origin"], cwd=mirror)
+        else:
+            log(f"📥 Creating mirror: {mirror.name}")
+            run_git(["clone", "--mirror", "--filter=blob:none", "--quiet", repo_url, str(mirror)])
+        # Also applied to existing mirrors, which may predate this setting
+        disable_mirror_gc(mirror)
+        with _refreshed_lock:
+            _refreshed.add(mirror)
+    return mirror
+
+def normalize_dirs(dirs):
+    """Convert '/00_Roadmap/' style arguments into cone-mode sparse-checkout paths"""
+    return [d.strip('/') for d in dirs if d.strip('/')]
+
+def plan_focus_dirs(local_path, focus, log):
+    """Plan cone directories for (keywords, budget_bytes) from the tree of the clone's HEAD"""
+    keywords, budget = focus
+    plan = plan_repo(str(local_path), keywords, budget)
+    dirs = [d for d, _, _, _ in plan['dirs']]
+    log(f"🧭 Planned {len(dirs)} directories for {', '.join(keywords)}: "
+        f"{format_size(plan['bytes'])} of {format_size(plan['total_bytes'])}, "
+        f"{plan['matched']}/{plan['total_matched']} matching files")
+    if not dirs:
+        log("⚠️  No matching directory fits the budget, checking out top-level files only")
+    return dirs
+
+def apply_sparse_dirs(local_path, dirs, log, focus=None):
+    """Set the sparse-checkout directories, or disable sparse checkout if none are given
+
+    With focus (keywords, budget_bytes) and no dirs, the directories are planned
+    with sparse_planner and an empty plan keeps only the top-level files.
+    """
+    if not dirs and focus:
+        dirs = plan_focus_dirs(local_path, focus, log)
+        if not dirs:
+            run_git(["sparse-checkout", "set", "--cone"], cwd=local_path)
+            return
+    if dirs:
+        log("🎯 Configuring sparse checkout for:")
+        for d in dirs:
+            log(f"   - {d}")
+        run_git(["sparse-checkout", "set", "--cone"] + dirs, cwd=local_path)
+    else:
+        run_git(["sparse-checkout", "disable"], cwd=local_path)
+
+def clone_repo(repo_url, local_path, dirs, mirror, log, focus=None):
+    """Clone a new repo, from the mirror when one is given"""
+    local_path.parent.mkdir(parents=True, exist_ok=True)
+    if mirror:
+        log("📥 Cloning from local mirror...")
+        run_git(["clone", "--quiet", "--no-checkout", "--shared", str(mirror), str(local_path)])
+        run_git(["remote", "set-url", "origin", repo_url], cwd=local_path)
+        make_promisor(local_path)
+        if dirs or focus:
+            apply_sparse_dirs(local_path, dirs, log, focus)
+        else:
+            log("📦 No specific directories provided, checking out full repo")
+        run_git(["checkout", "--quiet"], cwd=local_path)
+    else:
+        log("📥 Cloning with sparse checkout...")
+        run_git(["clone", "--quiet", "--filter=blob:none", "--sparse", "--no-checkout", repo_url, str(local_path)])
+        if not dirs and not focus:
+            log("📦 No specific directories provided, checking out full repo")
+        apply_sparse_dirs(local_path, dirs, log, focus)
+        run_git(["checkout", "--quiet"], cwd=local_path)
+
+def update_repo(local_path, dirs, mirror, log, focus=None):
+    """Fetch (from the mirror when given), fast-forward the current branch and refresh sparse dirs"""
+    log("✅ Repo already cloned. Fetching latest changes...")
+    if mirror:
+        run_git(["fetch", "--quiet", "--prune", str(mirror),
+                 "+refs/heads/*:refs/remotes/origin/*"], cwd=local_path)
+    else:
+        run_git(["fetch", "--quiet", "--prune", "origin"], cwd=local_path)
+
+    branch = run_git(["branch", "--show-current"], cwd=local_path)
+    if branch:
+        try:
+            run_git(["merge", "--ff-only", "--quiet", f"origin/{branch}"], cwd=local_path)
+        except subprocess.CalledProcessError as e:
+            log(f"⚠️  Could not fast-forward {branch}: {e.stderr.strip()}")
+
+    if dirs or focus:
+        apply_sparse_dirs(local_path, dirs, log, focus)
+
+def sync_repo(repo_url, local_path, dirs, cache_dir=DEFAULT_CACHE_DIR, use_cache=True, focus=None):
+    """
+    Clone or update one repo.
+
+    focus is an optional (keywords, budget_bytes) pair used to plan the
+    sparse directories when dirs is empty. Returns (ok, log_lines); git failures are reported in the log, not raised.
+    """
+    lines = []
+    log = lines.append
+    local_path = Path(local_path)
+    dirs = normalize_dirs(dirs)
+    log(f"🔍 Smart Clone: {repo_url}")
+    log(f"📁 Target: {local_path}")
+    try:
+        mirror = ensure_mirror(repo_url, cache_dir, log) if use_cache else None
+        if (local_path / ".git").is_dir():
+            update_repo(local_path, dirs, mirror, log, focus)
+            log("✅ Updated successfully")
+        else:
+            clone_repo(repo_url, local_path, dirs, mirror, log, focus)
+            log(f"✅ Clone complete: {local_path}")
+        return True, lines
+    except subprocess.CalledProcessError as e:
+        log(f"❌ Git command failed: {' '.join(e.cmd)}\n{(e.stderr or '').strip()}")
+        return False, lines
+
+def load_manifest(manifest_file):
+    """Parse a manifest into (repo_url, local_path, dirs) entries"""
+    entries = []
+    for line in Path(manifest_file).read_text().split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split()
+        if len(parts) < 2:
+            raise ValueError(f"Manifest line needs <repo_url> <local_path>: {line}")
+        entries.append((parts[0], parts[1], parts[2:]))
+    return entries
+
+def sync_many(entries, jobs=DEFAULT_JOBS, cache_dir=DEFAULT_CACHE_DIR, use_cache=True, focus=None):
+    """Sync manifest entries in parallel; returns [(entry, ok, log_lines)] in manifest order"""
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(sync_repo, url, path, dirs, cache_dir, use_cache, focus)
+            for url, path, dirs in entries
+        ]
+        return [(entry, *future.result()) for entry, future in zip(entries, futures)]
+
+def main():
+    positional = []
+    manifest = None
+    jobs = DEFAULT_JOBS
+    cache_dir = DEFAULT_CACHE_DIR
+    use_cache = True
+    keywords = []
+    budget_mb = DEFAULT_BUDGET_MB
+    argv = sys.argv[1:]
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--manifest' and argv:
+            manifest = argv.pop(0)
+        elif arg == '--jobs' and argv:
+            jobs = max(1, int(argv.pop(0)))
+        elif arg == '--cache' and argv:
+            cache_dir = Path(argv.pop(0))
+        elif arg == '--no-cache':
+            use_cache = False
+        elif arg == '--keywords' and argv:
+            keywords = [k for k in argv.pop(0).split(',') if k]
+        elif arg == '--budget-mb' and argv:
+            budget_mb = float(argv.pop(0))
+        else:
+            positional.append(arg)
+
+    if manifest is None and len(positional) < 2:
+        print("Usage: python3.11 smart_clone.py <repo_url> <local_path> [dir1] [dir2] ... [--keywords <k1,k2>] [--budget-mb <n>] [--cache <dir>] [--no-cache]")
+        print("       python3.11 smart_clone.py --manifest <file> [--jobs <n>] [--keywords <k1,k2>] [--budget-mb <n>] [--cache <dir>] [--no-cache]")
+        print("Example: python3.11 smart_clone.py https://github.com/user/repo /home/ubuntu/repos/repo /00_Roadmap/ /02_Specs/")
+        sys.exit(1)
+
+    focus = (keywords, int(budget_mb * 1024 * 1024)) if keywords else None
+    if manifest is None:
+        ok, lines = sync_repo(positional[0], positional[1], positional[2:], cache_dir, use_cache, focus)
+        print('\n'.join(lines))
+        sys.exit(0 if ok else 1)
+
+    try:
+        entries = load_manifest(manifest)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading manifest: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"🔍 Syncing {len(entries)} repos ({jobs} workers)")
+    results = sync_many(entries, jobs, cache_dir, use_cache, focus)
+    failed = 0
+    for _, ok, lines in results:
+        print()
+        print('\n'.join(lines))
+        failed += not ok
+    print(f"\n{'✅' if not failed else '❌'} {len(results) - failed}/{len(results)} repos synced")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
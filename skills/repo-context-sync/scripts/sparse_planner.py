@@ -0,0 +1,335 @@
+#!/usr/bin/env python3.11
+"""
+sparse_planner.py - Pick sparse-checkout directories for focus keywords within a byte budget
+Usage: python3.11 sparse_planner.py <repo_path> <focus_keywords...> [--budget-mb <n>] [--rev <commit>] [--apply]
+Example: python3.11 sparse_planner.py /home/ubuntu/repos/monorepo agent routing --budget-mb 20 --apply
+
+Works from tree metadata only, so it can run right after a blobless
+(--filter=blob:none --no-checkout) clone, before any file content is fetched:
+
+- paths come from `git ls-tree -r`; blob sizes from `ls-tree -l` in full
+  clones, or, in partial clones, from `cat-file --batch-check` for the blobs
+  already present (found with `rev-list --missing=print`, which never fetches).
+  Missing blobs are estimated at the median known size.
+- a file matches when a keyword appears in its path; directories holding a
+  framework marker (FRAMEWORK_MARKERS from repo_markers.py, e.g. package.json
+  or go.mod) are project roots and preferred as whole units.
+
+Directories are chosen greedily by matched files per byte, counting what cone
+mode really checks out: the whole directory plus the files directly inside each
+parent directory. Numbered planning directories (00_Roadmap/, ...) are added
+when they still fit. --apply sets the result as the sparse-checkout cone.
+"""
+
+import os
+import sys
+import heapq
+import statistics
+import subprocess
+from pathlib import Path
+
+from repo_markers import FRAMEWORK_MARKERS, STRUCTURE_PREFIXES
+
+DEFAULT_BUDGET_MB = 20
+DEFAULT_BLOB_ESTIMATE = 8 * 1024
+# Gain multiplier for directories that hold a framework marker
+PROJECT_ROOT_BONUS = 1.5
+
+def git(repo_path, args, input=None, env=None):
+    """Run git and return stdout bytes (raises CalledProcessError on failure)"""
+    return subprocess.run(
+        ["git"] + args, cwd=repo_path, input=input, env=env,
+        capture_output=True, check=True
+    ).stdout
+
+def is_partial_clone(repo_path):
+    """True if the repo was cloned with a --filter (blobs may be missing locally)"""
+    result = subprocess.run(
+        ["git", "config", "--get-regexp", r"^(extensions\.partialclone|remote\..*\.promisor)$"],
+        cwd=repo_path, capture_output=True, text=True
+    )
+    return any(line.split(' ', 1)[1:] not in ([], ['false']) for line in result.stdout.splitlines())
+
+def list_tree_sizes(repo_path, rev="HEAD"):
+    """Return ([(path, size or None)], missing count) for every blob at rev, without fetching blobs"""
+    if not is_partial_clone(repo_path):
+        entries = []
+        for entry in git(repo_path, ["ls-tree", "-r", "-l", "-z", "--full-tree", rev]).split(b'\0'):
+            if not entry:
+                continue
+            meta, path = entry.split(b'\t', 1)
+            _, kind, _, size = meta.split()
+            if kind == b'blob':
+                entries.append((path.decode('utf-8', errors='replace'), int(size)))
+        return entries, 0
+
+    blobs = []
+    for entry in git(repo_path, ["ls-tree", "-r", "-z", "--full-tree", rev]).split(b'\0'):
+        if not entry:
+            continue
+        meta, path = entry.split(b'\t', 1)
+        _, kind, oid = meta.split()
+        if kind == b'blob':
+            blobs.append((path.decode('utf-8', errors='replace'), oid))
+
+    # rev-list reports missing objects as "?<oid>" instead of fetching them
+    missing = set()
+    for line in git(repo_path, ["rev-list", "--objects", "--no-walk", "--missing=print", rev]).split(b'\n'):
+        if line.startswith(b'?'):
+            missing.add(line[1:].strip())
+    present = [oid for _, oid in blobs if oid not in missing]
+    sizes = {}
+    if present:
+        env = dict(os.environ, GIT_NO_LAZY_FETCH='1')
+        output = git(repo_path, ["cat-file", "--batch-check=%(objectname) %(objectsize)"],
+                     input=b'\n'.join(present) + b'\n', env=env)
+        for line in output.split(b'\n'):
+            parts = line.split()
+            if len(parts) == 2 and parts[1].isdigit():
+                sizes[parts[0]] = int(parts[1])
+    return [(path, sizes.get(oid)) for path, oid in blobs], len(missing)
+
+def parent_of(path):
+    slash = path.rfind('/')
+    return path[:slash] if slash > 0 else ''
+
+def ancestors(directory):
+    """Strict ancestors of a directory, nearest first, excluding the repo root"""
+    result = []
+    directory = parent_of(directory)
+    while directory:
+        result.append(directory)
+        directory = parent_of(directory)
+    return result
+
+def aggregate_dirs(entries, keywords):
+    """Fold files into per-directory stats: {dir: [total bytes, direct bytes, matched files, files]}
+
+    Returns (dirs, root_bytes, project_roots).
+    """
+    keywords = [k.lower() for k in keywords]
+    markers = set(FRAMEWORK_MARKERS)
+    dirs = {}
+    root_bytes = 0
+    project_roots = set()
+    for path, size in entries:
+        parent = parent_of(path)
+        if not parent:
+            root_bytes += size
+            continue
+        if path[len(parent) + 1:] in markers:
+            project_roots.add(parent)
+        lower = path.lower()
+        matched = 1 if any(k in lower for k in keywords) else 0
+        stats = dirs.get(parent)
+        if stats is None:
+            stats = dirs[parent] = [0, 0, 0, 0]
+        stats[1] += size
+        directory = parent
+        while directory:
+            stats = dirs.get(directory)
+            if stats is None:
+                stats = dirs[directory] = [0, 0, 0, 0]
+            stats[0] += size
+            stats[2] += matched
+            stats[3] += 1
+            directory = parent_of(directory)
+    return dirs, root_bytes, project_roots
+
+def is_within(path, directory):
+    return path == directory or path.startswith(directory + '/')
+
+class Selection:
+    """Chosen cone directories and the bytes cone mode would check out for them"""
+
+    def __init__(self, dirs, root_bytes):
+        self.dirs = dirs
+        self.chosen = set()
+        # Parent directories whose direct files cone mode includes
+        self.parents = set()
+        self.bytes = root_bytes
+        self.matched = 0
+
+    def delta(self, directory):
+        """(added matched files, added bytes) for choosing directory, or None if already covered"""
+        if any(is_within(directory, c) for c in self.chosen):
+            return None
+        stats = self.dirs[directory]
+        covered = [c for c in self.chosen if is_within(c, directory)]
+        added_bytes = stats[0] - sum(self.dirs[c][0] for c in covered)
+        added_bytes -= sum(self.dirs[p][1] for p in self.parents if is_within(p, directory))
+        added_bytes += sum(self.dirs[a][1] for a in ancestors(directory) if a not in self.parents)
+        added_matched = stats[2] - sum(self.dirs[c][2] for c in covered)
+        return added_matched, added_bytes
+
+    def add(self, directory, added_matched, added_bytes):
+        self.chosen = {c for c in self.chosen if not is_within(c, directory)}
+        self.chosen.add(directory)
+        self.parents = {p for p in self.parents if not is_within(p, directory)}
+        self.parents.update(ancestors(directory))
+        self.bytes += added_bytes
+        self.matched += added_matched
+
+def plan_sparse_dirs(entries, keywords, budget_bytes):
+    """Choose cone directories covering the most keyword-matching files within budget_bytes
+
+    entries are (path, size) pairs with sizes already known or estimated.
+    Returns a plan dict: 'dirs' [(dir, matched files, bytes, reason)],
+    'bytes', 'matched', 'total_bytes', 'total_files', 'total_matched',
+    'project_roots' and 'budget'.
+    """
+    dirs, root_bytes, project_roots = aggregate_dirs(entries, keywords)
+    selection = Selection(dirs, root_bytes)
+
+    def priority(directory, matched, added_bytes):
+        bonus = PROJECT_ROOT_BONUS if directory in project_roots else 1.0
+        return -(matched * bonus) / max(added_bytes, 1)
+
+    # Greedy on an indexed heap. A pick changes the gain of its ancestors (part
+    # of them is now covered) and of every candidate under one of its newly
+    # included parent directories (their files are now paid for), which can
+    # rise as well as fall, so those candidates are re-scored after each pick
+    # and their older heap entries are skipped. Candidates over budget stay
+    # live: a later pick can make them cheaper.
+    live = {d for d, s in dirs.items() if s[2]}
+    deltas = {d: selection.delta(d) for d in live}
+    version = dict.fromkeys(live, 0)
+    heap = [(priority(d, *deltas[d]), d, 0) for d in live]
+    heapq.heapify(heap)
+    while heap:
+        _, directory, stamp = heapq.heappop(heap)
+        if directory not in live or stamp != version[directory]:
+            continue
+        matched, added_bytes = deltas[directory]
+        if selection.bytes + added_bytes > budget_bytes:
+            continue
+        new_parents = set(ancestors(directory)) - selection.parents
+        selection.add(directory, matched, added_bytes)
+        live.discard(directory)
+        for candidate in list(live):
+            if is_within(candidate, directory):
+                live.discard(candidate)
+            elif is_within(directory, candidate) or not new_parents.isdisjoint(ancestors(candidate)):
+                delta = selection.delta(candidate)
+                if delta is None or delta[0] <= 0:
+                    live.discard(candidate)
+                    continue
+                deltas[candidate] = delta
+                version[candidate] += 1
+                heapq.heappush(heap, (priority(candidate, *delta), candidate, version[candidate]))
+
+    reasons = {}
+    for directory in sorted(d for d in dirs if '/' not in d and d.startswith(STRUCTURE_PREFIXES)):
+        delta = selection.delta(directory)
+        if delta is not None and selection.bytes + delta[1] <= budget_bytes:
+            selection.add(directory, *delta)
+            reasons[directory] = 'planning docs'
+
+    chosen = []
+    for directory in sorted(selection.chosen):
+        reason = reasons.get(directory) or ('project root' if directory in project_roots else 'keyword match')
+        chosen.append((directory, dirs[directory][2], dirs[directory][0], reason))
+    return {
+        'dirs': chosen,
+        'bytes': selection.bytes,
+        'matched': selection.matched,
+        'total_bytes': root_bytes + sum(s[0] for d, s in dirs.items() if '/' not in d),
+        'total_files': len(entries),
+        'total_matched': sum(s[2] for d, s in dirs.items() if '/' not in d),
+        'project_roots': sorted(project_roots),
+        'budget': budget_bytes,
+    }
+
+def estimate_missing(entries):
+    """Fill unknown sizes with the median known size (DEFAULT_BLOB_ESTIMATE if none are known)"""
+    known = [size for _, size in entries if size is not None]
+    estimate = int(statistics.median(known)) if known else DEFAULT_BLOB_ESTIMATE
+    return [(path, size if size is not None else estimate) for path, size in entries], estimate
+
+def plan_repo(repo_path, keywords, budget_bytes, rev="HEAD"):
+    """Plan cone directories for a local clone; adds 'missing' and 'estimate' to the plan"""
+    entries, missing = list_tree_sizes(repo_path, rev)
+    entries, estimate = estimate_missing(entries)
+    plan = plan_sparse_dirs(entries, keywords, budget_bytes)
+    plan['missing'] = missing
+    plan['estimate'] = estimate
+    return plan
+
+def format_size(num_bytes):
+    for unit in ('B', 'KB', 'MB'):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}" if unit == 'B' else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+def format_plan(plan):
+    """Render a plan as markdown"""
+    share = plan['bytes'] / plan['total_bytes'] * 100 if plan['total_bytes'] else 0
+    md = (f"- **Checkout:** {format_size(plan['bytes'])} of {format_size(plan['total_bytes'])} "
+          f"({share:.1f}%), budget {format_size(plan['budget'])}\n"
+          f"- **Matching files covered:** {plan['matched']:,} of {plan['total_matched']:,}\n"
+          f"- **Files in tree:** {plan['total_files']:,}")
+    if plan.get('missing'):
+        md += f" ({plan['missing']:,} blob sizes estimated at {format_size(plan['estimate'])})"
+    md += "\n"
+    if plan['project_roots']:
+        shown = ', '.join(f"`{r}/`" for r in plan['project_roots'][:10])
+        more = f" and {len(plan['project_roots']) - 10} more" if len(plan['project_roots']) > 10 else ''
+        md += f"- **Project roots:** {shown}{more}\n"
+    if plan['dirs']:
+        md += "\n| Directory | Matching files | Size | Why |\n|-----------|----------------|------|-----|\n"
+        for directory, matched, size, reason in plan['dirs']:
+            md += f"| `{directory}/` | {matched:,} | {format_size(size)} | {reason} |\n"
+    else:
+        md += "\nNo directory matches the keywords within the budget; only top-level files are checked out.\n"
+    return md
+
+def apply_plan(repo_path, dirs):
+    """Set dirs as the cone and check out (fetching only the blobs inside the cone)"""
+    git(repo_path, ["sparse-checkout", "set", "--cone"] + dirs)
+    git(repo_path, ["checkout", "--quiet"])
+
+def main():
+    args = []
+    budget_mb = DEFAULT_BUDGET_MB
+    rev = "HEAD"
+    apply = False
+    argv = sys.argv[1:]
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--budget-mb' and argv:
+            budget_mb = float(argv.pop(0))
+        elif arg == '--rev' and argv:
+            rev = argv.pop(0)
+        elif arg == '--apply':
+            apply = True
+        elif arg.startswith('--'):
+            args = []
+            break
+        else:
+            args.append(arg)
+
+    if len(args) < 2:
+        print("Usage: python3.11 sparse_planner.py <repo_path> <focus_keywords...> [--budget-mb <n>] [--rev <commit>] [--apply]")
+        print("Example: python3.11 sparse_planner.py /home/ubuntu/repos/monorepo agent routing --budget-mb 20 --apply")
+        sys.exit(1)
+
+    repo_path, keywords = args[0], args[1:]
+    if not Path(repo_path).is_dir():
+        print(f"❌ Error: {repo_path} is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        plan = plan_repo(repo_path, keywords, int(budget_mb * 1024 * 1024), rev)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Git command failed: {' '.join(e.cmd)}\n{e.stderr.decode(errors='replace').strip()}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"# Sparse Plan: {Path(repo_path).resolve().name} ({', '.join(keywords)})\n")
+    print(format_plan(plan))
+    if apply:
+        apply_plan(repo_path, [d for d, _, _, _ in plan['dirs']])
+        print(f"✅ Sparse checkout set to {len(plan['dirs'])} directories")
+
+if __name__ == "__main__":
+    main()
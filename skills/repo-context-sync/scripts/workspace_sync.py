@@ -0,0 +1,228 @@
+#!/usr/bin/env python3.11
+"""
+workspace_sync.py - Map and diff many repos concurrently into one report
+Usage: python3.11 workspace_sync.py <repo_path|workspace_dir>... [--since <ref>] [--jobs <n>] [--keywords <k1,k2>] [--output <file>]
+Example: python3.11 workspace_sync.py /home/ubuntu/repos --since HEAD~20 --keywords agent,routing
+
+A directory that is not itself a git repo is treated as a workspace and
+every git repo directly inside it is included. All git queries for all repos
+run concurrently (at most --jobs processes at once, default 8), so a
+workspace sync takes about as long as the slowest repo.
+
+The report is saved to the shared report store (see report_store.py), keyed
+by the workspace paths, every repo's HEAD and the options; --output also
+writes a copy to a file of your choice.
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+from datetime import datetime
+
+from context_mapper import detect_patterns
+from diff_tracker import parse_name_status
+from report_store import save
+
+DEFAULT_JOBS = 8
+DEFAULT_SINCE = "HEAD~10"
+
+async def run_git_async(repo_path, command, semaphore):
+    """Run a git command without blocking the event loop; returns (returncode, stdout)"""
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            cwd=repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, _ = await proc.communicate()
+    return proc.returncode, stdout.decode('utf-8', errors='replace').strip()
+
+async def resolve_base_commit(repo_path, since, semaphore):
+    """Resolve the diff base, falling back to the root commit for short histories"""
+    code, commit = await run_git_async(repo_path, ["git", "rev-parse", "--verify", "-q", f"{since}^{{commit}}"], semaphore)
+    if code == 0 and commit:
+        return commit
+    code, roots = await run_git_async(repo_path, ["git", "rev-list", "--max-parents=0", "HEAD"], semaphore)
+    return roots.split('\n')[0] if code == 0 and roots else None
+
+async def map_repo(repo_path, since, keywords, semaphore):
+    """Collect repo info, file list, changes and keyword hits for one repo"""
+    queries = {
+        'branch': ["git", "branch", "--show-current"],
+        'head': ["git", "rev-parse", "HEAD"],
+        'message': ["git", "log", "-1", "--pretty=%s"],
+        'remote': ["git", "config", "--get", "remote.origin.url"],
+        'files': ["git", "ls-files", "-z"],
+    }
+    for keyword in keywords:
+        queries[f"grep:{keyword}"] = ["git", "grep", "--cached", "-l", "-z", "-i", "-e", keyword]
+
+    names = list(queries)
+    results = await asyncio.gather(
+        resolve_base_commit(repo_path, since, semaphore),
+        *(run_git_async(repo_path, queries[name], semaphore) for name in names)
+    )
+    base = results[0]
+    output = {name: out if code == 0 else '' for name, (code, out) in zip(names, results[1:])}
+
+    changes = parse_name_status('')
+    commits = []
+    if base and output['head']:
+        (_, diff_output), (_, log_output) = await asyncio.gather(
+            run_git_async(repo_path, ["git", "diff", "--name-status", f"{base}..{output['head']}"], semaphore),
+            run_git_async(repo_path, ["git", "log", "--oneline", f"{base}..{output['head']}"], semaphore)
+        )
+        changes = parse_name_status(diff_output)
+        commits = log_output.split('\n') if log_output else []
+
+    files = [f for f in output['files'].split('\0') if f]
+    relevant = set()
+    for keyword in keywords:
+        relevant.update(f for f in output[f"grep:{keyword}"].split('\0') if f)
+
+    return {
+        'name': Path(repo_path).name,
+        'path': str(repo_path),
+        'branch': output['branch'],
+        'head': output['head'],
+        'commit': output['head'][:7] if output['head'] else 'unknown',
+        'commit_message': output['message'],
+        'remote_url': output['remote'],
+        'base': base[:7] if base else None,
+        'files': files,
+        'patterns': detect_patterns(repo_path, files),
+        'changes': changes,
+        'commits': commits,
+        'relevant_files': sorted(relevant),
+    }
+
+async def map_workspace(repo_paths, since=DEFAULT_SINCE, keywords=None, jobs=DEFAULT_JOBS):
+    """Map all repos concurrently, with at most jobs git processes running at once"""
+    semaphore = asyncio.Semaphore(jobs)
+    return await asyncio.gather(*(map_repo(path, since, keywords or [], semaphore) for path in repo_paths))
+
+def find_repos(paths):
+    """Expand workspace directories into the git repos directly inside them"""
+    repos = []
+    for path in map(Path, paths):
+        if (path / ".git").exists():
+            repos.append(path)
+        elif path.is_dir():
+            repos.extend(sorted(child for child in path.iterdir() if (child / ".git").exists()))
+    return list(dict.fromkeys(repos))
+
+def generate_workspace_summary(reports, since, keywords, elapsed):
+    """Generate one markdown report covering every repo"""
+    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    md = f"""# Workspace Summary
+
+**Generated:** {current_time}
+**Repos:** {len(reports)}
+**Changes since:** `{since}`
+**Sync time:** {elapsed:.2f}s
+
+## Overview
+
+| Repo | Branch | Commit | Files | Commits | +/~/-/R | Languages |
+|------|--------|--------|-------|---------|---------|-----------|
+"""
+    for r in reports:
+        c = r['changes']
+        counts = f"{len(c['added'])}/{len(c['modified'])}/{len(c['deleted'])}/{len(c['renamed'])}"
+        languages = ', '.join(sorted(r['patterns']['languages'])) or '-'
+        md += f"| {r['name']} | `{r['branch']}` | `{r['commit']}` | {len(r['files'])} | {len(r['commits'])} | {counts} | {languages} |\n"
+
+    for r in reports:
+        md += f"\n## {r['name']}\n\n"
+        md += f"**Path:** `{r['path']}`\n"
+        md += f"**Commit:** `{r['commit']}` - {r['commit_message']}\n"
+        md += f"**Remote:** {r['remote_url']}\n"
+        if r['patterns']['frameworks']:
+            md += f"**Frameworks:** {', '.join(sorted(r['patterns']['frameworks']))}\n"
+        if r['patterns']['file_structure']:
+            md += f"**File Hierarchy Pattern:** {', '.join(r['patterns']['file_structure'])}\n"
+
+        if r['base'] is None:
+            md += "\nNo commits to compare.\n"
+        elif r['commits']:
+            md += f"\n**Commits since `{r['base']}`:**\n\n"
+            for commit in r['commits'][:10]:
+                md += f"- `{commit}`\n"
+            if len(r['commits']) > 10:
+                md += f"- ... and {len(r['commits']) - 10} more commits\n"
+            for kind in ('added', 'modified', 'deleted', 'renamed'):
+                files = r['changes'][kind]
+                if files:
+                    shown = ', '.join(f"`{f}`" for f in files[:10])
+                    more = f" and {len(files) - 10} more" if len(files) > 10 else ''
+                    md += f"\n**{kind.title()}:** {shown}{more}\n"
+
+        if keywords:
+            md += f"\n**Relevant files ({', '.join(keywords)}):** "
+            if r['relevant_files']:
+                md += ', '.join(f"`{f}`" for f in r['relevant_files'][:20])
+                if len(r['relevant_files']) > 20:
+                    md += f" and {len(r['relevant_files']) - 20} more"
+                md += "\n"
+            else:
+                md += "none\n"
+
+    return md
+
+def main():
+    paths = []
+    since = DEFAULT_SINCE
+    jobs = DEFAULT_JOBS
+    keywords = []
+    output_file = None
+    argv = sys.argv[1:]
+    while argv:
+        arg = argv.pop(0)
+        if arg == '--since' and argv:
+            since = argv.pop(0)
+        elif arg == '--jobs' and argv and argv[0].isdigit():
+            jobs = max(1, int(argv.pop(0)))
+        elif arg == '--keywords' and argv:
+            keywords = [k for k in argv.pop(0).split(',') if k]
+        elif arg == '--output' and argv:
+            output_file = Path(argv.pop(0))
+        elif arg.startswith('--'):
+            paths = []
+            break
+        else:
+            paths.append(arg)
+
+    if not paths:
+        print("Usage: python3.11 workspace_sync.py <repo_path|workspace_dir>... [--since <ref>] [--jobs <n>] [--keywords <k1,k2>] [--output <file>]")
+        print("Example: python3.11 workspace_sync.py /home/ubuntu/repos --since HEAD~20 --keywords agent,routing")
+        sys.exit(1)
+
+    repos = find_repos(paths)
+    if not repos:
+        print(f"❌ Error: no git repositories found in {', '.join(paths)}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"🗺️  Syncing {len(repos)} repos ({jobs} concurrent git processes)")
+
+    started = time.perf_counter()
+    reports = asyncio.run(map_workspace(repos, since, keywords, jobs))
+    summary = generate_workspace_summary(reports, since, keywords, time.perf_counter() - started)
+    print(summary)
+
+    inputs = {
+        'paths': [str(Path(p).resolve()) for p in paths],
+        'heads': {str(Path(r['path']).resolve()): r['head'] for r in reports},
+        'since': since,
+        'keywords': keywords,
+    }
+    label = ' '.join([Path(p).resolve().name for p in paths] + keywords)
+    stored = save('workspace', inputs, summary, label=label)
+    if output_file:
+        output_file.write_text(summary)
+    print(f"\n✅ Workspace summary saved to: {output_file or stored}")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,25 @@
 #!/usr/bin/env python3.11
 """
 apply_seed.py - Load and explain how to apply a seed
-Usage: python3.11 apply_seed.py <seed_id>
+Usage: python3.11 apply_seed.py <seed_id> [--profile[=<file>]]
 Example: python3.11 apply_seed.py 04_agent_connect
+
+The guide is saved to the shared report store (see report_store.py), keyed by
+the seed ID and a hash of the seed file, so an unchanged seed reuses the
+stored guide. Usage is tracked on every run.
+
+--profile writes a per-phase timing trace (see profiling.py).
 """
 
 import sys
 import json
+import hashlib
 from pathlib import Path
 from datetime import datetime
 
+from profiling import init_from_argv, phase
+from report_store import lookup, save
+
 SEEDS_DIR = Path(__file__).parent.parent / "seeds"
 USAGE_FILE = Path.home() / ".seed-usage.json"
 
@@ -56,7 +66,7 @@ def track_seed_usage(seed_id, session_id=None):
     save_usage_state(state)
 
 def apply_seed(seed_id, session_id=None):
-    """Load and display seed content"""
+    """Load the seed and build its application guide; returns (guide, stored report path)"""
     seed_file = SEEDS_DIR / f"{seed_id}.md"
     
     if not seed_file.exists():
@@ -68,10 +78,17 @@ def apply_seed(seed_id, session_id=None):
         sys.exit(1)
     
     # Track usage
-    track_seed_usage(seed_id, session_id)
+    with phase("track_usage"):
+        track_seed_usage(seed_id, session_id)
     
     # Load content
-    content = seed_file.read_text()
+    with phase("load_seed"):
+        content = seed_file.read_text()
+    
+    inputs = {'seed_id': seed_id, 'seed': hashlib.sha256(content.encode('utf-8')).hexdigest()}
+    cached = lookup('seed-guide', inputs)
+    if cached:
+        return cached.read_text(), cached
     
     # Generate application guide
     guide = f"""
@@ -104,11 +121,14 @@ python3.11 track_usage.py {seed_id} <session_id> <helpful|not_helpful>
 
 """
     
-    return guide
+    with phase("write_output"):
+        output_file = save('seed-guide', inputs, guide, label=seed_id)
+    return guide, output_file
 
 def main():
+    init_from_argv(sys.argv)
     if len(sys.argv) < 2:
-        print("Usage: python3.11 apply_seed.py <seed_id> [session_id]")
+        print("Usage: python3.11 apply_seed.py <seed_id> [session_id] [--profile[=<file>]]")
         print("Example: python3.11 apply_seed.py 04_agent_connect session_123")
         sys.exit(1)
     
@@ -117,12 +137,9 @@ def main():
     
     print(f"📖 Loading seed: {seed_id}")
     
-    guide = apply_seed(seed_id, session_id)
+    guide, output_file = apply_seed(seed_id, session_id)
     print(guide)
     
-    # Save to file
-    output_file = Path.home() / f"seed-{seed_id}-applied.md"
-    output_file.write_text(guide)
     print(f"\n✅ Application guide saved to: {output_file}")
 
 if __name__ == "__main__":
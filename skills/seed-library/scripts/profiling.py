@@ -0,0 +1,219 @@
+"""
+profiling.py - Opt-in phase timing and subprocess accounting for skill scripts
+
+Scripts call init_from_argv(sys.argv) first thing in main(); it strips the
+profiling flags from argv so the script's own parsing never sees them:
+
+    --profile             write a JSON trace to ~/.skill-profiles/<script>-<time>.json
+    --profile=<file>      write the JSON trace to <file>
+    --profile-format=chrome
+                          write Chrome trace-event format (chrome://tracing, Perfetto)
+    --cprofile=<file>     also dump cProfile stats to <file> (read with pstats)
+
+Work is attributed to phases with `with phase("name"):`. The trace records
+wall time per phase, every subprocess (count, command, duration), bytes read
+(from /proc/self/io where available) and peak RSS of the script and its
+children. When profiling is off, phase() returns a shared no-op context
+manager and subprocess creation is untouched, so the overhead is one
+function call per phase.
+
+Skills are installed independently, so each skill that uses this module
+ships its own copy; tests/skills/shared-scripts.test.ts fails unless every
+copy is identical, so change them together.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import resource
+import subprocess
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+
+PROFILE_DIR = Path.home() / ".skill-profiles"
+
+_NO_PHASE = nullcontext()
+_profiler = None
+
+def read_io_bytes():
+    """Bytes read by this process so far (rchar from /proc/self/io), or None if unavailable"""
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('rchar:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+class Profiler:
+    """Collects phases and subprocesses for one script run"""
+
+    def __init__(self, script, trace_file, chrome=False, cprofile_file=None):
+        self.script = script
+        self.trace_file = Path(trace_file)
+        self.chrome = chrome
+        self.cprofile_file = cprofile_file
+        self.started = time.perf_counter()
+        self.start_bytes = read_io_bytes()
+        self.phases = []
+        self.depth = 0
+        self.subprocesses = []
+        self.cprofile = None
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    @contextmanager
+    def phase(self, name):
+        start = self.elapsed()
+        start_bytes = read_io_bytes()
+        start_procs = len(self.subprocesses)
+        record = {'name': name, 'depth': self.depth, 'start': start}
+        self.phases.append(record)
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            end_bytes = read_io_bytes()
+            record['seconds'] = self.elapsed() - start
+            record['subprocesses'] = len(self.subprocesses) - start_procs
+            if start_bytes is not None and end_bytes is not None:
+                record['bytes_read'] = end_bytes - start_bytes
+
+    def subprocess_started(self, process, args, start):
+        command = args if isinstance(args, str) else ' '.join(str(a) for a in args)
+        entry = {'command': command[:200], 'start': start, 'seconds': None}
+        self.subprocesses.append(entry)
+        process._profile_entry = entry
+
+    def subprocess_finished(self, process):
+        entry = getattr(process, '_profile_entry', None)
+        if entry is not None and entry['seconds'] is None:
+            entry['seconds'] = self.elapsed() - entry['start']
+
+    def report(self):
+        """Summary dict written as the JSON trace"""
+        total = self.elapsed()
+        end_bytes = read_io_bytes()
+        finished = [p['seconds'] for p in self.subprocesses if p['seconds'] is not None]
+        return {
+            'script': self.script,
+            'argv': sys.argv[1:],
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'total_seconds': round(total, 6),
+            'phases': [
+                {k: round(v, 6) if isinstance(v, float) else v for k, v in p.items()}
+                for p in self.phases
+            ],
+            'subprocess_count': len(self.subprocesses),
+            'subprocess_seconds': round(sum(finished), 6),
+            'subprocesses': [
+                {k: round(v, 6) if isinstance(v, float) else v for k, v in p.items()}
+                for p in self.subprocesses
+            ],
+            'bytes_read': end_bytes - self.start_bytes if end_bytes is not None and self.start_bytes is not None else None,
+            # ru_maxrss is in KB on Linux
+            'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'children_peak_rss_kb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        }
+
+    def chrome_trace(self, report):
+        """Convert a report to Chrome trace-event format (phases on tid 1, subprocesses on tid 2)"""
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': self.script}}]
+        for p in report['phases']:
+            events.append({
+                'name': p['name'], 'ph': 'X', 'pid': pid, 'tid': 1,
+                'ts': p['start'] * 1e6, 'dur': p.get('seconds', 0) * 1e6,
+                'args': {k: p[k] for k in ('subprocesses', 'bytes_read') if k in p},
+            })
+        for s in report['subprocesses']:
+            events.append({
+                'name': ' '.join(s['command'].split(' ', 2)[:2]),
+                'ph': 'X', 'pid': pid, 'tid': 2,
+                'ts': s['start'] * 1e6, 'dur': (s['seconds'] or 0) * 1e6,
+                'args': {'command': s['command']},
+            })
+        return {'traceEvents': events, 'otherData': {k: v for k, v in report.items() if k not in ('phases', 'subprocesses')}}
+
+    def write(self):
+        """Write the trace (and cProfile dump); called at exit"""
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            self.cprofile.dump_stats(self.cprofile_file)
+        report = self.report()
+        self.trace_file.parent.mkdir(parents=True, exist_ok=True)
+        data = self.chrome_trace(report) if self.chrome else report
+        self.trace_file.write_text(json.dumps(data, indent=2))
+        print(f"⏱️  Profile: {report['total_seconds']:.3f}s, {report['subprocess_count']} subprocesses "
+              f"({report['subprocess_seconds']:.3f}s), peak RSS {report['peak_rss_kb'] / 1024:.1f} MB "
+              f"→ {self.trace_file}", file=sys.stderr)
+        if self.cprofile_file:
+            print(f"⏱️  cProfile stats: {self.cprofile_file}", file=sys.stderr)
+
+class _ProfiledPopen(subprocess.Popen):
+    """Popen that reports start and end to the active profiler"""
+
+    def __init__(self, args, *rest, **kwargs):
+        start = _profiler.elapsed() if _profiler is not None else 0.0
+        super().__init__(args, *rest, **kwargs)
+        if _profiler is not None:
+            _profiler.subprocess_started(self, args, start)
+
+    def wait(self, timeout=None):
+        returncode = super().wait(timeout)
+        if _profiler is not None:
+            _profiler.subprocess_finished(self)
+        return returncode
+
+def phase(name):
+    """Context manager attributing the enclosed work to a named phase (no-op unless profiling)"""
+    if _profiler is None:
+        return _NO_PHASE
+    return _profiler.phase(name)
+
+def enable(script, trace_file=None, chrome=False, cprofile_file=None):
+    """Start profiling this process; the trace is written at exit"""
+    global _profiler
+    if _profiler is not None:
+        return _profiler
+    if trace_file is None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        trace_file = PROFILE_DIR / f"{script}-{stamp}.json"
+    _profiler = Profiler(script, trace_file, chrome, cprofile_file)
+    subprocess.Popen = _ProfiledPopen
+    if cprofile_file:
+        import cProfile
+        _profiler.cprofile = cProfile.Profile()
+        _profiler.cprofile.enable()
+    atexit.register(_profiler.write)
+    return _profiler
+
+def init_from_argv(argv):
+    """Enable profiling if argv has profiling flags, removing them from argv in place"""
+    trace_file = None
+    chrome = False
+    cprofile_file = None
+    requested = False
+    kept = []
+    for arg in argv:
+        if arg == '--profile':
+            requested = True
+        elif arg.startswith('--profile='):
+            requested = True
+            trace_file = arg.split('=', 1)[1]
+        elif arg.startswith('--profile-format='):
+            chrome = arg.split('=', 1)[1] == 'chrome'
+        elif arg.startswith('--cprofile='):
+            requested = True
+            cprofile_file = arg.split('=', 1)[1]
+        else:
+            kept.append(arg)
+    argv[:] = kept
+    if requested:
+        enable(Path(argv[0]).stem if argv else 'script', trace_file, chrome, cprofile_file)
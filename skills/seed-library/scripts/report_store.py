@@ -0,0 +1,248 @@
+#!/usr/bin/env python3.11
+"""
+report_store.py - Content-addressed store for generated reports
+Usage: python3.11 report_store.py [list [kind]] | show <key> | prune [--max-mb <n>] [--max-age-days <n>]
+Example: python3.11 report_store.py list context
+
+Scripts save their markdown reports here instead of fixed paths such as
+<repo>/.context_summary.md or ~/seed-suggestions.md:
+
+    from report_store import lookup, save
+
+    inputs = {'repo': '/path/to/repo', 'commit': head, 'keywords': ['agent']}
+    cached = lookup('context', inputs)
+    path = cached or save('context', inputs, markdown, label='dojo-genesis agent')
+
+Layout under ~/.cache/skill-reports/:
+
+    objects/<aa>/<sha256>.md   report content, named by its hash (stored once)
+    keys/<input hash>.json     kind, inputs and label -> object hash
+
+The input hash covers the kind and every input that determines the report,
+so identical inputs return the stored report instead of regenerating it.
+All files are written to a temp file and renamed into place, so concurrent
+runs never see partial reports. Saves prune keys not used within
+MAX_AGE_DAYS and the least recently used keys beyond MAX_STORE_BYTES, then
+remove objects no key refers to; pruning stats the whole store, so it runs
+at most once per PRUNE_INTERVAL_SECONDS (tracked by a marker file's mtime).
+
+Skills are installed independently, so each skill that uses this module
+ships its own copy; tests/skills/shared-scripts.test.ts fails unless every
+copy is identical, so change them together.
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+STORE_DIR = Path.home() / ".cache" / "skill-reports"
+MAX_STORE_BYTES = 64 * 1024 * 1024
+MAX_AGE_DAYS = 30
+# Unreferenced objects younger than this may belong to a save in progress
+ORPHAN_GRACE_SECONDS = 60
+PRUNE_INTERVAL_SECONDS = 3600
+PRUNE_MARKER = ".last-prune"
+STORE_VERSION = 1
+
+def input_key(kind, inputs):
+    """Hash a report kind and its inputs (any JSON-serializable value)"""
+    canonical = json.dumps({'kind': kind, 'inputs': inputs}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def object_path(digest, store_dir=STORE_DIR):
+    return Path(store_dir) / "objects" / digest[:2] / f"{digest}.md"
+
+def key_path(key, store_dir=STORE_DIR):
+    return Path(store_dir) / "keys" / f"{key}.json"
+
+def atomic_write(path, data):
+    """Write bytes to path through a temp file in the same directory and a rename"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def read_record(path):
+    """Load a key record (None if missing, corrupt or from another version)"""
+    try:
+        record = json.loads(Path(path).read_text())
+        if record.get('version') == STORE_VERSION:
+            return record
+    except (OSError, ValueError):
+        pass
+    return None
+
+def lookup(kind, inputs, store_dir=STORE_DIR):
+    """Return the stored report path for these inputs, or None
+
+    A hit refreshes the key's mtime, which retention uses as its last use.
+    """
+    path = key_path(input_key(kind, inputs), store_dir)
+    record = read_record(path)
+    if record is None:
+        return None
+    report = object_path(record['object'], store_dir)
+    if not report.is_file():
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return report
+
+def save(kind, inputs, content, label=None, store_dir=STORE_DIR, prune_after=True):
+    """Store a report for these inputs and return its path
+
+    Identical content is written once, however many keys refer to it.
+    """
+    data = content.encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()
+    report = object_path(digest, store_dir)
+    if report.is_file():
+        os.utime(report)
+    else:
+        atomic_write(report, data)
+
+    key = input_key(kind, inputs)
+    record = {
+        'version': STORE_VERSION,
+        'kind': kind,
+        'label': label or kind,
+        'inputs': inputs,
+        'object': digest,
+        'size': len(data),
+        'created': datetime.now().isoformat(timespec='seconds'),
+    }
+    atomic_write(key_path(key, store_dir), json.dumps(record, indent=2).encode('utf-8'))
+    if prune_after and prune_due(store_dir):
+        prune(store_dir)
+    return report
+
+def list_records(store_dir=STORE_DIR, kind=None):
+    """Return [(key, record, last_used)] newest first"""
+    records = []
+    keys_dir = Path(store_dir) / "keys"
+    if not keys_dir.is_dir():
+        return records
+    for entry in os.scandir(keys_dir):
+        if not entry.name.endswith('.json'):
+            continue
+        record = read_record(entry.path)
+        if record is None or (kind and record['kind'] != kind):
+            continue
+        try:
+            last_used = entry.stat().st_mtime
+        except OSError:
+            continue
+        records.append((entry.name[:-5], record, last_used))
+    records.sort(key=lambda r: -r[2])
+    return records
+
+def prune_due(store_dir=STORE_DIR, interval=PRUNE_INTERVAL_SECONDS):
+    """True if the last prune is older than interval; claims the next one by touching the marker"""
+    marker = Path(store_dir) / PRUNE_MARKER
+    try:
+        if time.time() - marker.stat().st_mtime < interval:
+            return False
+    except OSError:
+        pass
+    try:
+        marker.touch()
+    except OSError:
+        pass
+    return True
+
+def prune(store_dir=STORE_DIR, max_bytes=MAX_STORE_BYTES, max_age_days=MAX_AGE_DAYS):
+    """Apply the retention policy; returns (keys removed, objects removed, bytes freed)"""
+    now = time.time()
+    cutoff = now - max_age_days * 86400
+    removed_keys = 0
+    kept_objects = set()
+    total = 0
+    for key, record, last_used in list_records(store_dir):
+        digest = record['object']
+        new_object = digest not in kept_objects
+        if last_used < cutoff or (new_object and total + record['size'] > max_bytes and kept_objects):
+            try:
+                key_path(key, store_dir).unlink()
+                removed_keys += 1
+            except OSError:
+                pass
+            continue
+        if new_object:
+            kept_objects.add(digest)
+            total += record['size']
+
+    removed_objects = 0
+    freed = 0
+    objects_dir = Path(store_dir) / "objects"
+    if objects_dir.is_dir():
+        for report in objects_dir.glob("*/*.md"):
+            if report.stem in kept_objects:
+                continue
+            try:
+                st = report.stat()
+                if st.st_mtime > now - ORPHAN_GRACE_SECONDS:
+                    continue
+                report.unlink()
+            except OSError:
+                continue
+            removed_objects += 1
+            freed += st.st_size
+    return removed_keys, removed_objects, freed
+
+def main():
+    argv = sys.argv[1:]
+    command = argv.pop(0) if argv else 'list'
+
+    if command == 'list' and len(argv) <= 1:
+        records = list_records(kind=argv[0] if argv else None)
+        if not records:
+            print(f"No reports stored in {STORE_DIR}")
+            return
+        print("| Key | Kind | Label | Last used | Size | Report |\n|-----|------|-------|-----------|------|--------|")
+        for key, record, last_used in records:
+            used = datetime.fromtimestamp(last_used).strftime("%Y-%m-%d %H:%M")
+            print(f"| {key[:12]} | {record['kind']} | {record['label']} | {used} | "
+                  f"{record['size']:,} B | `{object_path(record['object'])}` |")
+    elif command == 'show' and len(argv) == 1:
+        matches = [r for r in list_records() if r[0].startswith(argv[0])]
+        if len(matches) != 1:
+            print(f"❌ Error: {len(matches)} reports match key {argv[0]}", file=sys.stderr)
+            sys.exit(1)
+        print(object_path(matches[0][1]['object']).read_text())
+    elif command == 'prune':
+        max_bytes = MAX_STORE_BYTES
+        max_age_days = MAX_AGE_DAYS
+        while argv:
+            arg = argv.pop(0)
+            if arg == '--max-mb' and argv and argv[0].isdigit():
+                max_bytes = int(argv.pop(0)) * 1024 * 1024
+            elif arg == '--max-age-days' and argv and argv[0].isdigit():
+                max_age_days = int(argv.pop(0))
+            else:
+                print("Usage: python3.11 report_store.py prune [--max-mb <n>] [--max-age-days <n>]")
+                sys.exit(1)
+        keys, objects, freed = prune(STORE_DIR, max_bytes, max_age_days)
+        print(f"🧹 Removed {keys} keys and {objects} reports ({freed:,} bytes)")
+    else:
+        print("Usage: python3.11 report_store.py [list [kind]] | show <key> | prune [--max-mb <n>] [--max-age-days <n>]")
+        print("Example: python3.11 report_store.py list context")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,25 @@
 #!/usr/bin/env python3.11
 """
 suggest_seeds.py - Suggest relevant seeds based on task context
-Usage: python3.11 suggest_seeds.py <keywords...>
+Usage: python3.11 suggest_seeds.py <keywords...> [--no-cache] [--profile[=<file>]]
 Example: python3.11 suggest_seeds.py multi-agent architecture coordination
+
+Suggestions are saved to the shared report store (see report_store.py), keyed
+by the keywords and a fingerprint of the seed catalog; repeating a query
+prints the stored suggestions. --no-cache always regenerates.
+
+--profile writes a per-phase timing trace (see profiling.py).
 """
 
 import sys
 import json
+import hashlib
 from pathlib import Path
 from datetime import datetime
 
+from profiling import init_from_argv, phase
+from report_store import lookup, save
+
 SEEDS_DIR = Path(__file__).parent.parent / "seeds"
 
 # Seed trigger keywords (extracted from seed definitions)
@@ -86,6 +96,14 @@ def load_seed_metadata(seed_file):
     
     return {}
 
+def catalog_fingerprint():
+    """Hash the seed files' names, sizes and mtimes plus this script (which holds the triggers)"""
+    digest = hashlib.sha256()
+    for path in sorted(SEEDS_DIR.glob("*.md")) + [Path(__file__)]:
+        st = path.stat()
+        digest.update(f"{path.name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
 def calculate_relevance(keywords, seed_id):
     """Calculate relevance score for a seed based on keywords"""
     triggers = SEED_TRIGGERS.get(seed_id, [])
@@ -160,8 +178,11 @@ def generate_markdown_output(keywords, suggestions):
     return md
 
 def main():
+    init_from_argv(sys.argv)
+    use_cache = '--no-cache' not in sys.argv
+    sys.argv = [arg for arg in sys.argv if arg != '--no-cache']
     if len(sys.argv) < 2:
-        print("Usage: python3.11 suggest_seeds.py <keywords...>")
+        print("Usage: python3.11 suggest_seeds.py <keywords...> [--no-cache] [--profile[=<file>]]")
         print("Example: python3.11 suggest_seeds.py multi-agent architecture coordination")
         sys.exit(1)
     
@@ -169,14 +190,23 @@ def main():
     
     print(f"🔍 Suggesting seeds for: {', '.join(keywords)}")
     
-    suggestions = suggest_seeds(keywords)
-    output = generate_markdown_output(keywords, suggestions)
+    inputs = {'keywords': [k.lower() for k in keywords], 'catalog': catalog_fingerprint()}
+    cached = lookup('seed-suggestions', inputs) if use_cache else None
+    if cached:
+        print(cached.read_text())
+        print(f"\n✅ Suggestions saved to: {cached}")
+        return
+    
+    with phase("score_seeds"):
+        suggestions = suggest_seeds(keywords)
+    with phase("render"):
+        output = generate_markdown_output(keywords, suggestions)
     
     print(output)
     
-    # Save to file
-    output_file = Path.home() / "seed-suggestions.md"
-    output_file.write_text(output)
+    # Save to the report store
+    with phase("write_output"):
+        output_file = save('seed-suggestions', inputs, output, label=' '.join(keywords))
     print(f"\n✅ Suggestions saved to: {output_file}")
 
 if __name__ == "__main__":
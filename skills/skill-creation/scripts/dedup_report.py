@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Duplicate content report across skill and seed markdown
+
+Splits every markdown file under the skills directory into content-defined
+chunks with a Gear rolling hash, so identical passages produce identical
+chunks wherever they appear in a file. Chunks seen more than once are
+reported with the tokens they cost, and a deduplicated bundle can be written
+where each distinct chunk is stored once and files are lists of chunk IDs.
+
+Usage:
+    dedup_report.py [skills-dir] [--top <n>] [--min-tokens <n>] [--bundle <file>] [--json]
+
+Examples:
+    dedup_report.py ./skills
+    dedup_report.py ./skills --top 10 --bundle /tmp/skills-bundle.json
+
+Skills are expected at /home/ubuntu/skills/ unless a directory is given.
+"""
+
+import hashlib
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+from token_profile import SKILLS_BASE_PATH, estimate_tokens
+
+# Chunk boundaries are only placed at line ends, so blocks stay readable.
+# A line end is a boundary when MASK_BITS bits of the rolling hash are zero,
+# giving an average of 2**MASK_BITS lines per chunk. Bits from position 32 up
+# are used because the low bits only depend on the last few bytes.
+MASK_BITS = 2
+MIN_CHUNK = 64
+MAX_CHUNK = 4096
+DEFAULT_MIN_TOKENS = 16
+DEFAULT_TOP = 20
+
+# Fixed seed so chunk boundaries (and bundle IDs) are stable between runs
+_gear_rng = random.Random(0x5eed)
+GEAR = [_gear_rng.getrandbits(64) for _ in range(256)]
+HASH_MASK = (1 << 64) - 1
+
+
+def chunk_boundaries(data):
+    """
+    Yield (start, end) byte ranges of content-defined chunks of data.
+
+    The Gear hash shifts left once per byte, so it depends only on the last
+    64 bytes; the same passage yields the same boundaries wherever it occurs.
+    """
+    gear = GEAR
+    boundary_mask = (1 << MASK_BITS) - 1
+    h = 0
+    start = 0
+    for i, byte in enumerate(data):
+        h = ((h << 1) + gear[byte]) & HASH_MASK
+        if byte != 10:
+            continue
+        size = i + 1 - start
+        if size >= MAX_CHUNK or (size >= MIN_CHUNK and not (h >> 32) & boundary_mask):
+            yield start, i + 1
+            start = i + 1
+    if start < len(data):
+        yield start, len(data)
+
+
+def chunk_files(skills_dir):
+    """
+    Chunk every markdown file under skills_dir in one pass.
+
+    Returns (files, chunks): files maps relative path -> list of chunk
+    digests in order; chunks maps digest -> {'text', 'tokens', 'files'}.
+    """
+    skills_dir = Path(skills_dir)
+    files = {}
+    chunks = {}
+    for path in sorted(skills_dir.rglob('*.md')):
+        rel = str(path.relative_to(skills_dir))
+        data = path.read_bytes()
+        digests = []
+        for start, end in chunk_boundaries(data):
+            block = data[start:end]
+            digest = hashlib.blake2b(block, digest_size=8).hexdigest()
+            entry = chunks.get(digest)
+            if entry is None:
+                text = block.decode('utf-8', errors='replace')
+                entry = chunks[digest] = {'text': text, 'tokens': estimate_tokens(text), 'files': []}
+            entry['files'].append(rel)
+            digests.append(digest)
+        files[rel] = digests
+    return files, chunks
+
+
+def find_duplicates(chunks, min_tokens=DEFAULT_MIN_TOKENS):
+    """
+    Return duplicated chunks, most wasteful first.
+
+    Whitespace-only chunks and chunks under min_tokens are ignored. Wasted
+    tokens are the chunk's tokens times its extra occurrences.
+    """
+    duplicates = []
+    for digest, entry in chunks.items():
+        count = len(entry['files'])
+        if count < 2 or entry['tokens'] < min_tokens or not entry['text'].strip():
+            continue
+        duplicates.append({
+            'id': digest,
+            'count': count,
+            'tokens': entry['tokens'],
+            'wasted_tokens': entry['tokens'] * (count - 1),
+            'files': sorted(set(entry['files'])),
+            'text': entry['text'],
+        })
+    duplicates.sort(key=lambda d: d['wasted_tokens'], reverse=True)
+    return duplicates
+
+
+def build_bundle(files, chunks):
+    """Build a deduplicated bundle: each distinct chunk once, files as chunk ID lists."""
+    return {
+        'version': 1,
+        'blocks': {digest: entry['text'] for digest, entry in chunks.items()},
+        'files': files,
+    }
+
+
+def expand_bundle(bundle, rel_path):
+    """Reconstruct one file's text from a bundle."""
+    return ''.join(bundle['blocks'][digest] for digest in bundle['files'][rel_path])
+
+
+def generate_report(skills_dir, min_tokens=DEFAULT_MIN_TOKENS):
+    """Chunk the tree and summarize duplication. Returns (report, files, chunks)."""
+    started = time.perf_counter()
+    files, chunks = chunk_files(skills_dir)
+    duplicates = find_duplicates(chunks, min_tokens)
+    elapsed = time.perf_counter() - started
+
+    total_tokens = sum(
+        chunks[digest]['tokens'] for digests in files.values() for digest in digests
+    )
+    unique_tokens = sum(entry['tokens'] for entry in chunks.values())
+    report = {
+        'skills_dir': str(skills_dir),
+        'files': len(files),
+        'chunks': sum(len(digests) for digests in files.values()),
+        'unique_chunks': len(chunks),
+        'total_tokens': total_tokens,
+        'unique_tokens': unique_tokens,
+        'duplicated_tokens': sum(d['wasted_tokens'] for d in duplicates),
+        'elapsed_ms': round(elapsed * 1000, 1),
+        'duplicates': duplicates,
+    }
+    return report, files, chunks
+
+
+def generate_markdown_output(report, top=DEFAULT_TOP):
+    """Render the duplication report as markdown."""
+    md = f"""# Skill Content Duplication Report
+
+**Directory:** `{report['skills_dir']}`
+**Files:** {report['files']} | **Chunks:** {report['chunks']} ({report['unique_chunks']} unique)
+**Tokens:** {report['total_tokens']:,} total, {report['unique_tokens']:,} after dedup
+**Duplicated blocks cost:** {report['duplicated_tokens']:,} tokens
+**Scan time:** {report['elapsed_ms']} ms
+
+"""
+    duplicates = report['duplicates']
+    if not duplicates:
+        return md + "No duplicated blocks found.\n"
+
+    md += f"## Top {min(top, len(duplicates))} Duplicated Blocks\n\n"
+    for i, dup in enumerate(duplicates[:top], 1):
+        preview = ' '.join(dup['text'].split())[:120]
+        md += f"### {i}. `{dup['id']}` - {dup['count']}x, {dup['tokens']} tokens each ({dup['wasted_tokens']} wasted)\n\n"
+        md += f"> {preview}...\n\n"
+        for f in dup['files'][:10]:
+            md += f"- `{f}`\n"
+        if len(dup['files']) > 10:
+            md += f"- ... and {len(dup['files']) - 10} more files\n"
+        md += "\n"
+    return md
+
+
+def main():
+    args = sys.argv[1:]
+    skills_dir = SKILLS_BASE_PATH
+    top = DEFAULT_TOP
+    min_tokens = DEFAULT_MIN_TOKENS
+    bundle_file = None
+    as_json = False
+
+    while args:
+        arg = args.pop(0)
+        if arg == '--top' and args:
+            top = int(args.pop(0))
+        elif arg == '--min-tokens' and args:
+            min_tokens = int(args.pop(0))
+        elif arg == '--bundle' and args:
+            bundle_file = Path(args.pop(0))
+        elif arg == '--json':
+            as_json = True
+        elif not arg.startswith('--'):
+            skills_dir = Path(arg)
+        else:
+            print("Usage: dedup_report.py [skills-dir] [--top <n>] [--min-tokens <n>] [--bundle <file>] [--json]")
+            sys.exit(1)
+
+    if not skills_dir.is_dir():
+        print(f"❌ Error: {skills_dir} is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    report, files, chunks = generate_report(skills_dir, min_tokens)
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(generate_markdown_output(report, top))
+
+    if bundle_file:
+        bundle_file.write_text(json.dumps(build_bundle(files, chunks), separators=(',', ':')))
+        print(f"✅ Deduplicated bundle saved to: {bundle_file}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
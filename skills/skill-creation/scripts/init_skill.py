@@ -3,22 +3,42 @@
 Skill Initializer - Creates a new skill from template
 
 Usage:
-    init_skill.py <skill-name>
+    init_skill.py <skill-name> [--path <skills-dir>]
+    init_skill.py --batch <spec-file> [--path <skills-dir>] [--templates <dir>]
 
 Examples:
     init_skill.py my-new-skill
     init_skill.py my-api-helper
+    init_skill.py --batch skill-pack.yaml --path ./skills
 
-Skills are created at /home/ubuntu/skills/<skill-name>/
+Skills are created at /home/ubuntu/skills/<skill-name>/ unless --path is given.
+
+Batch spec files (YAML or JSON) list the skills to create:
+
+    skills:
+      - name: data-analyzer
+        description: Analyze CSV data. Use when ...
+        resources: [scripts, references]
+      - name: report-writer
+
+Batch mode stages every skill in a temporary directory, validates each one
+with the quick_validate.py rules, and only moves them into place when all of
+them pass, so a failed run leaves nothing half-written.
 """
 
+import json
+import re
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+import yaml
+
 
 SKILL_TEMPLATE = """---
 name: {skill_name}
-description: [TODO: Complete and informative explanation of what the skill does and when to use it. Include WHEN to use this skill - specific scenarios, file types, or tasks that trigger it.]
+description: {description}
 ---
 
 # {skill_title}
@@ -187,6 +207,19 @@ Note: This is a text placeholder. Actual templates can be any file type.
 """
 
 
+DEFAULT_DESCRIPTION = "[TODO: Complete and informative explanation of what the skill does and when to use it. Include WHEN to use this skill - specific scenarios, file types, or tasks that trigger it.]"
+
+RESOURCE_DIRS = ('scripts', 'references', 'templates')
+
+# Template name -> (built-in content, path written inside the skill)
+TEMPLATE_FILES = {
+    'SKILL.md': (SKILL_TEMPLATE, 'SKILL.md'),
+    'example.py': (EXAMPLE_SCRIPT, 'scripts/example.py'),
+    'api_reference.md': (EXAMPLE_REFERENCE, 'references/api_reference.md'),
+    'example_template.txt': (EXAMPLE_TEMPLATE, 'templates/example_template.txt'),
+}
+
+
 def title_case_skill_name(skill_name):
     """Convert hyphenated skill name to Title Case for display."""
     return ' '.join(word.capitalize() for word in skill_name.split('-'))
@@ -195,18 +228,74 @@ def title_case_skill_name(skill_name):
 SKILLS_BASE_PATH = "/home/ubuntu/skills"
 
 
-def init_skill(skill_name):
+def load_templates(template_dir=None):
+    """
+    Load template strings, overriding the built-in ones with files from template_dir.
+
+    A file in template_dir named like a key of TEMPLATE_FILES (e.g. SKILL.md)
+    replaces the corresponding built-in template.
+    """
+    templates = {name: content for name, (content, _) in TEMPLATE_FILES.items()}
+    if template_dir:
+        for name in TEMPLATE_FILES:
+            override = Path(template_dir) / name
+            if override.is_file():
+                templates[name] = override.read_text()
+    return templates
+
+
+def yaml_scalar(value):
+    """Return value as a YAML scalar, quoting it only when plain style would not round-trip."""
+    try:
+        if yaml.safe_load(value) == value:
+            return value
+    except yaml.YAMLError:
+        pass
+    return json.dumps(value, ensure_ascii=False)
+
+
+def render_skill(skill_dir, skill_name, description=None, resources=RESOURCE_DIRS, templates=None):
+    """
+    Write SKILL.md and the requested resource directories into skill_dir.
+
+    Returns the list of files written, relative to skill_dir.
+    """
+    if templates is None:
+        templates = load_templates()
+
+    values = {
+        'skill_name': skill_name,
+        'skill_title': title_case_skill_name(skill_name),
+        'description': yaml_scalar(description or DEFAULT_DESCRIPTION),
+    }
+
+    written = []
+    for name, (_, relative_path) in TEMPLATE_FILES.items():
+        resource = relative_path.split('/')[0] if '/' in relative_path else None
+        if resource and resource not in resources:
+            continue
+        target = skill_dir / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(templates[name].format(**values))
+        if target.suffix == '.py':
+            target.chmod(0o755)
+        written.append(relative_path)
+    return written
+
+
+def init_skill(skill_name, base_path=SKILLS_BASE_PATH):
     """
     Initialize a new skill directory with template SKILL.md.
 
     Args:
         skill_name: Name of the skill
+        base_path: Directory the skill is created in
 
     Returns:
         Path to created skill directory, or None if error
     """
     # Determine skill directory path
-    skill_dir = Path(SKILLS_BASE_PATH) / skill_name
+    skill_dir = Path(base_path) / skill_name
 
     # Check if directory already exists
     if skill_dir.exists():
@@ -221,46 +310,12 @@ def init_skill(skill_name):
         print(f"❌ Error creating directory: {e}")
         return None
 
-    # Create SKILL.md from template
-    skill_title = title_case_skill_name(skill_name)
-    skill_content = SKILL_TEMPLATE.format(
-        skill_name=skill_name,
-        skill_title=skill_title
-    )
-
-    skill_md_path = skill_dir / 'SKILL.md'
+    # Create SKILL.md and resource directories with example files
     try:
-        skill_md_path.write_text(skill_content)
-        print("✅ Created SKILL.md")
+        for relative_path in render_skill(skill_dir, skill_name):
+            print(f"✅ Created {relative_path}")
     except Exception as e:
-        print(f"❌ Error creating SKILL.md: {e}")
-        return None
-
-    # Create resource directories with example files
-    try:
-        # Create scripts/ directory with example script
-        scripts_dir = skill_dir / 'scripts'
-        scripts_dir.mkdir(exist_ok=True)
-        example_script = scripts_dir / 'example.py'
-        example_script.write_text(EXAMPLE_SCRIPT.format(skill_name=skill_name))
-        example_script.chmod(0o755)
-        print("✅ Created scripts/example.py")
-
-        # Create references/ directory with example reference doc
-        references_dir = skill_dir / 'references'
-        references_dir.mkdir(exist_ok=True)
-        example_reference = references_dir / 'api_reference.md'
-        example_reference.write_text(EXAMPLE_REFERENCE.format(skill_title=skill_title))
-        print("✅ Created references/api_reference.md")
-
-        # Create templates/ directory with example template placeholder
-        templates_dir = skill_dir / 'templates'
-        templates_dir.mkdir(exist_ok=True)
-        example_template = templates_dir / 'example_template.txt'
-        example_template.write_text(EXAMPLE_TEMPLATE)
-        print("✅ Created templates/example_template.txt")
-    except Exception as e:
-        print(f"❌ Error creating resource directories: {e}")
+        print(f"❌ Error creating skill files: {e}")
         return None
 
     # Print next steps
@@ -273,27 +328,213 @@ def init_skill(skill_name):
     return skill_dir
 
 
+def check_skill_name(name):
+    """
+    Return why name is not a valid skill directory name, or None if it is.
+
+    Applies quick_validate's hyphen-case and length rules, which also rule
+    out '/', '..' and anything else that could leave the skills directory.
+    """
+    if not re.match(r'^[a-z0-9-]+$', name):
+        return f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    if name.startswith('-') or name.endswith('-') or '--' in name:
+        return f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
+    if len(name) > 64:
+        return f"Name is too long ({len(name)} characters). Maximum is 64 characters."
+    return None
+
+
+def load_batch_spec(spec_path):
+    """
+    Load a batch spec file (YAML or JSON) into a list of skill entries.
+
+    Each entry is a dict with 'name' and optional 'description' and
+    'resources' (a list, subset of RESOURCE_DIRS; defaults to all of them).
+    Every name is checked with check_skill_name before anything is written.
+    """
+    text = Path(spec_path).read_text()
+    if Path(spec_path).suffix == '.json':
+        spec = json.loads(text)
+    else:
+        spec = yaml.safe_load(text)
+
+    if isinstance(spec, dict):
+        spec = spec.get('skills', [])
+    if not isinstance(spec, list):
+        raise ValueError("Spec must be a list of skills or a mapping with a 'skills' list")
+
+    entries = []
+    for item in spec:
+        if isinstance(item, str):
+            item = {'name': item}
+        if not isinstance(item, dict) or not item.get('name'):
+            raise ValueError(f"Invalid skill entry: {item!r}")
+        problem = check_skill_name(str(item['name']))
+        if problem:
+            raise ValueError(problem)
+        description = item.get('description')
+        if description is not None and not isinstance(description, str):
+            raise ValueError(f"Description for '{item['name']}' must be a string, got {description!r}")
+        resources = item.get('resources', list(RESOURCE_DIRS))
+        if not isinstance(resources, list):
+            raise ValueError(f"Resources for '{item['name']}' must be a list, got {resources!r}")
+        unknown = set(map(str, resources)) - set(RESOURCE_DIRS)
+        if unknown:
+            raise ValueError(
+                f"Unknown resource dir(s) for '{item['name']}': {', '.join(sorted(unknown))}"
+            )
+        entries.append({
+            'name': str(item['name']),
+            'description': description,
+            'resources': tuple(resources),
+        })
+    return entries
+
+
+def init_skills_batch(entries, base_path=SKILLS_BASE_PATH, template_dir=None):
+    """
+    Scaffold and validate many skills in one run.
+
+    All skills are written into a staging directory next to base_path,
+    validated with quick_validate.validate_skill, then renamed into place.
+    If any skill fails, nothing is left in base_path.
+
+    Args:
+        entries: Skill entries as returned by load_batch_spec
+        base_path: Directory the skills are created in
+        template_dir: Optional directory of template overrides
+
+    Returns:
+        (created_dirs, errors) - errors is a list of (skill_name, message)
+    """
+    from quick_validate import validate_skill
+
+    base = Path(base_path).resolve()
+    errors = []
+
+    names = [entry['name'] for entry in entries]
+    for name in names:
+        problem = check_skill_name(name)
+        if problem:
+            errors.append((name, problem))
+    if errors:
+        return [], errors
+    for name in sorted({n for n in names if names.count(n) > 1}):
+        errors.append((name, "Listed more than once in spec"))
+    for name in names:
+        if (base / name).exists():
+            errors.append((name, f"Skill directory already exists: {base / name}"))
+    if errors:
+        return [], errors
+
+    templates = load_templates(template_dir)
+    base.mkdir(parents=True, exist_ok=True)
+    # Stage inside base_path so the final rename never crosses filesystems
+    staging = Path(tempfile.mkdtemp(prefix='.init-skill-', dir=base))
+    created = []
+    try:
+        for entry in entries:
+            skill_dir = staging / entry['name']
+            if skill_dir.resolve().parent != staging.resolve():
+                errors.append((entry['name'], "Skill directory would be outside the staging directory"))
+                continue
+            skill_dir.mkdir()
+            try:
+                render_skill(skill_dir, entry['name'], entry['description'],
+                             entry['resources'], templates)
+            except (KeyError, ValueError, IndexError) as e:
+                errors.append((entry['name'], f"Template error: {e}"))
+                continue
+            valid, message = validate_skill(skill_dir)
+            if not valid:
+                errors.append((entry['name'], message))
+        if errors:
+            return [], errors
+
+        for entry in entries:
+            target = base / entry['name']
+            (staging / entry['name']).rename(target)
+            created.append(target)
+    except OSError as e:
+        # Roll back anything already moved so the run stays all-or-nothing
+        for target in created:
+            shutil.rmtree(target, ignore_errors=True)
+        return [], [('*', f"Error writing skills: {e}")]
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    return created, errors
+
+
+def print_usage():
+    print("Usage: init_skill.py <skill-name> [--path <skills-dir>]")
+    print("       init_skill.py --batch <spec-file> [--path <skills-dir>] [--templates <dir>]")
+    print("\nSkill name requirements:")
+    print("  - Hyphen-case identifier (e.g., 'data-analyzer')")
+    print("  - Lowercase letters, digits, and hyphens only")
+    print("  - Max 64 characters")
+    print("  - Must match directory name exactly")
+    print("\nExamples:")
+    print("  init_skill.py my-new-skill")
+    print("  init_skill.py my-api-helper")
+    print("  init_skill.py --batch skill-pack.yaml --path ./skills")
+    print(f"\nSkills are created at {SKILLS_BASE_PATH}/<skill-name>/ unless --path is given")
+
+
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: init_skill.py <skill-name>")
-        print("\nSkill name requirements:")
-        print("  - Hyphen-case identifier (e.g., 'data-analyzer')")
-        print("  - Lowercase letters, digits, and hyphens only")
-        print("  - Max 64 characters")
-        print("  - Must match directory name exactly")
-        print("\nExamples:")
-        print("  init_skill.py my-new-skill")
-        print("  init_skill.py my-api-helper")
-        print(f"\nSkills are created at {SKILLS_BASE_PATH}/<skill-name>/")
+    args = sys.argv[1:]
+    options = {}
+    positional = []
+    while args:
+        arg = args.pop(0)
+        if arg in ('--batch', '--path', '--templates'):
+            if not args:
+                print_usage()
+                sys.exit(1)
+            options[arg] = args.pop(0)
+        else:
+            positional.append(arg)
+
+    base_path = options.get('--path', SKILLS_BASE_PATH)
+
+    if '--batch' in options:
+        if positional:
+            print_usage()
+            sys.exit(1)
+        spec_path = options['--batch']
+        try:
+            entries = load_batch_spec(spec_path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            print(f"❌ Error reading spec {spec_path}: {e}")
+            sys.exit(1)
+
+        print(f"🚀 Initializing {len(entries)} skill(s) from: {spec_path}")
+        print(f"   Location: {base_path}")
+        print()
+
+        created, errors = init_skills_batch(entries, base_path, options.get('--templates'))
+        if errors:
+            for name, message in errors:
+                print(f"❌ {name}: {message}")
+            print("\n❌ Batch aborted - no skills were written")
+            sys.exit(1)
+
+        for skill_dir in created:
+            print(f"✅ Created and validated: {skill_dir}")
+        print(f"\n✅ {len(created)} skill(s) initialized successfully")
+        sys.exit(0)
+
+    if len(positional) != 1:
+        print_usage()
         sys.exit(1)
 
-    skill_name = sys.argv[1]
+    skill_name = positional[0]
 
     print(f"🚀 Initializing skill: {skill_name}")
-    print(f"   Location: {SKILLS_BASE_PATH}/{skill_name}")
+    print(f"   Location: {base_path}/{skill_name}")
     print()
 
-    result = init_skill(skill_name)
+    result = init_skill(skill_name, base_path)
 
     if result:
         sys.exit(0)
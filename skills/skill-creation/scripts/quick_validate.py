@@ -3,7 +3,7 @@
 Quick validation script for skills - minimal version
 
 Usage:
-    quick_validate.py <skill-name>
+    quick_validate.py <skill-name> [--profile[=<file>]]
     quick_validate.py <absolute-path-to-skill>
 
 Examples:
@@ -11,6 +11,8 @@ Examples:
     quick_validate.py /home/ubuntu/skills/my-skill
 
 Skills are expected at /home/ubuntu/skills/<skill-name>/
+
+--profile writes a per-phase timing trace (see profiling.py).
 """
 
 import sys
@@ -18,6 +20,8 @@ import re
 import yaml
 from pathlib import Path
 
+from profiling import init_from_argv, phase
+
 SKILLS_BASE_PATH = Path("/home/ubuntu/skills")
 
 
@@ -115,6 +119,7 @@ def validate_skill(skill_path_or_name):
     return True, "Skill is valid!"
 
 if __name__ == "__main__":
+    init_from_argv(sys.argv)
     if len(sys.argv) != 2:
         print("Usage: quick_validate.py <skill-name>")
         print("       quick_validate.py <absolute-path-to-skill>")
@@ -129,6 +134,7 @@ if __name__ == "__main__":
     
     print(f"🔍 Validating skill at: {resolved_path}")
     
-    valid, message = validate_skill(skill_input)
+    with phase("validate"):
+        valid, message = validate_skill(skill_input)
     print(message)
     sys.exit(0 if valid else 1)
\ No newline at end of file
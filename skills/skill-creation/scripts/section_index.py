@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Section index for progressive disclosure of skill content
+
+Splits every SKILL.md and reference file into addressable sections (one per
+heading) with byte offsets and token estimates, and serves a single section by
+ID with a seek + read instead of loading the whole file.
+
+Usage:
+    section_index.py build [skills-dir] [--index <file>] [--max-level <n>]
+    section_index.py list [skill-name] [--index <file>]
+    section_index.py read <section-id> [--index <file>]
+
+Examples:
+    section_index.py build ./skills
+    section_index.py list seed-library
+    section_index.py read seed-library/SKILL.md#how-to-apply
+
+Section IDs have the form <skill>/<file>#<heading-slug>. The frontmatter of a
+SKILL.md is the section <skill>/SKILL.md#frontmatter. Rebuilding only re-reads
+files whose size or mtime changed since the last build.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+from token_profile import SKILLS_BASE_PATH, estimate_tokens, find_reference_files
+
+INDEX_FILE = Path.home() / ".skill-section-index.json"
+INDEX_VERSION = 1
+DEFAULT_MAX_LEVEL = 3
+
+HEADING_RE = re.compile(rb'^(#{1,6})[ \t]+(.*?)[ \t]*#*[ \t]*\r?\n?$')
+FENCE_PREFIXES = (b'```', b'~~~')
+
+# Positions of the fields in each compact section row
+S_FILE, S_START, S_LENGTH, S_LEVEL, S_TOKENS, S_SLUG, S_HEADING = range(7)
+
+
+def slugify(heading):
+    """Convert a heading to a GitHub-style anchor slug."""
+    slug = re.sub(r'[^\w\s-]', '', heading.lower()).strip()
+    return re.sub(r'[\s]+', '-', slug) or 'section'
+
+
+def split_file_sections(data, is_skill_md=False, max_level=DEFAULT_MAX_LEVEL):
+    """
+    Split file bytes into sections at headings up to max_level.
+
+    Returns a list of (start, length, level, heading) tuples covering the
+    whole file. Text before the first heading is the 'preamble' section
+    (level 0); SKILL.md frontmatter is the 'frontmatter' section.
+    """
+    sections = []
+    offset = 0
+    heading, level, start = 'preamble', 0, 0
+
+    if is_skill_md:
+        match = re.match(rb'^---\r?\n.*?\r?\n---[ \t]*\r?\n?', data, re.DOTALL)
+        if match:
+            sections.append((0, match.end(), 0, 'frontmatter'))
+            offset = start = match.end()
+
+    in_fence = False
+    for line in data[offset:].splitlines(keepends=True):
+        if line.lstrip().startswith(FENCE_PREFIXES):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line)
+        if match and len(match.group(1)) <= max_level:
+            if offset > start and data[start:offset].strip():
+                sections.append((start, offset - start, level, heading))
+            heading = match.group(2).decode('utf-8', errors='replace')
+            level, start = len(match.group(1)), offset
+        offset += len(line)
+
+    if offset > start and data[start:offset].strip():
+        sections.append((start, offset - start, level, heading))
+    return sections
+
+
+def index_file(path, is_skill_md, max_level):
+    """Build the section rows (without file index) for one file."""
+    data = path.read_bytes()
+    rows = []
+    seen = {}
+    for start, length, level, heading in split_file_sections(data, is_skill_md, max_level):
+        slug = slugify(heading)
+        seen[slug] = seen.get(slug, 0) + 1
+        if seen[slug] > 1:
+            slug = f"{slug}-{seen[slug]}"
+        text = data[start:start + length].decode('utf-8', errors='ignore')
+        rows.append([start, length, level, estimate_tokens(text), slug, heading])
+    return rows
+
+
+def build_index(skills_dir, max_level=DEFAULT_MAX_LEVEL, previous=None):
+    """
+    Index every SKILL.md and reference file under skills_dir.
+
+    Files whose size and mtime match the previous index are not re-read.
+    """
+    skills_dir = Path(skills_dir).resolve()
+    reusable = {}
+    if previous and previous.get('root') == str(skills_dir) and previous.get('max_level') == max_level:
+        rows_by_file = {}
+        for row in previous['sections']:
+            rows_by_file.setdefault(row[S_FILE], []).append(row[1:])
+        for i, (rel, size, mtime_ns) in enumerate(previous['files']):
+            reusable[rel] = (size, mtime_ns, rows_by_file.get(i, []))
+
+    files = []
+    sections = []
+    for skill_dir in sorted(skills_dir.iterdir()):
+        skill_md = skill_dir / 'SKILL.md'
+        if not skill_md.is_file():
+            continue
+        for path in [skill_md] + find_reference_files(skill_dir):
+            rel = str(path.relative_to(skills_dir))
+            stat = path.stat()
+            cached = reusable.get(rel)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                rows = cached[2]
+            else:
+                rows = index_file(path, path == skill_md, max_level)
+            file_id = len(files)
+            files.append([rel, stat.st_size, stat.st_mtime_ns])
+            sections.extend([file_id] + row for row in rows)
+
+    return {
+        'version': INDEX_VERSION,
+        'root': str(skills_dir),
+        'max_level': max_level,
+        'files': files,
+        'sections': sections,
+    }
+
+
+def save_index(index, index_file=INDEX_FILE):
+    """Write the index as compact JSON."""
+    index_file.write_text(json.dumps(index, separators=(',', ':')))
+
+
+def load_index(index_file=INDEX_FILE):
+    """Load a saved index, or None if it is missing or from another version."""
+    if not index_file.exists():
+        return None
+    index = json.loads(index_file.read_text())
+    if index.get('version') != INDEX_VERSION:
+        return None
+    return index
+
+
+def section_id(index, row):
+    """Return the public ID of a section row."""
+    return f"{index['files'][row[S_FILE]][0]}#{row[S_SLUG]}"
+
+
+def list_sections(index, skill_name=None):
+    """
+    List sections as dicts, optionally restricted to one skill.
+
+    Each dict has id, heading, level, tokens and bytes.
+    """
+    results = []
+    for row in index['sections']:
+        rel = index['files'][row[S_FILE]][0]
+        if skill_name and rel.split('/', 1)[0] != skill_name:
+            continue
+        results.append({
+            'id': section_id(index, row),
+            'heading': row[S_HEADING],
+            'level': row[S_LEVEL],
+            'tokens': row[S_TOKENS],
+            'bytes': row[S_LENGTH],
+        })
+    return results
+
+
+def find_section(index, wanted_id):
+    """Look up a section row by ID, or None if it is not indexed."""
+    rel, _, slug = wanted_id.partition('#')
+    for row in index['sections']:
+        if row[S_SLUG] == slug and index['files'][row[S_FILE]][0] == rel:
+            return row
+    return None
+
+
+def read_section(index, wanted_id):
+    """
+    Return the text of one section by seeking directly to its byte range.
+
+    Raises KeyError if the section is not indexed and ValueError if the file
+    changed since the index was built (rebuild the index in that case).
+    """
+    row = find_section(index, wanted_id)
+    if row is None:
+        raise KeyError(f"Section not found: {wanted_id}")
+
+    rel, size, mtime_ns = index['files'][row[S_FILE]]
+    path = Path(index['root']) / rel
+    stat = path.stat()
+    if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+        raise ValueError(f"{rel} changed since the index was built")
+
+    with open(path, 'rb') as f:
+        f.seek(row[S_START])
+        return f.read(row[S_LENGTH]).decode('utf-8', errors='ignore')
+
+
+def main():
+    args = sys.argv[1:]
+    index_file = INDEX_FILE
+    max_level = DEFAULT_MAX_LEVEL
+    positional = []
+    while args:
+        arg = args.pop(0)
+        if arg == '--index' and args:
+            index_file = Path(args.pop(0))
+        elif arg == '--max-level' and args:
+            max_level = int(args.pop(0))
+        else:
+            positional.append(arg)
+
+    if not positional or positional[0] not in ('build', 'list', 'read'):
+        print("Usage: section_index.py build [skills-dir] [--index <file>] [--max-level <n>]")
+        print("       section_index.py list [skill-name] [--index <file>]")
+        print("       section_index.py read <section-id> [--index <file>]")
+        print("\nExamples:")
+        print("  section_index.py build ./skills")
+        print("  section_index.py read seed-library/SKILL.md#how-to-apply")
+        sys.exit(1)
+
+    command = positional[0]
+
+    if command == 'build':
+        skills_dir = Path(positional[1]) if len(positional) > 1 else SKILLS_BASE_PATH
+        if not skills_dir.is_dir():
+            print(f"❌ Error: {skills_dir} is not a directory", file=sys.stderr)
+            sys.exit(1)
+        index = build_index(skills_dir, max_level, load_index(index_file))
+        save_index(index, index_file)
+        print(f"✅ Indexed {len(index['sections'])} sections in {len(index['files'])} files")
+        print(f"   Saved to: {index_file}")
+        return
+
+    index = load_index(index_file)
+    if index is None:
+        print(f"❌ No index at {index_file}. Run: section_index.py build [skills-dir]", file=sys.stderr)
+        sys.exit(1)
+
+    if command == 'list':
+        skill_name = positional[1] if len(positional) > 1 else None
+        for section in list_sections(index, skill_name):
+            indent = '  ' * max(section['level'] - 1, 0)
+            print(f"{section['tokens']:>6}  {indent}{section['id']}")
+        return
+
+    if len(positional) < 2:
+        print("Usage: section_index.py read <section-id> [--index <file>]")
+        sys.exit(1)
+    try:
+        print(read_section(index, positional[1]), end='')
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e.args[0]}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Route a prompt to the skills whose trigger phrases it matches
+
+Extracts the quoted trigger phrases ("Trigger phrases: ...", "Use when: ...")
+from every SKILL.md description, plus the skill name, and compiles them into
+one matcher: a regex alternation of all phrases for exact hits and an
+inverted index from word to phrases for partial hits. Ranking a prompt only
+touches the phrases that share a word with it, so it takes microseconds
+rather than loading 48 descriptions into context.
+
+Usage:
+    skill_router.py route "<prompt>" [--top <n>] [--skills-dir <dir>] [--index <file>]
+    skill_router.py build [skills-dir] [--index <file>]
+    skill_router.py list [skill-name] [--index <file>]
+
+Examples:
+    skill_router.py route "which seed applies here for multi-agent routing?"
+    skill_router.py list seed-library
+
+The phrase table is saved to ~/.skill-router.json with each SKILL.md's size
+and mtime; route and build re-read only the SKILL.md files that changed.
+Scoring follows suggest_seeds.py: a skill scores 1 per phrase found verbatim
+and the matched fraction of each phrase at least half of whose words appear.
+"""
+
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from token_profile import SKILLS_BASE_PATH
+
+ROUTER_FILE = Path.home() / ".skill-router.json"
+ROUTER_VERSION = 1
+DEFAULT_TOP = 5
+MIN_COVERAGE = 0.5
+
+FRONTMATTER_RE = re.compile(r'^---\r?\n(.*?)\r?\n---', re.DOTALL)
+TRIGGER_MARKER_RE = re.compile(r'trigger phrases|use when', re.IGNORECASE)
+QUOTED_RE = re.compile(r'"([^"\n]{3,120})"|(?<!\w)\'([^\'\n]{3,120})\'(?!\w)|“([^”\n]{3,120})”')
+PLACEHOLDER_RE = re.compile(r'\[[^\]]*\]')
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    'a', 'an', 'the', 'this', 'that', 'these', 'to', 'for', 'of', 'in', 'on', 'from',
+    'and', 'or', 'is', 'it', 'me', 'my', 'i', 'we', 'our', 'us', 'be', 'with', 'what',
+    'how', 'should', 'do', 'does', 'into', 'at', 'by', 'as', 'can', 'you', 'your',
+}
+
+# Positions of the fields in each phrase row
+P_SKILL, P_TEXT, P_WORDS = range(3)
+
+
+def stem(word):
+    """Fold simple plurals so 'skills' matches 'skill'."""
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def content_words(text):
+    """Return the distinct stemmed non-stopword words of text, in order."""
+    words = []
+    for word in WORD_RE.findall(text.lower()):
+        word = stem(word)
+        if word not in STOPWORDS and word not in words:
+            words.append(word)
+    return words
+
+
+def normalize(text):
+    """Lowercase text with punctuation collapsed to single spaces."""
+    return ' '.join(WORD_RE.findall(text.lower()))
+
+
+def read_description(skill_md):
+    """Return (name, description) from a SKILL.md frontmatter, without YAML parsing."""
+    match = FRONTMATTER_RE.match(skill_md.read_text(encoding='utf-8', errors='replace'))
+    if not match:
+        return None, ''
+    fields = {}
+    current = None
+    for line in match.group(1).splitlines():
+        key, sep, value = line.partition(':')
+        if sep and key and not key[0].isspace() and re.fullmatch(r'[\w-]+', key):
+            current = key
+            fields[key] = value.strip()
+        elif current and line[:1].isspace():
+            # Folded or block scalar continuation
+            fields[current] = (fields[current] + ' ' + line.strip()).strip()
+    description = fields.get('description', '')
+    if description[:1] in ('>', '|'):
+        description = description[2:].strip() if len(description) > 1 else ''
+    if len(description) > 1 and description[0] == description[-1] and description[0] in '"\'':
+        description = description[1:-1]
+    return fields.get('name') or skill_md.parent.name, description
+
+
+def extract_phrases(name, description):
+    """Return the trigger phrases of a skill: quoted phrases after the trigger marker, plus its name."""
+    marker = TRIGGER_MARKER_RE.search(description)
+    text = description[marker.start():] if marker else description
+    phrases = []
+    for match in QUOTED_RE.finditer(text):
+        phrase = PLACEHOLDER_RE.sub(' ', next(g for g in match.groups() if g))
+        phrase = normalize(phrase)
+        if phrase and phrase not in phrases:
+            phrases.append(phrase)
+    phrases.append(normalize(name.replace('-', ' ')))
+    return phrases
+
+
+def build_router(skills_dir, previous=None):
+    """
+    Collect trigger phrases for every skill under skills_dir.
+
+    SKILL.md files whose size and mtime match the previous router are not
+    re-read. Returns the router dict with 'skills', 'phrases' and 'postings'.
+    """
+    skills_dir = Path(skills_dir).resolve()
+    reusable = {}
+    if previous and previous.get('root') == str(skills_dir):
+        reusable = previous['skills']
+
+    skills = {}
+    reparsed = 0
+    for skill_dir in sorted(skills_dir.iterdir()):
+        skill_md = skill_dir / 'SKILL.md'
+        if not skill_md.is_file():
+            continue
+        stat = skill_md.stat()
+        cached = reusable.get(skill_dir.name)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            skills[skill_dir.name] = cached
+            continue
+        name, description = read_description(skill_md)
+        skills[skill_dir.name] = [stat.st_size, stat.st_mtime_ns, extract_phrases(name, description)]
+        reparsed += 1
+
+    if previous and not reparsed and skills.keys() == reusable.keys():
+        return previous
+
+    phrases = []
+    postings = {}
+    for skill, (_, _, skill_phrases) in skills.items():
+        for phrase in skill_phrases:
+            words = content_words(phrase)
+            if not words:
+                continue
+            phrase_id = len(phrases)
+            phrases.append([skill, phrase, words])
+            for word in words:
+                postings.setdefault(word, []).append(phrase_id)
+
+    return {
+        'version': ROUTER_VERSION,
+        'root': str(skills_dir),
+        'skills': skills,
+        'phrases': phrases,
+        'postings': postings,
+        'reparsed': reparsed,
+    }
+
+
+def save_router(router, router_file=ROUTER_FILE):
+    """Write the router as compact JSON (without the compiled pattern)."""
+    data = {k: v for k, v in router.items() if k not in ('pattern', 'reparsed')}
+    router_file.write_text(json.dumps(data, separators=(',', ':')))
+
+
+def load_router(router_file=ROUTER_FILE):
+    """Load a saved router, or None if it is missing or from another version."""
+    if not router_file.exists():
+        return None
+    try:
+        router = json.loads(router_file.read_text())
+    except ValueError:
+        return None
+    if router.get('version') != ROUTER_VERSION:
+        return None
+    return router
+
+
+def compile_router(router):
+    """Compile the exact-phrase matcher (longest phrases first) and map phrase text to IDs."""
+    if 'pattern' not in router:
+        by_text = {}
+        for phrase_id, row in enumerate(router['phrases']):
+            by_text.setdefault(row[P_TEXT], []).append(phrase_id)
+        alternation = '|'.join(re.escape(text) for text in sorted(by_text, key=len, reverse=True))
+        router['pattern'] = re.compile(rf'(?<!\S)(?:{alternation})(?!\S)') if by_text else None
+        router['by_text'] = by_text
+    return router
+
+
+def route(router, prompt, top=DEFAULT_TOP):
+    """
+    Rank skills for a prompt.
+
+    Returns [(skill, score, matched phrases)] best first; skills without any
+    phrase reaching MIN_COVERAGE are left out.
+    """
+    compile_router(router)
+    phrases = router['phrases']
+    text = normalize(prompt)
+    exact = set()
+    if router['pattern'] is not None:
+        for match in router['pattern'].finditer(text):
+            exact.update(router['by_text'][match.group(0)])
+
+    hits = {}
+    for word in content_words(text):
+        for phrase_id in router['postings'].get(word, ()):
+            hits[phrase_id] = hits.get(phrase_id, 0) + 1
+
+    scores = {}
+    matched = {}
+    for phrase_id in exact | hits.keys():
+        row = phrases[phrase_id]
+        if phrase_id in exact:
+            score = 1.0
+        else:
+            score = hits[phrase_id] / len(row[P_WORDS])
+            if score < MIN_COVERAGE:
+                continue
+        scores[row[P_SKILL]] = scores.get(row[P_SKILL], 0.0) + score
+        matched.setdefault(row[P_SKILL], []).append(row[P_TEXT])
+
+    ranked = sorted(scores, key=lambda skill: (-scores[skill], skill))
+    return [(skill, round(scores[skill], 3), matched[skill]) for skill in ranked[:top]]
+
+
+def refresh_router(skills_dir, router_file=ROUTER_FILE):
+    """Load the saved router, re-read changed SKILL.md files and save it if anything changed."""
+    previous = load_router(router_file)
+    router = build_router(skills_dir, previous)
+    if router is not previous:
+        save_router(router, router_file)
+    return router
+
+
+def main():
+    args = sys.argv[1:]
+    router_file = ROUTER_FILE
+    skills_dir = SKILLS_BASE_PATH
+    top = DEFAULT_TOP
+    positional = []
+    while args:
+        arg = args.pop(0)
+        if arg == '--index' and args:
+            router_file = Path(args.pop(0))
+        elif arg == '--skills-dir' and args:
+            skills_dir = Path(args.pop(0))
+        elif arg == '--top' and args:
+            top = int(args.pop(0))
+        else:
+            positional.append(arg)
+
+    if not positional or positional[0] not in ('route', 'build', 'list') or (
+            positional[0] == 'route' and len(positional) < 2):
+        print("Usage: skill_router.py route \"<prompt>\" [--top <n>] [--skills-dir <dir>] [--index <file>]")
+        print("       skill_router.py build [skills-dir] [--index <file>]")
+        print("       skill_router.py list [skill-name] [--index <file>]")
+        print("\nExamples:")
+        print("  skill_router.py route \"which seed applies here for multi-agent routing?\"")
+        print("  skill_router.py list seed-library")
+        sys.exit(1)
+
+    command = positional[0]
+    if command == 'build' and len(positional) > 1:
+        skills_dir = Path(positional[1])
+
+    if command in ('build', 'route'):
+        if not skills_dir.is_dir():
+            print(f"❌ Error: {skills_dir} is not a directory", file=sys.stderr)
+            sys.exit(1)
+        started = time.perf_counter()
+        router = refresh_router(skills_dir, router_file)
+        refresh_ms = (time.perf_counter() - started) * 1000
+    else:
+        router = load_router(router_file)
+        if router is None:
+            print(f"❌ No router at {router_file}. Run: skill_router.py build [skills-dir]", file=sys.stderr)
+            sys.exit(1)
+
+    if command == 'build':
+        print(f"✅ {len(router['phrases'])} trigger phrases from {len(router['skills'])} skills "
+              f"({router.get('reparsed', 0)} SKILL.md files re-read) in {refresh_ms:.1f} ms")
+        print(f"   Saved to: {router_file}")
+        return
+
+    if command == 'list':
+        skill_name = positional[1] if len(positional) > 1 else None
+        for skill, (_, _, phrases) in router['skills'].items():
+            if skill_name and skill != skill_name:
+                continue
+            print(f"{skill}:")
+            for phrase in phrases:
+                print(f"  - {phrase}")
+        return
+
+    prompt = ' '.join(positional[1:])
+    compile_router(router)
+    started = time.perf_counter()
+    results = route(router, prompt, top)
+    route_us = (time.perf_counter() - started) * 1e6
+    if not results:
+        print("No skill matched. Try rephrasing with the task's key nouns and verbs.")
+    for skill, score, phrases in results:
+        print(f"{score:>6.2f}  {skill}  ({'; '.join(phrases[:3])})")
+    print(f"\n⏱️  Routed in {route_us:.0f} µs (index refresh {refresh_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Skill token footprint profiler
+
+Estimates how many tokens each skill costs when its content is loaded into
+agent context, broken down by frontmatter, body sections and reference files,
+and flags skills whose SKILL.md exceeds a token budget.
+
+Usage:
+    token_profile.py [skills-dir] [--budget <tokens>] [--sections] [--json]
+                     [--history <file>] [--no-history]
+
+Examples:
+    token_profile.py
+    token_profile.py ./skills --budget 3000
+    token_profile.py ./skills --sections --no-history
+
+Skills are expected at /home/ubuntu/skills/<skill-name>/ unless a directory is given.
+Each run is appended to ~/.skill-token-history.json (last 50 runs) so growth
+can be compared between runs.
+"""
+
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+SKILLS_BASE_PATH = Path("/home/ubuntu/skills")
+HISTORY_FILE = Path.home() / ".skill-token-history.json"
+HISTORY_LIMIT = 50
+DEFAULT_BUDGET = 5000
+
+# Rough average for English prose and markdown with common BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+# Non-script files loaded on demand alongside SKILL.md
+REFERENCE_SUFFIXES = {'.md', '.txt'}
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+
+
+def estimate_tokens(text):
+    """Estimate the token count of a string."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def split_frontmatter(content):
+    """Split SKILL.md content into (frontmatter, body); frontmatter includes the --- fences."""
+    match = re.match(r'^---\n(.*?)\n---\n?', content, re.DOTALL)
+    if not match:
+        return '', content
+    return match.group(0), content[match.end():]
+
+
+def split_sections(body, max_level=2):
+    """
+    Split markdown into (heading, text) pairs at headings up to max_level.
+
+    Text before the first heading is returned under the heading '(preamble)'.
+    Headings inside fenced code blocks are ignored.
+    """
+    sections = []
+    heading = '(preamble)'
+    current = []
+    in_fence = False
+    for line in body.splitlines(keepends=True):
+        if line.lstrip().startswith(('```', '~~~')):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_RE.match(line.rstrip('\n'))
+        if match and len(match.group(1)) <= max_level:
+            if ''.join(current).strip():
+                sections.append((heading, ''.join(current)))
+            heading = match.group(2)
+            current = [line]
+        else:
+            current.append(line)
+    if ''.join(current).strip():
+        sections.append((heading, ''.join(current)))
+    return sections
+
+
+def find_reference_files(skill_dir):
+    """List non-script text resources bundled with a skill, excluding SKILL.md."""
+    files = []
+    for path in sorted(skill_dir.rglob('*')):
+        if not path.is_file() or path.name == 'SKILL.md':
+            continue
+        relative = path.relative_to(skill_dir)
+        if relative.parts[0] == 'scripts':
+            continue
+        if path.suffix in REFERENCE_SUFFIXES:
+            files.append(path)
+    return files
+
+
+def profile_skill(skill_dir):
+    """Compute token estimates for one skill directory."""
+    content = (skill_dir / 'SKILL.md').read_text(encoding='utf-8', errors='ignore')
+    frontmatter, body = split_frontmatter(content)
+
+    references = {}
+    for path in find_reference_files(skill_dir):
+        text = path.read_text(encoding='utf-8', errors='ignore')
+        references[str(path.relative_to(skill_dir))] = estimate_tokens(text)
+
+    frontmatter_tokens = estimate_tokens(frontmatter)
+    body_tokens = estimate_tokens(body)
+    skill_md_tokens = frontmatter_tokens + body_tokens
+    reference_tokens = sum(references.values())
+
+    return {
+        'name': skill_dir.name,
+        'bytes': len(content.encode('utf-8')),
+        'frontmatter': frontmatter_tokens,
+        'body': body_tokens,
+        'skill_md': skill_md_tokens,
+        'sections': [
+            {'heading': heading, 'tokens': estimate_tokens(text)}
+            for heading, text in split_sections(body)
+        ],
+        'references': references,
+        'reference_total': reference_tokens,
+        'total': skill_md_tokens + reference_tokens,
+    }
+
+
+def profile_skills(skills_dir, budget=DEFAULT_BUDGET):
+    """
+    Profile every skill under skills_dir.
+
+    Returns a report dict with per-skill results, totals and the names of
+    skills whose SKILL.md exceeds the budget.
+    """
+    skills = [
+        profile_skill(path)
+        for path in sorted(Path(skills_dir).iterdir())
+        if (path / 'SKILL.md').is_file()
+    ]
+    return {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'skills_dir': str(skills_dir),
+        'budget': budget,
+        'skills': skills,
+        'totals': {
+            'skill_md': sum(s['skill_md'] for s in skills),
+            'references': sum(s['reference_total'] for s in skills),
+            'total': sum(s['total'] for s in skills),
+        },
+        'over_budget': [s['name'] for s in skills if s['skill_md'] > budget],
+    }
+
+
+def load_history(history_file=HISTORY_FILE):
+    """Load previous profiler runs."""
+    if not history_file.exists():
+        return {'runs': []}
+    with open(history_file) as f:
+        return json.load(f)
+
+
+def record_history(report, history_file=HISTORY_FILE):
+    """
+    Append a compact copy of the report to the history file.
+
+    Returns the previous run for the same skills directory, or None.
+    """
+    history = load_history(history_file)
+    previous = None
+    for run in reversed(history['runs']):
+        if run['skills_dir'] == report['skills_dir']:
+            previous = run
+            break
+
+    history['runs'].append({
+        'generated': report['generated'],
+        'skills_dir': report['skills_dir'],
+        'totals': report['totals'],
+        'skills': {s['name']: s['skill_md'] for s in report['skills']},
+    })
+    history['runs'] = history['runs'][-HISTORY_LIMIT:]
+
+    with open(history_file, 'w') as f:
+        json.dump(history, f, indent=2)
+    return previous
+
+
+def format_delta(current, previous):
+    """Format a signed token delta, or an empty string when there is nothing to compare."""
+    if previous is None or current == previous:
+        return ''
+    return f" ({current - previous:+,})"
+
+
+def generate_text_report(report, previous=None, show_sections=False):
+    """Render the report as a plain-text table."""
+    previous_skills = previous['skills'] if previous else {}
+    lines = [
+        f"{'Skill':<40} {'SKILL.md':>9} {'front':>6} {'body':>7} {'refs':>7} {'total':>8}",
+        '-' * 82,
+    ]
+    for s in sorted(report['skills'], key=lambda s: s['skill_md'], reverse=True):
+        flag = ' ⚠️' if s['name'] in report['over_budget'] else ''
+        lines.append(
+            f"{s['name']:<40} {s['skill_md']:>9,} {s['frontmatter']:>6,} {s['body']:>7,} "
+            f"{s['reference_total']:>7,} {s['total']:>8,}{flag}"
+            f"{format_delta(s['skill_md'], previous_skills.get(s['name']))}"
+        )
+        if show_sections:
+            for section in s['sections']:
+                lines.append(f"    {section['heading'][:50]:<50} {section['tokens']:>7,}")
+            for name, tokens in s['references'].items():
+                lines.append(f"    [ref] {name[:44]:<44} {tokens:>7,}")
+
+    totals = report['totals']
+    previous_totals = previous['totals'] if previous else {}
+    lines.append('-' * 82)
+    lines.append(
+        f"SKILL.md total: {totals['skill_md']:,}{format_delta(totals['skill_md'], previous_totals.get('skill_md'))}"
+        f" | references: {totals['references']:,}"
+        f" | all: {totals['total']:,}{format_delta(totals['total'], previous_totals.get('total'))}"
+    )
+    return '\n'.join(lines)
+
+
+def main():
+    args = sys.argv[1:]
+    skills_dir = SKILLS_BASE_PATH
+    budget = DEFAULT_BUDGET
+    history_file = HISTORY_FILE
+    show_sections = False
+    as_json = False
+    use_history = True
+
+    while args:
+        arg = args.pop(0)
+        if arg == '--budget' and args:
+            budget = int(args.pop(0))
+        elif arg == '--history' and args:
+            history_file = Path(args.pop(0))
+        elif arg == '--no-history':
+            use_history = False
+        elif arg == '--sections':
+            show_sections = True
+        elif arg == '--json':
+            as_json = True
+        elif not arg.startswith('--'):
+            skills_dir = Path(arg)
+        else:
+            print("Usage: token_profile.py [skills-dir] [--budget <tokens>] [--sections] [--json]")
+            print("                        [--history <file>] [--no-history]")
+            sys.exit(1)
+
+    if not skills_dir.is_dir():
+        print(f"❌ Error: {skills_dir} is not a directory", file=sys.stderr)
+        sys.exit(1)
+
+    report = profile_skills(skills_dir.resolve(), budget)
+    previous = record_history(report, history_file) if use_history else None
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"📏 Token footprint for {len(report['skills'])} skills in {report['skills_dir']}")
+        print(f"   (~{CHARS_PER_TOKEN} chars/token, budget {budget:,} tokens per SKILL.md)\n")
+        print(generate_text_report(report, previous, show_sections))
+        if report['over_budget']:
+            print(f"\n⚠️  {len(report['over_budget'])} skill(s) over budget: {', '.join(report['over_budget'])}")
+        else:
+            print("\n✅ All skills within budget")
+
+    sys.exit(1 if report['over_budget'] else 0)
+
+
+if __name__ == "__main__":
+    main()
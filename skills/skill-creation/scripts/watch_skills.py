@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Watch the skills directory and re-validate skills as they are edited
+
+Validates every skill once, then waits for file changes and re-validates only
+the skills whose files changed, typically within 100 ms of saving. With
+--index, the section index (see section_index.py) and the trigger-phrase
+router (see skill_router.py) are rebuilt after each change; the rebuilds only
+re-read files whose size or mtime changed.
+
+Usage:
+    watch_skills.py [skills-dir] [--index] [--poll] [--debounce <ms>]
+
+Examples:
+    watch_skills.py ./skills
+    watch_skills.py ./skills --index --debounce 100
+
+Changes are detected with inotify where available, otherwise by polling
+mtimes (--poll forces polling). Stop with Ctrl+C.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from fswatch import DEBOUNCE_SECONDS, make_watcher, watch
+from quick_validate import validate_skill
+from section_index import INDEX_FILE, build_index, load_index, save_index
+from skill_router import refresh_router
+from token_profile import SKILLS_BASE_PATH
+
+
+def skill_names(skills_dir):
+    """Return the names of the directories in skills_dir that have a SKILL.md."""
+    return {d.name for d in skills_dir.iterdir() if (d / 'SKILL.md').is_file()}
+
+
+def affected_skills(skills_dir, paths):
+    """
+    Map changed paths to the names of the skill directories containing them.
+
+    The watcher reports skills_dir itself when events were dropped (inotify
+    queue overflow); then every skill is returned, since any of them may
+    have changed.
+    """
+    skills = set()
+    for path in paths:
+        try:
+            rel = Path(path).relative_to(skills_dir)
+        except ValueError:
+            continue
+        if not rel.parts:
+            return skill_names(skills_dir)
+        skills.add(rel.parts[0])
+    return skills
+
+
+def validate_skills(skills_dir, names):
+    """Validate the named skills; returns [(name, valid, message, elapsed_ms)]."""
+    results = []
+    for name in sorted(names):
+        skill_dir = skills_dir / name
+        if not skill_dir.is_dir():
+            results.append((name, None, "removed", 0.0))
+            continue
+        started = time.perf_counter()
+        valid, message = validate_skill(skill_dir)
+        results.append((name, valid, message, (time.perf_counter() - started) * 1000))
+    return results
+
+
+def print_results(results, quiet_valid=False):
+    """Print one line per validated skill."""
+    for name, valid, message, elapsed_ms in results:
+        if valid is None:
+            print(f"🗑️  {name}: {message}")
+        elif not valid:
+            print(f"❌ {name}: {message}")
+        elif not quiet_valid:
+            print(f"✅ {name} ({elapsed_ms:.1f} ms)")
+
+
+def update_index(skills_dir):
+    """Incrementally rebuild the section index and router; returns (sections, trigger phrases)."""
+    index = build_index(skills_dir, previous=load_index(INDEX_FILE))
+    save_index(index, INDEX_FILE)
+    router = refresh_router(skills_dir)
+    return len(index['sections']), len(router['phrases'])
+
+
+def main():
+    args = sys.argv[1:]
+    skills_dir = SKILLS_BASE_PATH
+    with_index = False
+    use_inotify = True
+    debounce = DEBOUNCE_SECONDS
+
+    while args:
+        arg = args.pop(0)
+        if arg == '--index':
+            with_index = True
+        elif arg == '--poll':
+            use_inotify = False
+        elif arg == '--debounce' and args:
+            debounce = int(args.pop(0)) / 1000
+        elif not arg.startswith('--'):
+            skills_dir = Path(arg)
+        else:
+            print("Usage: watch_skills.py [skills-dir] [--index] [--poll] [--debounce <ms>]")
+            sys.exit(1)
+
+    if not skills_dir.is_dir():
+        print(f"❌ Error: {skills_dir} is not a directory", file=sys.stderr)
+        sys.exit(1)
+    skills_dir = skills_dir.resolve()
+
+    results = validate_skills(skills_dir, skill_names(skills_dir))
+    invalid = sum(1 for r in results if r[1] is False)
+    print_results(results, quiet_valid=True)
+    print(f"🔍 Validated {len(results)} skills ({invalid} invalid)")
+    if with_index:
+        sections, phrases = update_index(skills_dir)
+        print(f"📑 Section index: {sections} sections, router: {phrases} trigger phrases")
+
+    watcher = make_watcher(skills_dir, use_inotify=use_inotify)
+    print(f"👀 Watching {skills_dir} ({watcher.kind}). Press Ctrl+C to stop.")
+
+    def on_change(paths):
+        started = time.perf_counter()
+        skills = affected_skills(skills_dir, paths)
+        print_results(validate_skills(skills_dir, skills))
+        if with_index:
+            update_index(skills_dir)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"   {len(paths)} changed paths, {len(skills)} skills re-checked in {elapsed:.1f} ms")
+        sys.stdout.flush()
+
+    watch(skills_dir, on_change, debounce=debounce, watcher=watcher)
+    print("\n👋 Stopped watching")
+
+
+if __name__ == "__main__":
+    main()
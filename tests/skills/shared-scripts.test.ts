@@ -0,0 +1,39 @@
+import { describe, it, expect } from "vitest";
+import { promises as fs } from "fs";
+import { join } from "path";
+import { fileURLToPath } from "url";
+
+// Python helpers copied into each skill's scripts/ directory, since skills
+// are installed independently. Every copy must stay byte-identical.
+const SHARED_SCRIPTS = ["profiling.py", "report_store.py", "fswatch.py"];
+const SKILLS_DIR = fileURLToPath(new URL("../../skills", import.meta.url));
+
+async function findCopies(name: string): Promise<string[]> {
+  const copies: string[] = [];
+  for (const skill of (await fs.readdir(SKILLS_DIR)).sort()) {
+    const path = join(SKILLS_DIR, skill, "scripts", name);
+    try {
+      await fs.access(path);
+      copies.push(path);
+    } catch {
+      // This skill does not use the helper
+    }
+  }
+  return copies;
+}
+
+describe("shared skill scripts", () => {
+  for (const name of SHARED_SCRIPTS) {
+    it(`keeps every copy of ${name} identical`, async () => {
+      const copies = await findCopies(name);
+      expect(copies.length).toBeGreaterThan(1);
+
+      const [first, ...rest] = copies;
+      const expected = await fs.readFile(first, "utf-8");
+      for (const copy of rest) {
+        const actual = await fs.readFile(copy, "utf-8");
+        expect(actual, `${copy} differs from ${first}`).toBe(expected);
+      }
+    });
+  }
+});